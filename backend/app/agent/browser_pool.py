@@ -0,0 +1,242 @@
+import asyncio
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+from urllib.parse import urlparse
+
+import httpx
+import psutil
+from browser_use.browser import BrowserProfile
+from browser_use.browser.watchdogs.local_browser_watchdog import LocalBrowserWatchdog
+from cdp_use import CDPClient
+
+from backend.app.core.config import settings
+
+
+@dataclass
+class PooledBrowser:
+    """A Chromium process owned by the pool, reachable over CDP."""
+    cdp_url: str
+    headless: bool
+    process: Optional[psutil.Process] = None
+    user_data_dir: Optional[str] = None
+    uses: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+
+    def memory_mb(self) -> float:
+        if not self.process:
+            return 0.0
+        try:
+            procs = [self.process] + self.process.children(recursive=True)
+            total = 0
+            for proc in procs:
+                try:
+                    total += proc.memory_info().rss
+                except psutil.NoSuchProcess:
+                    pass
+            return total / (1024 * 1024)
+        except psutil.NoSuchProcess:
+            return 0.0
+
+    def is_alive(self) -> bool:
+        if not self.process:
+            return True
+        try:
+            return self.process.is_running() and self.process.status() != psutil.STATUS_ZOMBIE
+        except psutil.NoSuchProcess:
+            return False
+
+
+class BrowserPool:
+    """
+    Keeps warm Chromium processes and leases one per run.
+
+    Runs connect to a leased browser through its CDP URL, so the expensive
+    process start happens ahead of time. A browser is only ever leased to one
+    run at a time; on release its tabs are closed and cookies/storage of the
+    visited origins cleared, which gives each run a clean context. Browsers
+    are recycled after `max_uses` runs or once they exceed `max_memory_mb`.
+    """
+
+    def __init__(self, size: int = 2, max_uses: int = 20, max_memory_mb: int = 1500):
+        self.size = size
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+        self._idle: List[PooledBrowser] = []
+        self._leased: List[PooledBrowser] = []
+        self._lock = asyncio.Lock()
+        self._refill_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.recycled = 0
+        self.launch_failures = 0
+
+    @property
+    def headless(self) -> bool:
+        # Read on every lease so /api/config changes apply to newly launched browsers
+        return getattr(settings.model, 'headless', False)
+
+    async def start(self):
+        """Pre-warm the pool in the background."""
+        self._closed = False
+        self._schedule_refill()
+
+    async def close(self):
+        self._closed = True
+        if self._refill_task:
+            self._refill_task.cancel()
+            await asyncio.gather(self._refill_task, return_exceptions=True)
+        browsers = self._idle + self._leased
+        self._idle, self._leased = [], []
+        await asyncio.gather(*(self._terminate(b) for b in browsers), return_exceptions=True)
+
+    async def acquire(self) -> PooledBrowser:
+        async with self._lock:
+            while self._idle:
+                browser = self._idle.pop()
+                if browser.headless == self.headless and browser.is_alive():
+                    self.hits += 1
+                    self._leased.append(browser)
+                    return browser
+                self.recycled += 1
+                asyncio.create_task(self._terminate(browser))
+
+        # Pool exhausted (or cold): launch a dedicated browser for this run
+        self.misses += 1
+        browser = await self._launch(self.headless)
+        self._leased.append(browser)
+        self._schedule_refill()
+        return browser
+
+    async def release(self, browser: PooledBrowser, discard: bool = False):
+        """Return a leased browser; `discard` recycles it, e.g. after a run was interrupted mid-action."""
+        if browser in self._leased:
+            self._leased.remove(browser)
+        browser.uses += 1
+
+        reusable = (
+            not discard
+            and not self._closed
+            and browser.is_alive()
+            and browser.uses < self.max_uses
+            and browser.memory_mb() < self.max_memory_mb
+            and browser.headless == self.headless
+        )
+        if reusable:
+            try:
+                async with asyncio.timeout(settings.timeouts.cleanup_seconds):
+                    await self._reset(browser)
+            except Exception as e:
+                print(f"Browser pool reset failed, recycling browser: {e}")
+                reusable = False
+
+        async with self._lock:
+            if reusable and len(self._idle) < self.size:
+                self._idle.append(browser)
+                return
+        self.recycled += 1
+        await self._terminate(browser)
+        self._schedule_refill()
+
+    def stats(self) -> dict:
+        leases = self.hits + self.misses
+        return {
+            "enabled": True,
+            "size": self.size,
+            "idle": len(self._idle),
+            "leased": len(self._leased),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / leases, 3) if leases else None,
+            "recycled": self.recycled,
+            "launch_failures": self.launch_failures,
+            "memory_mb": round(sum(b.memory_mb() for b in self._idle + self._leased), 1),
+        }
+
+    def _schedule_refill(self):
+        if self._closed or (self._refill_task and not self._refill_task.done()):
+            return
+        self._refill_task = asyncio.create_task(self._refill())
+
+    async def _refill(self):
+        while not self._closed and len(self._idle) < self.size:
+            try:
+                browser = await self._launch(self.headless)
+            except Exception as e:
+                self.launch_failures += 1
+                print(f"Browser pool failed to pre-warm a browser: {e}")
+                return
+            async with self._lock:
+                if self._closed or len(self._idle) >= self.size:
+                    asyncio.create_task(self._terminate(browser))
+                    return
+                self._idle.append(browser)
+
+    async def _launch(self, headless: bool) -> PooledBrowser:
+        # Mirror browser-use's own local launcher, but keep ownership of the process
+        user_data_dir = tempfile.mkdtemp(prefix="webuitester-pool-")
+        profile = BrowserProfile(headless=headless, user_data_dir=user_data_dir)
+        executable = profile.executable_path or LocalBrowserWatchdog._find_installed_browser_path()
+        if not executable:
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            raise RuntimeError("No local Chrome/Chromium install found (run `playwright install chromium`)")
+
+        port = LocalBrowserWatchdog._find_free_port()
+        args = profile.get_args() + [f"--remote-debugging-port={port}"]
+        proc = await asyncio.create_subprocess_exec(
+            executable,
+            *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        process = psutil.Process(proc.pid)
+        try:
+            cdp_url = await LocalBrowserWatchdog._wait_for_cdp_url(port)
+        except Exception:
+            await LocalBrowserWatchdog._cleanup_process(process)
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            raise
+        return PooledBrowser(cdp_url=cdp_url, headless=headless, process=process, user_data_dir=user_data_dir)
+
+    async def _reset(self, browser: PooledBrowser):
+        """Leave the browser with a single blank tab and no state from the previous run."""
+        async with httpx.AsyncClient(timeout=5.0) as http:
+            version = (await http.get(f"{browser.cdp_url.rstrip('/')}/json/version")).json()
+
+        async with CDPClient(version["webSocketDebuggerUrl"]) as cdp:
+            targets = (await cdp.send.Target.getTargets())["targetInfos"]
+            pages = [t for t in targets if t.get("type") == "page"]
+            origins = set()
+            for page in pages:
+                parsed = urlparse(page.get("url", ""))
+                if parsed.scheme in ("http", "https"):
+                    origins.add(f"{parsed.scheme}://{parsed.netloc}")
+
+            # Open the fresh tab first: closing the last tab would quit the browser
+            await cdp.send.Target.createTarget(params={"url": "about:blank"})
+            for page in pages:
+                await cdp.send.Target.closeTarget(params={"targetId": page["targetId"]})
+
+            await cdp.send.Storage.clearCookies()
+            for origin in origins:
+                await cdp.send.Storage.clearDataForOrigin(params={"origin": origin, "storageTypes": "all"})
+
+    async def _terminate(self, browser: PooledBrowser):
+        if browser.process:
+            await LocalBrowserWatchdog._cleanup_process(browser.process)
+        if browser.user_data_dir:
+            shutil.rmtree(browser.user_data_dir, ignore_errors=True)
+
+
+browser_pool: Optional[BrowserPool] = (
+    BrowserPool(
+        size=settings.browser_pool.size,
+        max_uses=settings.browser_pool.max_uses,
+        max_memory_mb=settings.browser_pool.max_memory_mb,
+    )
+    if settings.browser_pool.enabled
+    else None
+)
@@ -0,0 +1,134 @@
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from backend.app.core.config import settings
+from backend.app.models.test_case import TestCase
+
+
+@dataclass
+class Budget:
+    """Limits of one run; 0 means unlimited (except max_steps, which always applies)."""
+    max_steps: int
+    max_tokens: int
+    max_seconds: float
+    max_cost: float
+
+    @classmethod
+    def for_case(cls, case: TestCase) -> "Budget":
+        # Values set on the case override the global defaults from config.yaml
+        config = settings.budget
+        return cls(
+            max_steps=case.max_steps or config.max_steps,
+            max_tokens=case.max_tokens if case.max_tokens is not None else config.max_tokens,
+            max_seconds=case.max_seconds if case.max_seconds is not None else config.max_seconds,
+            max_cost=case.max_cost if case.max_cost is not None else config.max_cost,
+        )
+
+
+def step_fingerprint(history_item) -> Optional[str]:
+    """URL plus the actions chosen at a step; equal fingerprints mean the agent repeated itself."""
+    model_output = getattr(history_item, "model_output", None)
+    if not model_output:
+        return None
+    state = getattr(history_item, "state", None)
+    actions = [
+        action.model_dump(exclude_none=True) if hasattr(action, "model_dump") else str(action)
+        for action in getattr(model_output, "action", None) or []
+    ]
+    return json.dumps({"url": getattr(state, "url", None), "actions": actions}, sort_keys=True, default=str)
+
+
+class BudgetTracker:
+    """
+    Spend of a run against its Budget, updated after every agent step.
+
+    Besides the hard limits it watches for an agent that is stuck: the same
+    actions on the same page `loop_threshold` steps in a row, or
+    `no_progress_steps` steps in a row that leave the page unchanged
+    (same URL, perceptually identical screenshot).
+    """
+
+    def __init__(self, budget: Budget, loop_threshold: Optional[int] = None,
+                 no_progress_steps: Optional[int] = None):
+        config = settings.budget
+        self.budget = budget
+        self.loop_threshold = config.loop_threshold if loop_threshold is None else loop_threshold
+        self.no_progress_steps = config.no_progress_steps if no_progress_steps is None else no_progress_steps
+        self.input_cost = config.input_cost_per_million / 1_000_000
+        self.output_cost = config.output_cost_per_million / 1_000_000
+        self._start = time.monotonic()
+        self.steps = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self._last_fingerprint: Optional[str] = None
+        self.repeats = 0
+        self._last_url: Optional[str] = None
+        self.idle_steps = 0
+
+    @property
+    def tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    @property
+    def cost(self) -> float:
+        return self.input_tokens * self.input_cost + self.output_tokens * self.output_cost
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._start
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left of the wall-clock budget, None when unlimited."""
+        if not self.budget.max_seconds:
+            return None
+        return max(self.budget.max_seconds - self.elapsed, 0.0)
+
+    def record_step(self, input_tokens: int = 0, output_tokens: int = 0, fingerprint: Optional[str] = None,
+                    url: Optional[str] = None, page_changed: bool = True):
+        self.steps += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+
+        if fingerprint is not None and fingerprint == self._last_fingerprint:
+            self.repeats += 1
+        else:
+            self.repeats = 1 if fingerprint is not None else 0
+        self._last_fingerprint = fingerprint
+
+        if page_changed or url != self._last_url:
+            self.idle_steps = 0
+        else:
+            self.idle_steps += 1
+        self._last_url = url
+
+    def exceeded(self) -> Optional[str]:
+        """Why the run must stop now, or None to keep going."""
+        budget = self.budget
+        if self.steps >= budget.max_steps:
+            return f"step budget of {budget.max_steps} reached"
+        if budget.max_tokens and self.tokens >= budget.max_tokens:
+            return f"token budget of {budget.max_tokens} reached ({self.tokens} used)"
+        if budget.max_seconds and self.elapsed >= budget.max_seconds:
+            return f"time budget of {budget.max_seconds:g}s reached"
+        if budget.max_cost and self.cost >= budget.max_cost:
+            return f"cost budget of {budget.max_cost:g} reached ({self.cost:.4f} spent)"
+        if self.loop_threshold and self.repeats >= self.loop_threshold:
+            return f"agent repeated the same actions {self.repeats} times in a row"
+        if self.no_progress_steps and self.idle_steps >= self.no_progress_steps:
+            return f"no page change for {self.idle_steps} steps"
+        return None
+
+    def snapshot(self) -> dict:
+        return {
+            "steps": self.steps,
+            "tokens": self.tokens,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "seconds": round(self.elapsed, 1),
+            "cost": round(self.cost, 6),
+            "repeats": self.repeats,
+            "idle_steps": self.idle_steps,
+            "limits": asdict(self.budget),
+        }
@@ -0,0 +1,52 @@
+import asyncio
+from typing import Awaitable, Optional, TypeVar
+
+T = TypeVar("T")
+
+STOPPED = "stopped"
+TIMEOUT = "timeout"
+
+
+class Interrupted(Exception):
+    """Raised by run_interruptible when the work was abandoned."""
+
+    def __init__(self, reason: str, timeout: Optional[float] = None):
+        super().__init__(reason)
+        # STOPPED or TIMEOUT
+        self.reason = reason
+        self.timeout = timeout
+
+
+async def run_interruptible(awaitable: Awaitable[T], stop_event: Optional[asyncio.Event] = None,
+                            timeout: Optional[float] = None, cancel_grace: float = 5.0) -> T:
+    """
+    Await `awaitable` unless `stop_event` is set or `timeout` seconds pass first.
+
+    In that case the work is cancelled right away (not at the next step
+    boundary) and Interrupted is raised. Waiting for the cancellation to
+    unwind is bounded by `cancel_grace`, so a task stuck in a
+    non-cancellable call cannot hold the caller either.
+    """
+    task = asyncio.ensure_future(awaitable)
+    stop_waiter = asyncio.ensure_future(stop_event.wait()) if stop_event else None
+    waiters = {task, stop_waiter} if stop_waiter else {task}
+    try:
+        done, _ = await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    finally:
+        if stop_waiter:
+            stop_waiter.cancel()
+
+    if task in done:
+        return task.result()
+
+    task.cancel()
+    # Consume the outcome even if the task outlives the grace period
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    await asyncio.wait({task}, timeout=cancel_grace)
+    if task.done() and not task.cancelled() and task.exception() is None:
+        # Finished in the same iteration the stop arrived; keep the result
+        return task.result()
+    raise Interrupted(STOPPED if stop_waiter in done else TIMEOUT, timeout)
@@ -1,12 +1,21 @@
 import json
 import os
 import asyncio
-import base64
 from typing import Optional, Any, Callable, Awaitable
 from backend.app.models.test_case import TestCase
 from backend.app.core.config import settings
-from browser_use import Agent as BrowserUseAgent, ChatOpenAI
-from browser_use.browser import BrowserProfile
+from browser_use import Agent as BrowserUseAgent
+from browser_use.browser import BrowserProfile, BrowserSession
+from backend.app.agent.browser_pool import browser_pool
+from backend.app.agent.llm_registry import llm_registry
+from backend.app.agent.llm_cache import llm_cache, CachedChatModel
+from backend.app.agent.replay import replay_history, ReplayMismatch
+from backend.app.agent.screenshots import ScreenshotPipeline
+from backend.app.agent.budget import Budget, BudgetTracker, step_fingerprint
+from backend.app.agent.vision import VisionPolicy
+from backend.app.agent.cancellation import Interrupted, STOPPED, run_interruptible
+from backend.app.agent.timing import SCREENSHOT, instrument_agent, span, step_timer
+from backend.app.core.metrics import AGENT_STEPS, STEP_DURATION
 
 class Agent:
     def __init__(self):
@@ -18,11 +27,26 @@ class Agent:
         self.thinking = settings.model.thinking
         self._current_agent = None  # Hold reference to browser_use agent
         self._stop_event = asyncio.Event()
+        # History of the last run if the LLM agent completed it successfully (for replay)
+        self.recorded_history: Optional[dict] = None
+        self.screenshots = ScreenshotPipeline()
+        # One StepTimer per executed agent step
+        self.timings = []
+        # Why the run was cut short by its budget or a timeout, if it was
+        self.termination_reason: Optional[str] = None
+        # Set when the browser may be left mid-action or failed to stop; a pooled one is then not reused
+        self.browser_dirty = False
         
         if not self.api_key:
             self.api_key = os.environ.get("OPENAI_API_KEY")
 
-    async def execute_case(self, case: TestCase, log_callback: Optional[Callable[[dict], Awaitable[None]]] = None, stop_event: Optional[asyncio.Event] = None) -> bool:
+    async def execute_case(
+        self,
+        case: TestCase,
+        log_callback: Optional[Callable[[dict], Awaitable[None]]] = None,
+        stop_event: Optional[asyncio.Event] = None,
+        replay_trace: Optional[dict] = None,
+    ) -> bool:
         if not self.api_key:
             print("Error: OpenAI API Key not provided. Cannot execute.")
             return False
@@ -37,18 +61,29 @@ class Agent:
         
         await emit("log", f"Initializing Browser-Use Agent with task:\n{task_prompt}")
 
-        agent = self._initialize_agent(task_prompt, llm, browser_profile)
-        self._current_agent = agent
+        lease = await self._lease_browser(emit)
+        try:
+            browser_session = self._setup_browser_session(lease) if lease else None
+            vision = VisionPolicy.for_case(case)
+            agent = instrument_agent(
+                self._initialize_agent(task_prompt, llm, browser_profile, browser_session, vision.initial_setting())
+            )
+            self._current_agent = agent
 
-        return await self._run_agent_loop(agent, emit, stop_event)
+            return await self._run_agent_loop(agent, emit, stop_event, replay_trace, Budget.for_case(case), vision)
+        finally:
+            if lease:
+                await browser_pool.release(lease, discard=self.browser_dirty)
 
     def _setup_llm(self):
-        return ChatOpenAI(
+        # Shared per model config so HTTP connections are reused across steps and runs
+        llm = llm_registry.browser_use_llm(
             base_url=self.base_url,
             api_key=self.api_key,
             model=self.model,
             temperature=self.temperature,
         )
+        return CachedChatModel(llm, llm_cache)
 
     def _setup_browser(self):
         # Load config to check for headless setting
@@ -59,6 +94,24 @@ class Agent:
             headless=is_headless,
         )
 
+    async def _lease_browser(self, emit):
+        if not browser_pool:
+            return None
+        try:
+            return await browser_pool.acquire()
+        except Exception as e:
+            # Fall back to a browser owned by this run
+            await emit("log", f"Browser pool unavailable, launching a dedicated browser: {e}")
+            return None
+
+    def _setup_browser_session(self, lease):
+        # keep_alive: stopping the session only disconnects, the pool owns the process
+        return BrowserSession(
+            cdp_url=lease.cdp_url,
+            headless=lease.headless,
+            keep_alive=True,
+        )
+
     async def _construct_task_prompt(self, case: TestCase) -> str:
         await case.fetch_related("steps")
         steps = sorted(case.steps, key=lambda x: x.order)
@@ -72,48 +125,116 @@ class Agent:
         task_prompt += "\nIMPORTANT: Provide a detailed summary of actions and verifications."
         return task_prompt
 
-    def _initialize_agent(self, task_prompt, llm, browser_profile):
+    def _initialize_agent(self, task_prompt, llm, browser_profile, browser_session=None, use_vision="auto"):
+        if browser_session:
+            return BrowserUseAgent(
+                task=task_prompt,
+                llm=llm,
+                browser_session=browser_session,
+                use_vision=use_vision
+            )
         return BrowserUseAgent(
             task=task_prompt,
             llm=llm,
             browser_profile=browser_profile,
-            use_vision="auto"
+            use_vision=use_vision
         )
 
-    async def _run_agent_loop(self, agent, emit, stop_event) -> bool:
+    async def _replay(self, agent, replay_trace, emit, stop_event) -> bool:
+        await emit("log", "Replaying recorded actions without the LLM...")
+        try:
+            if await replay_history(agent, replay_trace, emit, stop_event):
+                await emit("log", "Replay completed successfully.")
+                return True
+            await emit("log", "Replay did not complete the task.")
+        except ReplayMismatch as e:
+            await emit("log", f"Replay diverged from the recording: {e}")
+        if not (stop_event and stop_event.is_set()):
+            await emit("log", "Falling back to the LLM agent...")
+        return False
+
+    async def _run_agent_loop(
+        self, agent, emit, stop_event, replay_trace, budget: Budget, vision: VisionPolicy
+    ) -> bool:
         try:
             print("DEBUG: Agent execution starting...")
             await emit("log", "Agent execution started...")
             
+            # Wall-clock budget covers browser startup and replay too
+            tracker = BudgetTracker(budget)
+
             # Start the browser session to initialize watchdogs
             if agent.browser_session:
                 print("DEBUG: Starting browser session...")
-                await agent.browser_session.start()
+                await self._interruptible(agent.browser_session.start(), stop_event, tracker)
                 print("DEBUG: Browser session started.")
+
+            if replay_trace and await self._interruptible(
+                self._replay(agent, replay_trace, emit, stop_event), stop_event, tracker, per_step=False
+            ):
+                return True
             
-            max_steps = 30
             step_count = 0
             
-            while step_count < max_steps:
+            while True:
                 print(f"DEBUG: Starting step {step_count + 1}")
                 if stop_event and stop_event.is_set():
                     await emit("log", "Stop requested by user. Terminating agent...")
                     break
                 
                 step_count += 1
+                duplicates = self.screenshots.duplicates
+                use_vision = vision.decide(agent.history.history)
+                agent.settings.use_vision = use_vision
                 
-                print("DEBUG: Calling agent.step()...")
-                await agent.step()
-                print("DEBUG: agent.step() returned.")
-                
-                if await self._process_step_data(agent, emit):
+                # Screenshot handling and the emitted events are part of the step's time
+                with step_timer(step_count) as timer:
+                    timer.vision = use_vision if isinstance(use_vision, bool) else None
+                    self.timings.append(timer)
+                    # Raced against stop requests and the step/run timeouts instead of checked between steps
+                    await self._interruptible(agent.step(), stop_event, tracker)
+                    done = await self._process_step_data(agent, emit)
+                AGENT_STEPS.inc()
+                STEP_DURATION.observe(timer.duration_ms / 1000)
+
+                if done:
+                    if agent.history.is_successful():
+                        self.recorded_history = agent.history.model_dump()
                     return True
+
+                last_step = agent.history.history[-1] if agent.history and agent.history.history else None
+                tracker.record_step(
+                    input_tokens=timer.input_tokens,
+                    output_tokens=timer.output_tokens,
+                    fingerprint=step_fingerprint(last_step),
+                    url=getattr(getattr(last_step, "state", None), "url", None),
+                    # The screenshot pipeline drops frames identical to the previous one
+                    page_changed=self.screenshots.duplicates == duplicates,
+                )
+                await emit("budget", tracker.snapshot())
+                reason = tracker.exceeded()
+                if reason:
+                    self.termination_reason = f"Budget exceeded: {reason}"
+                    await emit("log", f"{self.termination_reason}. Terminating agent...")
+                    break
             
-            await emit("log", "Agent execution finished (Max steps reached or stopped).")
+            await emit("log", "Agent execution finished (budget reached or stopped).")
             # If we reached here without returning True from _process_step_data (which checks for 'done' action),
             # it means the agent didn't explicitly complete the task successfully.
             return False
 
+        except Interrupted as e:
+            self.browser_dirty = True
+            if e.reason == STOPPED:
+                await emit("log", "Stop requested by user. Cancelled the current step.")
+            else:
+                remaining = tracker.remaining()
+                if remaining is not None and remaining < 1.0:
+                    self.termination_reason = f"Run timed out after {budget.max_seconds:g}s"
+                else:
+                    self.termination_reason = f"Step timed out after {e.timeout:g}s"
+                await emit("log", f"{self.termination_reason}. Terminating agent...")
+            return False
         except asyncio.CancelledError:
             print("DEBUG: Agent execution CancelledError caught.")
             await emit("log", "Agent execution cancelled.")
@@ -127,12 +248,31 @@ class Agent:
         finally:
             print("DEBUG: Agent execution finally block.")
             if agent.browser_session:
-                try:
-                    print("DEBUG: Stopping browser session...")
-                    await agent.browser_session.stop()
-                    print("DEBUG: Browser session stopped.")
-                except Exception as e:
-                    print(f"Error stopping browser session: {e}")
+                await self._stop_browser_session(agent.browser_session)
+
+    async def _interruptible(self, awaitable, stop_event, tracker: BudgetTracker, per_step: bool = True):
+        """Await under the step timeout (if `per_step`) and whatever is left of the run's wall clock."""
+        timeout = settings.timeouts.step_seconds if per_step else None
+        remaining = tracker.remaining()
+        if remaining is not None:
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return await run_interruptible(awaitable, stop_event, timeout, settings.timeouts.cleanup_seconds)
+
+    async def _stop_browser_session(self, browser_session):
+        # Bounded so a wedged browser cannot keep the worker slot; kill it if a clean stop fails
+        timeout = settings.timeouts.cleanup_seconds
+        try:
+            print("DEBUG: Stopping browser session...")
+            await asyncio.wait_for(browser_session.stop(), timeout)
+            print("DEBUG: Browser session stopped.")
+            return
+        except Exception as e:
+            print(f"Error stopping browser session: {e!r}")
+        self.browser_dirty = True
+        try:
+            await asyncio.wait_for(browser_session.kill(), timeout)
+        except Exception as e:
+            print(f"Error killing browser session: {e!r}")
 
     async def _process_step_data(self, agent, emit) -> bool:
         # Extract and emit info from history
@@ -145,20 +285,22 @@ class Agent:
 
     async def _extract_screenshot(self, last_step, emit):
         try:
-            screenshot = None
+            frame = None
             if hasattr(last_step, 'state') and last_step.state:
                 # Check for direct screenshot
                 if hasattr(last_step.state, 'screenshot') and last_step.state.screenshot:
-                    screenshot = last_step.state.screenshot
+                    with span(SCREENSHOT):
+                        frame = await self.screenshots.process(screenshot_b64=last_step.state.screenshot)
                 # Check for screenshot_path
                 elif hasattr(last_step.state, 'screenshot_path') and last_step.state.screenshot_path:
                     screenshot_path = last_step.state.screenshot_path
                     if os.path.exists(screenshot_path):
-                        with open(screenshot_path, "rb") as image_file:
-                            screenshot = base64.b64encode(image_file.read()).decode('utf-8')
+                        with span(SCREENSHOT):
+                            frame = await self.screenshots.process(path=screenshot_path)
             
-            if screenshot:
-                await emit("screenshot", screenshot)
+            # None also when the page looks the same as in the previous frame
+            if frame:
+                await emit("screenshot", frame)
         except Exception as e:
             print(f"Error extracting screenshot: {e}")
             import traceback
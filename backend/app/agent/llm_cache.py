@@ -0,0 +1,288 @@
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from browser_use.llm.views import ChatInvokeCompletion
+from pydantic import BaseModel
+
+from backend.app.agent.timing import LLM, current_step, span
+from backend.app.core.config import settings
+from backend.app.core.metrics import LLM_LATENCY, LLM_REQUESTS
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
+
+_BROWSER_STATE = re.compile(r"<browser_state>.*?</browser_state>", re.S)
+# Parts of the prompt that change between otherwise identical requests
+_VOLATILE = [
+    (re.compile(r"Today:\s*\d{4}-\d{2}-\d{2}"), "Today:"),
+    (re.compile(r"\b(Tab|Current tab:) [0-9A-Fa-f]{4}\b"), r"\1"),
+]
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(text: str) -> str:
+    for pattern, replacement in _VOLATILE:
+        text = pattern.sub(replacement, text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class LLMCache:
+    """
+    On-disk cache of LLM completions (SQLite file).
+
+    Keys are built from the model name, temperature, the normalized prompt and
+    a hash of the page state the prompt describes, so an unchanged case run
+    against an unchanged page gets the previous answer without a model call.
+    Entries expire after `ttl_seconds`; beyond `max_entries` / `max_bytes` the
+    least recently used ones are evicted.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float = 7 * 24 * 3600, max_entries: int = 5000,
+                 max_bytes: int = 200 * 1024 * 1024, max_temperature: float = 0.0):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_temperature = max_temperature
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def accepts(self, temperature: Optional[float]) -> bool:
+        # Sampling at higher temperatures is meant to vary, don't pin an answer
+        return (temperature or 0.0) <= self.max_temperature
+
+    @staticmethod
+    def make_key(
+        model: str, temperature: Optional[float], prompt: str, page_state: str = "", namespace: str = ""
+    ) -> str:
+        payload = {
+            "namespace": namespace,
+            "model": model,
+            "temperature": temperature,
+            "prompt": hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest(),
+            "page_state": hashlib.sha256(normalize_prompt(page_state).encode("utf-8")).hexdigest(),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)")
+        return self._conn
+
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            now = time.time()
+            if now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self.evictions += 1
+                return None
+            conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return json.loads(value)
+
+    def _put(self, key: str, value: Any):
+        data = json.dumps(value)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, data, size, now, now),
+            )
+            self.stores += 1
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        expired = conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,)).rowcount
+        self.evictions += max(expired, 0)
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        # Walk from the least recently used entry until both limits hold again
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM llm_cache ORDER BY accessed_at"):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            total -= size
+        conn.executemany("DELETE FROM llm_cache WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            value = await asyncio.to_thread(self._get, key)
+        except Exception as e:
+            print(f"LLM Cache Error: {e}")
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def put(self, key: str, value: Any):
+        try:
+            await asyncio.to_thread(self._put, key, value)
+        except Exception as e:
+            print(f"LLM Cache Error: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._connection().execute("DELETE FROM llm_cache")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, total = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "enabled": True,
+            "path": str(self.path),
+            "entries": count,
+            "size_bytes": total,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+class CachedChatModel:
+    """
+    browser-use chat model wrapper answering from an LLMCache when possible.
+
+    One is created per run around the shared client from llm_registry, which
+    also keeps browser-use's per-agent token tracking (it patches `ainvoke` of
+    the instance it is given) off the shared client. Cache hits report no
+    usage since no tokens were spent. Calls are timed as the `llm` span of
+    the current step.
+    """
+
+    def __init__(self, llm, cache: Optional[LLMCache] = None):
+        self._llm = llm
+        self._cache = cache if cache and cache.accepts(getattr(llm, "temperature", None)) else None
+        self.model = llm.model
+
+    def __getattr__(self, name):
+        return getattr(self._llm, name)
+
+    @property
+    def provider(self) -> str:
+        return self._llm.provider
+
+    @property
+    def name(self) -> str:
+        return self._llm.name
+
+    @property
+    def model_name(self) -> str:
+        return self.model
+
+    def _key(self, messages, output_format) -> str:
+        text = "\n".join(f"{message.role}: {message.text}" for message in messages)
+        page_state = "\n".join(_BROWSER_STATE.findall(text))
+        prompt = _BROWSER_STATE.sub("<browser_state/>", text)
+        namespace = output_format.__name__ if output_format else "text"
+        return self._cache.make_key(self.model, getattr(self._llm, "temperature", None), prompt, page_state, namespace)
+
+    async def ainvoke(self, messages, output_format=None, **kwargs):
+        with span(LLM):
+            response = await self._ainvoke(messages, output_format, **kwargs)
+        timer = current_step()
+        if timer:
+            timer.add_usage(response.usage)
+        return response
+
+    async def _call(self, messages, output_format, **kwargs):
+        try:
+            with LLM_LATENCY.time():
+                response = await self._llm.ainvoke(messages, output_format, **kwargs)
+        except Exception:
+            LLM_REQUESTS.inc(outcome="error")
+            raise
+        LLM_REQUESTS.inc(outcome="ok")
+        return response
+
+    async def _ainvoke(self, messages, output_format=None, **kwargs):
+        if not self._cache:
+            return await self._call(messages, output_format, **kwargs)
+
+        key = self._key(messages, output_format)
+        cached = await self._cache.get(key)
+        if cached is not None:
+            try:
+                completion = cached["completion"]
+                if output_format is not None:
+                    completion = output_format.model_validate(completion)
+                LLM_REQUESTS.inc(outcome="cached")
+                return ChatInvokeCompletion(
+                    completion=completion,
+                    thinking=cached.get("thinking"),
+                    usage=None,
+                    stop_reason=cached.get("stop_reason"),
+                )
+            except Exception as e:
+                # Schema changed since the entry was written; treat as a miss
+                print(f"LLM Cache Error: {e}")
+
+        response = await self._call(messages, output_format, **kwargs)
+        completion = response.completion
+        await self._cache.put(key, {
+            "completion": completion.model_dump(mode="json") if isinstance(completion, BaseModel) else completion,
+            "thinking": response.thinking,
+            "stop_reason": response.stop_reason,
+        })
+        return response
+
+
+def build_llm_cache() -> Optional[LLMCache]:
+    config = settings.llm_cache
+    if not config.enabled:
+        return None
+    path = Path(config.path)
+    return LLMCache(
+        path=path if path.is_absolute() else BASE_DIR / path,
+        ttl_seconds=config.ttl_seconds,
+        max_entries=config.max_entries,
+        max_bytes=config.max_size_mb * 1024 * 1024,
+        max_temperature=config.max_temperature,
+    )
+
+
+llm_cache = build_llm_cache()
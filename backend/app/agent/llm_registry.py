@@ -0,0 +1,175 @@
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from browser_use import ChatOpenAI as BrowserUseChatOpenAI
+from langchain_openai import ChatOpenAI as LangchainChatOpenAI
+
+from backend.app.core.config import settings
+
+# (base_url, api_key, model, temperature)
+ModelKey = Tuple[str, str, str, float]
+
+
+@dataclass
+class _Entry:
+    http_client: httpx.AsyncClient
+    created_at: float = field(default_factory=time.time)
+    clients: Dict[str, Any] = field(default_factory=dict)
+    requests: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+
+
+class LLMClientRegistry:
+    """
+    Process-wide cache of LLM clients keyed by model config.
+
+    Clients built for the same (base_url, api_key, model, temperature) share
+    one keep-alive httpx pool, so consecutive LLM calls of a run, concurrent
+    runs and step generation all reuse warm TLS connections. Entries are
+    dropped when /api/config changes; their pools are closed after a grace
+    period so calls of runs already in flight can finish.
+    """
+
+    def __init__(self, max_connections: int = 20, max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 60.0, retire_grace: float = 900.0):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.retire_grace = retire_grace
+        self._entries: Dict[ModelKey, _Entry] = {}
+        self._retired: List[httpx.AsyncClient] = []
+        self.builds = 0
+        self.reuses = 0
+
+    def _entry(self, key: ModelKey) -> _Entry:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _Entry(http_client=None)
+
+            async def on_request(request: httpx.Request):
+                request.extensions["webuitester_start"] = time.monotonic()
+
+            async def on_response(response: httpx.Response):
+                entry.requests += 1
+                if response.status_code >= 400:
+                    entry.errors += 1
+                started = response.request.extensions.get("webuitester_start")
+                if started:
+                    entry.total_latency += time.monotonic() - started
+
+            entry.http_client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=httpx.Timeout(120.0, connect=10.0),
+                event_hooks={"request": [on_request], "response": [on_response]},
+            )
+            self._entries[key] = entry
+        return entry
+
+    def _client(self, kind: str, key: ModelKey, factory):
+        entry = self._entry(key)
+        client = entry.clients.get(kind)
+        if client is None:
+            client = factory(entry.http_client)
+            entry.clients[kind] = client
+            self.builds += 1
+        else:
+            self.reuses += 1
+        return client
+
+    def browser_use_llm(self, base_url: str, api_key: str, model: str, temperature: float):
+        """ChatOpenAI used by the browser-use agent."""
+        key = (base_url, api_key, model, temperature)
+        return self._client("browser_use", key, lambda http: BrowserUseChatOpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            model=model,
+            temperature=temperature,
+            http_client=http,
+        ))
+
+    def langchain_llm(self, base_url: str, api_key: str, model: str, temperature: float):
+        """langchain ChatOpenAI used for step generation."""
+        key = (base_url, api_key, model, temperature)
+        return self._client("langchain", key, lambda http: LangchainChatOpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            model=model,
+            temperature=temperature,
+            http_async_client=http,
+        ))
+
+    def invalidate(self):
+        """Forget every client; called when the model config changes."""
+        entries, self._entries = self._entries, {}
+        for entry in entries.values():
+            self._retire(entry.http_client)
+
+    def _retire(self, http_client: httpx.AsyncClient):
+        self._retired.append(http_client)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.call_later(self.retire_grace, lambda: loop.create_task(self._close_retired(http_client)))
+
+    async def _close_retired(self, http_client: httpx.AsyncClient):
+        if http_client in self._retired:
+            self._retired.remove(http_client)
+            await http_client.aclose()
+
+    async def close(self):
+        for entry in self._entries.values():
+            await entry.http_client.aclose()
+        for http_client in self._retired:
+            await http_client.aclose()
+        self._entries = {}
+        self._retired = []
+
+    @staticmethod
+    def _open_connections(http_client: httpx.AsyncClient) -> Optional[int]:
+        # httpx does not expose pool state publicly; best effort through httpcore
+        pool = getattr(getattr(http_client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        return len(connections) if connections is not None else None
+
+    def stats(self) -> dict:
+        models = []
+        for (base_url, api_key, model, temperature), entry in self._entries.items():
+            models.append({
+                "model": model,
+                "base_url": base_url,
+                "temperature": temperature,
+                # Never expose the key itself
+                "api_key_hash": hashlib.sha256((api_key or "").encode()).hexdigest()[:8],
+                "clients": sorted(entry.clients),
+                "requests": entry.requests,
+                "errors": entry.errors,
+                "avg_latency_ms": round(entry.total_latency / entry.requests * 1000, 1) if entry.requests else None,
+                "open_connections": self._open_connections(entry.http_client),
+                "created_at": entry.created_at,
+            })
+        return {
+            "builds": self.builds,
+            "reuses": self.reuses,
+            "retired_pools": len(self._retired),
+            "limits": {
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry,
+            },
+            "models": models,
+        }
+
+
+llm_registry = LLMClientRegistry(
+    max_connections=settings.llm_pool.max_connections,
+    max_keepalive_connections=settings.llm_pool.max_keepalive_connections,
+    keepalive_expiry=settings.llm_pool.keepalive_expiry,
+)
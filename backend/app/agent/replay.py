@@ -0,0 +1,101 @@
+import copy
+import hashlib
+import json
+from typing import Optional
+from uuid import UUID
+
+from browser_use.agent.views import AgentHistoryList
+
+from backend.app.core.config import settings
+from backend.app.models.action_trace import ActionTrace
+from backend.app.models.test_case import TestCase
+
+
+class ReplayMismatch(Exception):
+    """Raised when a recorded step can no longer be executed against the page."""
+
+
+def case_fingerprint(case: TestCase) -> str:
+    """Hash of everything that defines what a case does; steps must be fetched."""
+    steps = sorted(case.steps, key=lambda x: x.order)
+    payload = {
+        "url": case.url,
+        "steps": [[step.order, step.instruction, step.expected_result] for step in steps],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def count_actions(history: dict) -> int:
+    return sum(
+        len((item.get("model_output") or {}).get("action") or [])
+        for item in history.get("history", [])
+    )
+
+
+async def latest_trace(case: TestCase) -> Optional[ActionTrace]:
+    """Newest trace recorded for the case as it is defined now."""
+    await case.fetch_related("steps")
+    return (
+        await ActionTrace.filter(case_id=case.id, fingerprint=case_fingerprint(case))
+        .order_by("-created_at")
+        .first()
+    )
+
+
+async def save_trace(case: TestCase, run_id: Optional[UUID], history: dict) -> ActionTrace:
+    await case.fetch_related("steps")
+    trace = await ActionTrace.create(
+        case=case,
+        run_id=run_id,
+        fingerprint=case_fingerprint(case),
+        history=history,
+        action_count=count_actions(history),
+    )
+    stale = await (
+        ActionTrace.filter(case_id=case.id)
+        .order_by("-created_at")
+        .offset(settings.replay.max_traces_per_case)
+        .values_list("id", flat=True)
+    )
+    if stale:
+        await ActionTrace.filter(id__in=list(stale)).delete()
+    return trace
+
+
+async def replay_history(agent, history_data: dict, emit, stop_event=None) -> bool:
+    """
+    Re-execute a recorded history on the agent's (started) browser session.
+
+    Each recorded element is re-located with browser-use's matching (hash,
+    xpath, accessible name, attributes) instead of asking the LLM. Raises
+    ReplayMismatch as soon as a step cannot be matched or fails.
+    """
+    history = AgentHistoryList.load_from_dict(copy.deepcopy(history_data), agent.AgentOutput)
+
+    for index, item in enumerate(history.history, start=1):
+        if stop_event and stop_event.is_set():
+            return False
+
+        model_output = item.model_output
+        if not model_output or not model_output.action or model_output.action == [None]:
+            continue
+        # Steps that failed while recording were recovered from by later steps; don't repeat them
+        if item.result and any(result.error for result in item.result):
+            continue
+
+        try:
+            results = await agent._execute_history_step(item, settings.replay.step_delay)
+        except Exception as e:
+            raise ReplayMismatch(f"Step {index}: {e}") from e
+
+        for action in model_output.action:
+            await emit("log", f"[REPLAY] {action.model_dump(exclude_none=True)}")
+
+        for result in results:
+            if result.error:
+                raise ReplayMismatch(f"Step {index}: {result.error}")
+            if result.is_done:
+                await emit("log", f"✅ FINAL RESULT: {result.extracted_content}")
+                return bool(result.success)
+
+    return False
@@ -0,0 +1,87 @@
+import asyncio
+import base64
+import io
+from typing import Optional
+
+from PIL import Image
+
+from backend.app.core.artifacts import artifact_store, sniff_content_type
+from backend.app.core.config import settings
+
+
+def dhash(image: Image.Image, size: int = 8) -> int:
+    """Difference hash: one bit per horizontal brightness gradient of a size x size grid."""
+    gray = image.convert("L").resize((size + 1, size), Image.Resampling.BILINEAR)
+    pixels = gray.tobytes()
+    bits = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            bits = (bits << 1) | (left > right)
+    return bits
+
+
+class ScreenshotPipeline:
+    """
+    Turns the agent's per-step screenshots into live-view events.
+
+    Frames perceptually identical to the previous one (dHash distance within
+    `dedupe_threshold`) are dropped. Others are written at full resolution
+    to the artifact store, whose content hash is the frame's ID, and emitted
+    as a downscaled JPEG thumbnail. Image work and file reads run in a
+    thread, off the event loop.
+    """
+
+    def __init__(self, thumbnail_width: Optional[int] = None, jpeg_quality: Optional[int] = None,
+                 dedupe_threshold: Optional[int] = None):
+        config = settings.screenshots
+        self.thumbnail_width = thumbnail_width or config.thumbnail_width
+        self.jpeg_quality = jpeg_quality or config.jpeg_quality
+        self.dedupe_threshold = config.dedupe_threshold if dedupe_threshold is None else dedupe_threshold
+        self._last_hash: Optional[int] = None
+        self.emitted = 0
+        self.duplicates = 0
+
+    def _process(self, png: bytes) -> Optional[dict]:
+        image = Image.open(io.BytesIO(png))
+        image.load()
+        frame_hash = dhash(image)
+        if (self.dedupe_threshold >= 0 and self._last_hash is not None
+                and bin(frame_hash ^ self._last_hash).count("1") <= self.dedupe_threshold):
+            self.duplicates += 1
+            return None
+        self._last_hash = frame_hash
+
+        # Full resolution goes to the artifact store; its content hash is the screenshot ID
+        screenshot_id = artifact_store.write(png)
+
+        thumbnail = image.convert("RGB")
+        if thumbnail.width > self.thumbnail_width:
+            height = round(thumbnail.height * self.thumbnail_width / thumbnail.width)
+            thumbnail = thumbnail.resize((self.thumbnail_width, height), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        thumbnail.save(buffer, format="JPEG", quality=self.jpeg_quality, optimize=True)
+
+        self.emitted += 1
+        return {
+            "id": screenshot_id,
+            "width": image.width,
+            "height": image.height,
+            "content_type": sniff_content_type(png[:12]),
+            "size": len(png),
+            "thumbnail": base64.b64encode(buffer.getvalue()).decode("ascii"),
+        }
+
+    async def process(self, screenshot_b64: Optional[str] = None, path: Optional[str] = None) -> Optional[dict]:
+        """Event data for a new frame, or None if it repeats the previous one."""
+        def load() -> bytes:
+            if screenshot_b64:
+                return base64.b64decode(screenshot_b64)
+            with open(path, "rb") as f:
+                return f.read()
+
+        def run():
+            return self._process(load())
+
+        return await asyncio.to_thread(run)
@@ -0,0 +1,210 @@
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from tortoise import timezone
+
+from backend.app.core.db_writer import db_writer
+from backend.app.core.metrics import timed_write
+from backend.app.models.step_timing import StepTiming
+
+# Timer of the agent step running in the current task, if any
+_current: ContextVar[Optional["StepTimer"]] = ContextVar("step_timer", default=None)
+
+# Span names, in the order a step goes through them
+BROWSER_STATE = "browser_state"
+LLM = "llm"
+ACTIONS = "actions"
+SCREENSHOT = "screenshot"
+PERSIST = "persist"
+BROADCAST = "broadcast"
+
+
+class StepTimer:
+    """
+    Spans recorded during one `agent.step()` and the processing that follows.
+
+    Span offsets are relative to the start of the step, so steps can be
+    laid out as a waterfall. Token counts come from the LLM responses.
+    """
+
+    def __init__(self, step: int):
+        self.step = step
+        self.started_at = timezone.now()
+        self._start = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+        self.spans: List[dict] = []
+        self.llm_calls = 0
+        # Whether the screenshot was sent to the LLM; None when browser-use decided ("auto")
+        self.vision: Optional[bool] = None
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._start) * 1000
+
+    @contextmanager
+    def span(self, name: str):
+        start = self._elapsed_ms()
+        try:
+            yield
+        finally:
+            duration = self._elapsed_ms() - start
+            self.spans.append({"name": name, "start_ms": round(start, 3), "duration_ms": round(duration, 3)})
+
+    def add_usage(self, usage):
+        self.llm_calls += 1
+        if usage is not None:
+            self.input_tokens += usage.prompt_tokens or 0
+            self.output_tokens += usage.completion_tokens or 0
+
+    def finish(self):
+        self.duration_ms = round(self._elapsed_ms(), 3)
+
+
+@contextmanager
+def step_timer(step: int):
+    """Make a StepTimer current for the duration of a step."""
+    timer = StepTimer(step)
+    token = _current.set(timer)
+    try:
+        yield timer
+    finally:
+        timer.finish()
+        _current.reset(token)
+
+
+def current_step() -> Optional[StepTimer]:
+    return _current.get()
+
+
+@contextmanager
+def span(name: str):
+    """Time a block as part of the current step; a no-op outside of steps."""
+    timer = _current.get()
+    if timer is None:
+        yield
+        return
+    with timer.span(name):
+        yield
+
+
+def instrument_agent(agent):
+    """
+    Time the browser side of a browser-use agent's steps: collecting the
+    page state (DOM and screenshot) and executing the chosen actions.
+    """
+    for attr, name in (("_prepare_context", BROWSER_STATE), ("multi_act", ACTIONS)):
+        method = getattr(agent, attr, None)
+        if method is None:
+            continue
+
+        def wrap(method, name):
+            @functools.wraps(method)
+            async def timed(*args, **kwargs):
+                with span(name):
+                    return await method(*args, **kwargs)
+            return timed
+
+        setattr(agent, attr, wrap(method, name))
+    return agent
+
+
+async def save_timings(run_id, timers: List[StepTimer]):
+    finished = [timer for timer in timers if timer.duration_ms is not None]
+    if not finished:
+        return
+    with timed_write("step_timings"):
+        await db_writer.bulk_create(StepTiming, [
+            StepTiming(
+                run_id=run_id,
+                step=timer.step,
+                started_at=timer.started_at,
+                duration_ms=timer.duration_ms,
+                llm_calls=timer.llm_calls,
+                input_tokens=timer.input_tokens,
+                output_tokens=timer.output_tokens,
+                spans=timer.spans,
+                vision=timer.vision,
+            )
+            for timer in finished
+        ])
+
+
+def _input_tokens_per_call(rows) -> float:
+    return sum(row.input_tokens / row.llm_calls for row in rows) / len(rows)
+
+
+def vision_savings(rows, image_tokens: int) -> dict:
+    """
+    Screenshot usage of a run and the prompt tokens it saved compared to
+    sending the screenshot at every step. The cost of one screenshot is
+    measured from the run (mean input tokens per LLM call with and without
+    it) when it has both kinds of steps, otherwise `image_tokens` is used.
+    """
+    with_image = [row for row in rows if row.vision is True and row.llm_calls and row.input_tokens]
+    without_image = [row for row in rows if row.vision is False and row.llm_calls and row.input_tokens]
+    measured = None
+    if with_image and without_image:
+        measured = round(_input_tokens_per_call(with_image) - _input_tokens_per_call(without_image))
+    per_image = measured if measured and measured > 0 else image_tokens
+    text_steps = [row for row in rows if row.vision is False]
+    return {
+        "steps_with_screenshot": sum(1 for row in rows if row.vision is True),
+        "steps_without_screenshot": len(text_steps),
+        "steps_auto": sum(1 for row in rows if row.vision is None),
+        "image_tokens_per_call": per_image,
+        "measured": bool(measured and measured > 0),
+        "estimated_tokens_saved": per_image * sum(max(row.llm_calls, 1) for row in text_steps),
+    }
+
+
+def waterfall(rows, image_tokens: int = 0) -> dict:
+    """
+    Per-step breakdown of a run's StepTiming rows plus totals per span name.
+
+    `other` is step time not covered by any span (browser-use bookkeeping,
+    our own callbacks outside persistence and broadcast).
+    """
+    steps = []
+    totals = {}
+    origin = rows[0].started_at if rows else None
+    for row in rows:
+        step_totals = {}
+        for item in row.spans:
+            step_totals[item["name"]] = step_totals.get(item["name"], 0.0) + item["duration_ms"]
+        step_totals["other"] = max(row.duration_ms - sum(step_totals.values()), 0.0)
+        for name, ms in step_totals.items():
+            totals[name] = totals.get(name, 0.0) + ms
+        steps.append({
+            "step": row.step,
+            "started_at": row.started_at,
+            "offset_ms": round((row.started_at - origin).total_seconds() * 1000, 3),
+            "duration_ms": row.duration_ms,
+            "llm_calls": row.llm_calls,
+            "input_tokens": row.input_tokens,
+            "output_tokens": row.output_tokens,
+            "vision": row.vision,
+            "totals": {name: round(ms, 3) for name, ms in step_totals.items()},
+            "spans": row.spans,
+        })
+
+    total_ms = sum(row.duration_ms for row in rows)
+    slowest = max(rows, key=lambda row: row.duration_ms) if rows else None
+    return {
+        "steps": steps,
+        "summary": {
+            "steps": len(rows),
+            "total_ms": round(total_ms, 3),
+            "mean_step_ms": round(total_ms / len(rows), 3) if rows else 0.0,
+            "slowest_step": slowest.step if slowest else None,
+            "llm_calls": sum(row.llm_calls for row in rows),
+            "input_tokens": sum(row.input_tokens for row in rows),
+            "output_tokens": sum(row.output_tokens for row in rows),
+            "totals": {name: round(ms, 3) for name, ms in totals.items()},
+            "shares": {name: round(ms / total_ms, 4) if total_ms else 0.0 for name, ms in totals.items()},
+            "vision": vision_savings(rows, image_tokens),
+        },
+    }
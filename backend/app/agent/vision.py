@@ -0,0 +1,76 @@
+import re
+from typing import List, Optional, Union
+
+from backend.app.core.config import settings
+
+# The task prompt numbers test steps "Step N:"; the agent usually refers to them the same way
+_STEP_REFERENCE = re.compile(r"\bstep\s*(\d+)", re.I)
+_VERIFICATION = re.compile(
+    r"\b(verif\w*|check\w*|confirm\w*|assert\w*|ensur\w*|expect\w*|validat\w*)\b|验证|检查|确认|断言", re.I
+)
+
+
+class VisionPolicy:
+    """
+    Decides before every agent step whether the LLM gets the screenshot.
+
+    Policies: never (DOM text only), verification (when the agent's next
+    goal is checking an expected result), on_failure (after an action
+    failed), always, and auto (browser-use decides, the agent requests
+    screenshots through a tool).
+
+    The case policy applies unless the test step the agent is working on
+    (the highest "Step N" referenced in its latest goal and memory) has
+    its own. Decisions are counted so a run can report what it saved.
+    """
+
+    def __init__(self, policy: str, steps: Optional[List] = None):
+        self.policy = policy
+        self.steps = {step.order: step for step in steps or []}
+        self.current_step: Optional[int] = None
+        self.vision_steps = 0
+        self.text_steps = 0
+
+    @classmethod
+    def for_case(cls, case) -> "VisionPolicy":
+        # Expects case.steps to be fetched
+        return cls(case.vision_policy or settings.vision.policy, list(case.steps))
+
+    def initial_setting(self) -> Union[bool, str]:
+        """`use_vision` for the browser-use Agent constructor."""
+        if self.policy == "auto":
+            return "auto"
+        # Per-step policies may still enable it later; False also drops browser-use's screenshot tool
+        return self.policy == "always"
+
+    def _follow_agent(self, model_output):
+        text = " ".join(filter(None, [getattr(model_output, "next_goal", None), getattr(model_output, "memory", None)]))
+        referenced = [int(n) for n in _STEP_REFERENCE.findall(text) if int(n) in self.steps]
+        if referenced:
+            self.current_step = max(referenced)
+        return text
+
+    def decide(self, history: List) -> Union[bool, str]:
+        last = history[-1] if history else None
+        model_output = getattr(last, "model_output", None)
+        goal = self._follow_agent(model_output) if model_output else ""
+
+        step = self.steps.get(self.current_step)
+        policy = (step and step.vision_policy) or self.policy
+        if policy == "auto":
+            return "auto"
+        if policy == "always":
+            use_vision = True
+        elif policy == "on_failure":
+            use_vision = any(getattr(result, "error", None) for result in getattr(last, "result", None) or [])
+        elif policy == "verification":
+            # The agent announces checks of expected results in its next goal
+            use_vision = bool(_VERIFICATION.search(goal))
+        else:
+            use_vision = False
+
+        if use_vision:
+            self.vision_steps += 1
+        else:
+            self.text_steps += 1
+        return use_vision
@@ -0,0 +1,32 @@
+import re
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import FileResponse
+
+from backend.app.api.endpoints.test_cases import etag_matches
+from backend.app.core.artifacts import artifact_store
+from backend.app.models.artifact import Artifact
+
+router = APIRouter()
+
+ARTIFACT_HASH = re.compile(r"^[0-9a-f]{64}$")
+# Content never changes under a given hash
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+@router.get("/{artifact_hash}")
+async def get_artifact(artifact_hash: str, request: Request):
+    if not ARTIFACT_HASH.match(artifact_hash):
+        raise HTTPException(status_code=404, detail="Artifact not found")
+    artifact = await Artifact.get_or_none(hash=artifact_hash)
+    path = artifact_store.path(artifact_hash)
+    if not artifact or not path.exists():
+        raise HTTPException(status_code=404, detail="Artifact not found")
+
+    etag = f'"{artifact_hash}"'
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    return FileResponse(
+        path,
+        media_type=artifact.content_type,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
@@ -3,6 +3,7 @@ from pydantic import BaseModel
 import yaml
 from pathlib import Path
 from backend.app.core.config import Config, load_config
+from backend.app.agent.llm_registry import llm_registry
 
 router = APIRouter()
 
@@ -68,6 +69,9 @@ async def update_config(config_in: ConfigUpdate):
         settings.model.temperature = config_in.temperature
         settings.model.thinking = config_in.thinking
         settings.model.headless = config_in.headless
+
+        # Clients are keyed by model config; drop the stale ones and their connection pools
+        llm_registry.invalidate()
         
         return {"status": "success", "config": existing_data["model"]}
         
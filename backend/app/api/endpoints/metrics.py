@@ -0,0 +1,28 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.app.api.endpoints.runs import active_runs
+from backend.app.core.metrics import ACTIVE_RUNS, QUEUE_LENGTH, WS_CONNECTIONS, WS_QUEUED, registry
+from backend.app.core.scheduler import scheduler
+from backend.app.core.socket_manager import manager
+
+router = APIRouter()
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+@registry.collector
+async def collect_runs():
+    ACTIVE_RUNS.set(len(active_runs))
+    # The queue lives in the database and is shared by every process
+    QUEUE_LENGTH.set(await scheduler.pending_count())
+
+@registry.collector
+async def collect_websockets():
+    stats = manager.stats()
+    WS_CONNECTIONS.set(stats["connections"])
+    WS_QUEUED.set(stats["queued"])
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    return PlainTextResponse(await registry.render(), media_type=CONTENT_TYPE)
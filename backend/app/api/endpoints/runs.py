@@ -1,14 +1,42 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect
-from typing import List, Dict
+from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket, WebSocketDisconnect, Query
+from fastapi.responses import StreamingResponse
+from typing import List, Dict, Optional, Union
 from uuid import UUID
+from datetime import datetime
 import json
 import asyncio
+import hmac
+import time
+from tortoise import timezone
+from tortoise.queryset import QuerySet
 
 from backend.app.models.test_run import TestRun
 from backend.app.models.test_case import TestCase
-from backend.app.schemas.test_run import TestRunCreate, TestRunRead
+from backend.app.schemas.test_run import (
+    TestRunCreate,
+    TestRunRead,
+    TestRunSummary,
+    PublishedEvent,
+    RunEventRead,
+    RunEventPage,
+    RunArtifactRead,
+    RunTimings,
+    RunPage,
+)
 from backend.app.agent.core import Agent
+from backend.app.agent.replay import latest_trace, save_trace
+from backend.app.agent.timing import BROADCAST, PERSIST, save_timings, span, waterfall
+from backend.app.core.config import settings
 from backend.app.core.socket_manager import manager
+from backend.app.core.event_bus import event_bus, CONTROL_CHANNEL, WORKER_TOKEN_HEADER
+from backend.app.core.scheduler import scheduler, QueueFullError
+from backend.app.core.suite_runs import refresh_suite_run
+from backend.app.core.run_events import RunEventWriter, load_run_logs, fetch_events, iter_events
+from backend.app.core.artifacts import attach_artifact
+from backend.app.core.metrics import RUNS_STARTED, RUNS_FINISHED, RUN_DURATION, timed_write
+from backend.app.core.pagination import InvalidCursor, keyset_page
+from backend.app.models.artifact import RunArtifact
+from backend.app.models.step_timing import StepTiming
 
 router = APIRouter()
 
@@ -16,67 +44,209 @@ router = APIRouter()
 # run_id -> {"stop_event": asyncio.Event, "task": asyncio.Task}
 active_runs: Dict[str, dict] = {}
 
+def lease_guard(run: TestRun) -> QuerySet:
+    """
+    The run, for as long as this execution holds the lease claim_next gave it.
+
+    A worker that stalls past its lease gets its run requeued and possibly
+    claimed again (even by this process, with a higher attempt count), so
+    its writes must not overwrite the status of the newer execution.
+    """
+    return TestRun.filter(id=run.id, lease_owner=run.lease_owner, attempts=run.attempts)
+
+def abandon_run(run_id: UUID):
+    """Lease-lost handler of the scheduler: stop executing a run that is no longer ours."""
+    control = active_runs.get(str(run_id))
+    if control:
+        control["stop_event"].set()
+
 async def run_agent_task(run_id: UUID, case_id: UUID):
     stop_event = asyncio.Event()
     active_runs[str(run_id)] = {"stop_event": stop_event}
+    suite_run_id = None
+    events = RunEventWriter(run_id)
+    agent = None
+    started = time.perf_counter()
+    status = "FAILED"
+    guard = None
+    RUNS_STARTED.inc()
+
+    async def log_callback(event: dict):
+        try:
+            # Buffered append to run_events, which gives the event its seq
+            with span(PERSIST):
+                stamped = await events.append(event)
+            # Broadcast to WS
+            with span(BROADCAST):
+                await manager.broadcast(str(run_id), stamped)
+            if event["type"] == "screenshot" and isinstance(event["data"], dict):
+                frame = event["data"]
+                with span(PERSIST):
+                    await attach_artifact(
+                        run_id, frame["id"], "screenshot", frame.get("content_type"), frame.get("size")
+                    )
+        except Exception as e:
+            print(f"Log Callback Error: {e}")
     
     try:
         run = await TestRun.get(id=run_id)
         case = await TestCase.get(id=case_id)
+        suite_run_id = run.suite_run_id
+        guard = lease_guard(run)
         
         run.status = "RUNNING"
-        await run.save()
+        with timed_write("test_runs"):
+            await guard.update(status="RUNNING")
         
-        await manager.broadcast(str(run_id), {"type": "status", "data": "RUNNING"})
+        await log_callback({"type": "status", "data": "RUNNING"})
+        if suite_run_id:
+            await refresh_suite_run(suite_run_id)
         
         agent = Agent()
-        
-        async def log_callback(event: dict):
+
+        trace = None
+        if run.mode == "replay":
+            trace = await latest_trace(case)
+            if not trace:
+                await log_callback(
+                    {"type": "log", "data": "No recorded trace for the current case steps, running the LLM agent."}
+                )
+
+        success = await agent.execute_case(
+            case, log_callback, stop_event=stop_event, replay_trace=trace.history if trace else None
+        )
+
+        if success and agent.recorded_history:
             try:
-                # Broadcast to WS
-                await manager.broadcast(str(run_id), event)
-                
-                # Append to DB logs (simple append, maybe inefficient for huge logs but fine for V1)
-                if event["type"] == "log":
-                    run.logs.append(event)
-                    await run.save(update_fields=["logs"])
+                await save_trace(case, run.id, agent.recorded_history)
             except Exception as e:
-                print(f"Log Callback Error: {e}")
-
-        success = await agent.execute_case(case, log_callback, stop_event=stop_event)
+                print(f"Trace Recording Error: {e}")
         
         if stop_event.is_set():
             run.status = "STOPPED"
         else:
             run.status = "PASSED" if success else "FAILED"
-            
-        await run.save()
-        await manager.broadcast(str(run_id), {"type": "status", "data": run.status})
-        
+        if agent.termination_reason:
+            run.result_summary = agent.termination_reason
+        run.finished_at = timezone.now()
+
+        with timed_write("test_runs"):
+            finished = await guard.update(
+                status=run.status, result_summary=run.result_summary, finished_at=run.finished_at
+            )
+        status = run.status
+        if finished:
+            await log_callback({"type": "status", "data": run.status})
+        else:
+            print(f"Run {run_id} lost its lease while executing, {run.status} result discarded")
+
     except Exception as e:
         print(f"Background Task Error: {e}")
-        run = await TestRun.get(id=run_id)
-        run.status = "FAILED"
-        run.result_summary = str(e)
-        await run.save()
-        await manager.broadcast(str(run_id), {"type": "error", "data": str(e)})
+        if guard is None:
+            guard = lease_guard(await TestRun.get(id=run_id))
+        finished = await guard.update(status="FAILED", result_summary=str(e), finished_at=timezone.now())
+        if finished:
+            await log_callback({"type": "error", "data": str(e)})
     finally:
         # Cleanup
+        RUNS_FINISHED.inc(status=status)
+        RUN_DURATION.observe(time.perf_counter() - started, status=status)
+        if agent and agent.timings:
+            try:
+                await save_timings(run_id, agent.timings)
+            except Exception as e:
+                print(f"Timing Recording Error: {e}")
+        await events.close()
         if str(run_id) in active_runs:
             del active_runs[str(run_id)]
+        if suite_run_id:
+            try:
+                await refresh_suite_run(suite_run_id)
+            except Exception as e:
+                print(f"Suite Progress Error: {e}")
+
+async def signal_stop(run_id: str) -> bool:
+    """Stop a run executing in this process, or ask the other processes over the event bus."""
+    control = active_runs.get(run_id)
+    if control:
+        control["stop_event"].set()
+        return True
+    if event_bus.shared:
+        await event_bus.publish(CONTROL_CHANNEL, {"type": "stop", "run_id": run_id})
+        return True
+    return False
+
+async def mark_stopped(run_id: UUID, status: str) -> bool:
+    """Move a run from `status` to STOPPED unless it changed meanwhile, and publish its status event."""
+    updated = await TestRun.filter(id=run_id, status=status).update(status="STOPPED", finished_at=timezone.now())
+    if updated:
+        events = RunEventWriter(run_id)
+        stopped = await events.append({"type": "status", "data": "STOPPED"})
+        await events.close()
+        await manager.broadcast(str(run_id), stopped)
+    return bool(updated)
+
+async def build_run_read(run: TestRun, include_logs: bool = False) -> TestRunSummary:
+    if include_logs:
+        data = TestRunRead.model_validate(run)
+        # Runs not yet moved by migrate_legacy_logs still carry their log inline
+        data.logs = list(run.logs) + await load_run_logs(run.id)
+    else:
+        data = TestRunSummary.model_validate(run)
+    position = await scheduler.queue_position(run)
+    if position is not None:
+        data.queue_position = position
+        data.eta_seconds = scheduler.estimate_wait(position - 1, await scheduler.running_remaining())
+    return data
+
+# Columns of a run listing; never the legacy `logs` JSON
+SUMMARY_FIELDS = (
+    "id", "case_id", "status", "mode", "result_summary", "attempts", "created_at", "started_at", "finished_at"
+)
+
+async def run_page(query: QuerySet, cursor: Optional[str], limit: int) -> RunPage:
+    """Keyset-paginated run summaries, newest first. Queue positions are left out of listings."""
+    try:
+        rows, next_cursor = await keyset_page(query, SUMMARY_FIELDS, limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return RunPage(items=[TestRunSummary(**row) for row in rows], next_cursor=next_cursor)
+
+@router.get("/", response_model=RunPage)
+async def list_runs(
+    status: Optional[str] = None,
+    since: Optional[datetime] = Query(None, description="Only runs created at or after this time"),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+):
+    query = TestRun.all()
+    if status:
+        query = query.filter(status=status.upper())
+    if since:
+        query = query.filter(created_at__gte=since)
+    return await run_page(query, cursor, limit)
 
 @router.post("/", response_model=TestRunRead)
-async def create_run(run_in: TestRunCreate, background_tasks: BackgroundTasks):
+async def create_run(run_in: TestRunCreate):
     case = await TestCase.get_or_none(id=run_in.case_id)
     if not case:
         raise HTTPException(status_code=404, detail="Test case not found")
+
+    try:
+        await scheduler.admit()
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(int(e.retry_after) + 1)},
+        )
         
-    run = await TestRun.create(case=case, status="PENDING")
+    run = await TestRun.create(case=case, status="PENDING", mode=run_in.mode)
     
-    # Start execution in background
-    background_tasks.add_task(run_agent_task, run.id, case.id)
+    # Queue for execution; a scheduler worker will pick it up
+    scheduler.notify()
     
-    return run
+    return await build_run_read(run, include_logs=True)
 
 @router.post("/{run_id}/stop")
 async def stop_run(run_id: UUID):
@@ -90,36 +260,115 @@ async def stop_run(run_id: UUID):
     if not run:
          raise HTTPException(status_code=404, detail="Test run not found")
     
+    if run.status == "PENDING":
+        # Still queued: the scheduler only claims PENDING runs, so this dequeues it
+        if await mark_stopped(run_id, "PENDING"):
+            if run.suite_run_id:
+                await refresh_suite_run(run.suite_run_id)
+            return {"message": "Run removed from queue"}
+        return {"message": "Run has already started, retry stop"}
+
     if run.status == "RUNNING":
-        # It might be running but we lost track (e.g. restart)? 
-        # Or it's a zombie state. Just mark it stopped.
-        run.status = "STOPPED"
-        await run.save()
-        return {"message": "Run marked as stopped"}
+        # Another process may be executing it; otherwise its worker is gone and the lease
+        # reaper would requeue it. Either way, mark it stopped so it is neither retried nor resumed.
+        # Conditional, so a result the executor wrote since we read the run is kept
+        if not await mark_stopped(run_id, "RUNNING"):
+            return {"message": "Run is not running"}
+        if run.suite_run_id:
+            await refresh_suite_run(run.suite_run_id)
+        signalled = await signal_stop(run_id_str)
+        return {"message": "Stop signal sent" if signalled else "Run marked as stopped"}
         
     return {"message": "Run is not running"}
 
-@router.get("/{run_id}", response_model=TestRunRead)
-async def get_run(run_id: UUID):
+LOOPBACK_HOSTS = {"127.0.0.1", "::1", "localhost"}
+
+def authorize_worker(request: Request):
+    """Only worker processes may inject events: they must present scheduler.worker_token, or be local without one."""
+    token = settings.scheduler.worker_token
+    if token:
+        if not hmac.compare_digest(request.headers.get(WORKER_TOKEN_HEADER, ""), token):
+            raise HTTPException(status_code=403, detail="Invalid worker token")
+    elif not request.client or request.client.host not in LOOPBACK_HOSTS:
+        raise HTTPException(status_code=403, detail="Event forwarding is only accepted from localhost")
+
+@router.post("/events/publish", dependencies=[Depends(authorize_worker)])
+async def publish_events(events: List[PublishedEvent]):
+    # Ingest point for `backend.worker` processes, which cannot reach our WebSockets directly
+    for event in events:
+        await manager.broadcast(event.channel, event.message)
+    return {"published": len(events)}
+
+@router.get("/{run_id}", response_model=Union[TestRunRead, TestRunSummary])
+async def get_run(run_id: UUID, include_logs: bool = False):
+    # Logs are paged through /{run_id}/events; inlining them is opt-in
     run = await TestRun.get_or_none(id=run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Test run not found")
-    return run
+    return await build_run_read(run, include_logs=include_logs)
+
+def to_event_read(event) -> RunEventRead:
+    return RunEventRead(seq=event.seq, type=event.type, data=event.payload.get("data"), created_at=event.created_at)
+
+@router.get("/{run_id}/events", response_model=RunEventPage)
+async def get_run_events(run_id: UUID, after: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=1000)):
+    if not await TestRun.exists(id=run_id):
+        raise HTTPException(status_code=404, detail="Test run not found")
+    events = await fetch_events(run_id, after, limit)
+    return RunEventPage(
+        items=[to_event_read(event) for event in events],
+        next_after=events[-1].seq if len(events) == limit else None,
+    )
+
+@router.get("/{run_id}/artifacts", response_model=List[RunArtifactRead])
+async def get_run_artifacts(run_id: UUID):
+    if not await TestRun.exists(id=run_id):
+        raise HTTPException(status_code=404, detail="Test run not found")
+    references = await RunArtifact.filter(run_id=run_id).order_by("created_at").prefetch_related("artifact")
+    return [
+        RunArtifactRead(
+            hash=ref.artifact.hash,
+            kind=ref.kind,
+            content_type=ref.artifact.content_type,
+            size=ref.artifact.size,
+            created_at=ref.created_at,
+        )
+        for ref in references
+    ]
+
+@router.get("/{run_id}/timings", response_model=RunTimings)
+async def get_run_timings(run_id: UUID):
+    if not await TestRun.exists(id=run_id):
+        raise HTTPException(status_code=404, detail="Test run not found")
+    rows = await StepTiming.filter(run_id=run_id).order_by("step")
+    return RunTimings(run_id=run_id, **waterfall(rows, settings.vision.image_tokens))
+
+@router.get("/{run_id}/events/export")
+async def export_run_events(run_id: UUID, after: int = Query(0, ge=0)):
+    if not await TestRun.exists(id=run_id):
+        raise HTTPException(status_code=404, detail="Test run not found")
+
+    async def lines():
+        async for event in iter_events(run_id, after):
+            yield to_event_read(event).model_dump_json() + "\n"
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="run-{run_id}.ndjson"'},
+    )
 
 @router.websocket("/ws/{run_id}")
-async def websocket_endpoint(websocket: WebSocket, run_id: str):
-    await manager.connect(run_id, websocket)
+async def websocket_endpoint(websocket: WebSocket, run_id: str, since: Optional[int] = None):
+    # Reconnecting clients pass the last seq they saw and get only the gap, from memory
+    await manager.connect(run_id, websocket, since=since)
     try:
         # Send current status immediately upon connection
         # This fixes the race condition where frontend connects after RUNNING status broadcast
         run = await TestRun.get_or_none(id=UUID(run_id))
         if run:
-            await websocket.send_json({"type": "status", "data": run.status})
-            
-            # Optionally send existing logs if client reconnects (simple version)
-            # if run.logs:
-            #     for log in run.logs:
-            #         await websocket.send_json(log)
+            # Current state, not an event: no seq, so clients apply it without counting it
+            manager.send_personal(run_id, websocket, {"type": "status", "data": run.status})
 
         while True:
             # Keep connection alive, maybe handle client messages if needed
@@ -0,0 +1,40 @@
+from fastapi import APIRouter
+
+from backend.app.agent.browser_pool import browser_pool
+from backend.app.agent.llm_cache import llm_cache
+from backend.app.agent.llm_registry import llm_registry
+from backend.app.core.event_bus import event_bus
+from backend.app.core.socket_manager import manager
+
+router = APIRouter()
+
+@router.get("/browser-pool")
+async def get_browser_pool_stats():
+    # Stats are per process: in external worker mode each worker owns its own pool
+    if not browser_pool:
+        return {"enabled": False}
+    return browser_pool.stats()
+
+@router.get("/llm")
+async def get_llm_stats():
+    return llm_registry.stats()
+
+@router.get("/llm-cache")
+async def get_llm_cache_stats():
+    if not llm_cache:
+        return {"enabled": False}
+    return llm_cache.stats()
+
+@router.delete("/llm-cache")
+async def clear_llm_cache():
+    if llm_cache:
+        llm_cache.clear()
+    return {"message": "LLM cache cleared"}
+
+@router.get("/websockets")
+async def get_websocket_stats():
+    return manager.stats()
+
+@router.get("/event-bus")
+async def get_event_bus_stats():
+    return event_bus.stats()
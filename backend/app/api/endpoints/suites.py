@@ -0,0 +1,168 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+
+from backend.app.api.endpoints.runs import mark_stopped, signal_stop
+from backend.app.core.config import settings
+from backend.app.core.scheduler import QueueFullError, scheduler
+from backend.app.core.socket_manager import manager
+from backend.app.core.suite_runs import refresh_suite_run, suite_channel, suite_progress
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+from backend.app.models.test_suite import SuiteRun, TestSuite
+from backend.app.schemas.test_suite import (
+    SuiteRunCreate,
+    SuiteRunRead,
+    TestSuiteCreate,
+    TestSuiteRead,
+    TestSuiteUpdate,
+)
+
+router = APIRouter()
+
+async def build_suite_read(suite: TestSuite) -> TestSuiteRead:
+    case_ids = await suite.cases.all().values_list("id", flat=True)
+    return TestSuiteRead(
+        id=suite.id,
+        name=suite.name,
+        description=suite.description,
+        created_at=suite.created_at,
+        case_ids=list(case_ids),
+    )
+
+async def build_suite_run_read(suite_run: SuiteRun) -> SuiteRunRead:
+    await suite_run.fetch_related("runs")
+    return SuiteRunRead.model_validate(suite_run)
+
+async def resolve_cases(case_ids: List[UUID]) -> List[TestCase]:
+    cases = await TestCase.filter(id__in=case_ids)
+    missing = set(case_ids) - {case.id for case in cases}
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Test cases not found: {sorted(str(m) for m in missing)}")
+    return cases
+
+async def get_suite_or_404(suite_id: UUID) -> TestSuite:
+    suite = await TestSuite.get_or_none(id=suite_id)
+    if not suite:
+        raise HTTPException(status_code=404, detail="Test suite not found")
+    return suite
+
+@router.get("/suites", response_model=List[TestSuiteRead])
+async def get_test_suites():
+    return [await build_suite_read(suite) for suite in await TestSuite.all()]
+
+@router.post("/suites", response_model=TestSuiteRead)
+async def create_test_suite(suite_in: TestSuiteCreate):
+    cases = await resolve_cases(suite_in.case_ids)
+    async with in_transaction():
+        suite = await TestSuite.create(name=suite_in.name, description=suite_in.description)
+        if cases:
+            await suite.cases.add(*cases)
+    return await build_suite_read(suite)
+
+@router.get("/suites/{suite_id}", response_model=TestSuiteRead)
+async def get_test_suite(suite_id: UUID):
+    return await build_suite_read(await get_suite_or_404(suite_id))
+
+@router.put("/suites/{suite_id}", response_model=TestSuiteRead)
+async def update_test_suite(suite_id: UUID, suite_in: TestSuiteUpdate):
+    suite = await get_suite_or_404(suite_id)
+    cases = await resolve_cases(suite_in.case_ids)
+    async with in_transaction():
+        suite.name = suite_in.name
+        suite.description = suite_in.description
+        await suite.save()
+        # Replace membership, same strategy as test case steps
+        await suite.cases.clear()
+        if cases:
+            await suite.cases.add(*cases)
+    return await build_suite_read(suite)
+
+@router.delete("/suites/{suite_id}", status_code=204)
+async def delete_test_suite(suite_id: UUID):
+    suite = await get_suite_or_404(suite_id)
+    await suite.delete()
+    return
+
+@router.post("/suites/{suite_id}/runs", response_model=SuiteRunRead)
+async def create_suite_run(suite_id: UUID, run_in: Optional[SuiteRunCreate] = None):
+    suite = await get_suite_or_404(suite_id)
+    cases = await suite.cases.all().order_by("created_at")
+    if not cases:
+        raise HTTPException(status_code=400, detail="Test suite has no cases")
+
+    try:
+        await scheduler.admit(len(cases))
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(int(e.retry_after) + 1)},
+        )
+
+    concurrency = (run_in and run_in.concurrency) or settings.scheduler.default_suite_concurrency
+    mode = run_in.mode if run_in else "agent"
+    async with in_transaction():
+        suite_run = await SuiteRun.create(suite=suite, concurrency=concurrency, total=len(cases))
+        for case in cases:
+            await TestRun.create(case=case, suite_run=suite_run, status="PENDING", mode=mode)
+
+    # Fan out: every member is an ordinary queued run, throttled by the suite's concurrency
+    scheduler.notify()
+    return await build_suite_run_read(suite_run)
+
+@router.get("/suites/{suite_id}/runs", response_model=List[SuiteRunRead])
+async def get_suite_runs(suite_id: UUID):
+    await get_suite_or_404(suite_id)
+    suite_runs = await SuiteRun.filter(suite_id=suite_id).order_by("-created_at")
+    return [await build_suite_run_read(suite_run) for suite_run in suite_runs]
+
+@router.get("/suite-runs/{suite_run_id}", response_model=SuiteRunRead)
+async def get_suite_run(suite_run_id: UUID):
+    suite_run = await SuiteRun.get_or_none(id=suite_run_id)
+    if not suite_run:
+        raise HTTPException(status_code=404, detail="Suite run not found")
+    return await build_suite_run_read(suite_run)
+
+@router.post("/suite-runs/{suite_run_id}/stop")
+async def stop_suite_run(suite_run_id: UUID):
+    suite_run = await SuiteRun.get_or_none(id=suite_run_id)
+    if not suite_run:
+        raise HTTPException(status_code=404, detail="Suite run not found")
+
+    dequeued = await TestRun.filter(suite_run_id=suite_run_id, status="PENDING").update(
+        status="STOPPED", finished_at=timezone.now()
+    )
+    running_ids = await TestRun.filter(suite_run_id=suite_run_id, status="RUNNING").values_list("id", flat=True)
+    signalled = 0
+    for run_id in running_ids:
+        # Marked in the database first: workers without a shared event bus only see the stop by polling
+        # for it, and a STOPPED run is never requeued should its worker die
+        if not await mark_stopped(run_id, "RUNNING"):
+            continue
+        if await signal_stop(str(run_id)):
+            signalled += 1
+
+    await refresh_suite_run(suite_run_id)
+    return {"message": "Stop signal sent", "dequeued": dequeued, "signalled": signalled}
+
+@router.websocket("/suite-runs/ws/{suite_run_id}")
+async def suite_websocket_endpoint(websocket: WebSocket, suite_run_id: str, since: Optional[int] = None):
+    channel = suite_channel(suite_run_id)
+    await manager.connect(channel, websocket, since=since)
+    try:
+        # Send the current aggregate so late subscribers start from a known state
+        suite_run = await SuiteRun.get_or_none(id=UUID(suite_run_id))
+        if suite_run:
+            manager.send_personal(channel, websocket, {"type": "suite_progress", "data": suite_progress(suite_run)})
+
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        manager.disconnect(channel, websocket)
+    except Exception as e:
+        print(f"WebSocket Error: {e}")
+        manager.disconnect(channel, websocket)
@@ -1,6 +1,10 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import List, Literal, Optional
 from uuid import UUID
+import hashlib
+import json
 from backend.app.models.test_case import TestCase, TestStep
 from backend.app.schemas.test_case import (
     TestCaseCreate, 
@@ -8,37 +12,152 @@ from backend.app.schemas.test_case import (
     TestStepCreate, 
     TestCaseUpdate,
     GenerateStepsRequest,
-    GenerateStepsResponse
+    GenerateStepsResponse,
+    BulkImportResult,
 )
+from tortoise.expressions import Q
 from tortoise.transactions import in_transaction
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from backend.app.core.config import settings
+from backend.app.agent.llm_registry import llm_registry
+from backend.app.agent.llm_cache import llm_cache
+from backend.app.api.endpoints.runs import run_page
+from backend.app.core.pagination import InvalidCursor, keyset_page
+from backend.app.core.versions import CASES, bump_version, get_version
+from backend.app.core.bulk_cases import (
+    NotAJSONArray,
+    fetch_steps,
+    import_cases,
+    iter_case_exports,
+    parse_json_array,
+    parse_ndjson,
+)
+from backend.app.models.test_run import TestRun
+from backend.app.schemas.test_run import RunPage
 
 router = APIRouter()
 
-@router.get("/cases", response_model=List[TestCaseRead])
-async def get_test_cases():
-    return await TestCase.all().prefetch_related("steps")
+CASE_FIELDS = list(TestCaseRead.model_fields)
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    if not fields:
+        return CASE_FIELDS
+    selected = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = set(selected) - set(CASE_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return selected
+
+def listing_etag(version: int, request: Request) -> str:
+    # The same version serves different bodies for different filters and pages
+    params = hashlib.sha1(str(sorted(request.query_params.multi_items())).encode("utf-8")).hexdigest()[:16]
+    return f'W/"{version}-{params}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in [tag.strip() for tag in header.split(",")]
+
+@router.get("/cases", response_model=None, responses={200: {"model": List[TestCaseRead]}})
+async def get_test_cases(
+    request: Request,
+    q: Optional[str] = Query(None, description="Case-insensitive search in name and URL"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,url"),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; all cases when omitted"),
+):
+    """
+    Cases, newest first. Stays a plain list for existing clients; when a
+    `limit` is given the cursor of the next page is in the X-Next-Cursor
+    header. The ETag changes whenever a case is created, updated or
+    deleted, so unchanged listings are answered with 304.
+    """
+    selected = parse_fields(fields)
+    etag = listing_etag(await get_version(CASES), request)
+    # no-cache: browsers may keep the listing but must revalidate it, which costs a 304
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    query = TestCase.all()
+    if q:
+        query = query.filter(Q(name__icontains=q) | Q(url__icontains=q))
+    columns = {"id", "created_at"} | {name for name in selected if name != "steps"}
+    try:
+        rows, next_cursor = await keyset_page(query, sorted(columns), limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if "steps" in selected:
+        steps = await fetch_steps([row["id"] for row in rows])
+        for row in rows:
+            row["steps"] = steps[row["id"]]
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    items = [{name: row[name] for name in selected} for row in rows]
+    return JSONResponse(jsonable_encoder(items), headers=headers)
 
 @router.post("/cases", response_model=TestCaseRead)
 async def create_test_case(case_in: TestCaseCreate):
-    case = await TestCase.create(name=case_in.name, url=case_in.url)
-    
-    # Create steps
-    for step_in in case_in.steps:
-        await TestStep.create(
-            case=case,
-            order=step_in.order,
-            instruction=step_in.instruction,
-            expected_result=step_in.expected_result
-        )
+    async with in_transaction():
+        case = await TestCase.create(**case_in.model_dump(exclude={"steps"}))
+        # One multi-row INSERT for all steps
+        await TestStep.bulk_create([TestStep(case=case, **step_in.model_dump()) for step_in in case_in.steps])
     
+    await bump_version(CASES)
     # Refresh to get steps
     await case.fetch_related("steps")
     return case
 
+@router.post("/cases/bulk", response_model=BulkImportResult)
+async def bulk_import_cases(request: Request, chunk_size: int = Query(500, ge=1, le=5000)):
+    """
+    Create many cases at once, from a JSON array or an NDJSON stream
+    (Content-Type: application/x-ndjson). Both are read as they arrive and
+    committed `chunk_size` cases at a time, so memory stays bounded by a
+    chunk whatever the size of the body. Invalid items are reported by
+    index and skipped, the others are created. Malformed JSON inside an
+    array, or a single item over 1 MiB, is reported at its index and ends
+    the import after the cases before it; NDJSON only skips that line.
+    """
+    if "ndjson" in request.headers.get("content-type", ""):
+        items = parse_ndjson(request.stream())
+    else:
+        items = parse_json_array(request.stream())
+
+    try:
+        result = await import_cases(items, chunk_size)
+    except NotAJSONArray as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if result.created:
+        await bump_version(CASES)
+    return result
+
+@router.get("/cases/export")
+async def export_cases(format: Literal["json", "ndjson"] = "ndjson", chunk_size: int = Query(500, ge=1, le=5000)):
+    """Stream every case with its steps; the output can be posted back to /cases/bulk."""
+
+    async def ndjson():
+        async for case in iter_case_exports(chunk_size):
+            yield json.dumps(jsonable_encoder(case)) + "\n"
+
+    async def json_array():
+        yield "["
+        separator = ""
+        async for case in iter_case_exports(chunk_size):
+            yield separator + json.dumps(jsonable_encoder(case))
+            separator = ","
+        yield "]"
+
+    media_type = "application/x-ndjson" if format == "ndjson" else "application/json"
+    return StreamingResponse(
+        ndjson() if format == "ndjson" else json_array(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="cases.{format}"'},
+    )
+
 @router.put("/cases/{case_id}", response_model=TestCaseRead)
 async def update_test_case(case_id: UUID, case_in: TestCaseUpdate):
     case = await TestCase.get_or_none(id=case_id)
@@ -47,21 +166,15 @@ async def update_test_case(case_id: UUID, case_in: TestCaseUpdate):
     
     async with in_transaction():
         # Update basic info
-        case.name = case_in.name
-        case.url = case_in.url
+        # Fields left out of the request (e.g. budgets by older clients) keep their values
+        case.update_from_dict(case_in.model_dump(exclude={"steps"}, exclude_unset=True))
         await case.save()
         
         # Replace steps (simplest strategy: delete all and recreate)
         # In a more complex scenario, we might want to update existing steps by ID
         await TestStep.filter(case_id=case_id).delete()
-        
-        for step_in in case_in.steps:
-            await TestStep.create(
-                case=case,
-                order=step_in.order,
-                instruction=step_in.instruction,
-                expected_result=step_in.expected_result
-            )
+        await TestStep.bulk_create([TestStep(case=case, **step_in.model_dump()) for step_in in case_in.steps])
+        await bump_version(CASES)
             
     await case.fetch_related("steps")
     return case
@@ -73,18 +186,41 @@ async def get_test_case(case_id: UUID):
         raise HTTPException(status_code=404, detail="Test case not found")
     return case
 
+@router.get("/cases/{case_id}/runs", response_model=RunPage)
+async def get_case_runs(case_id: UUID, status: Optional[str] = None, cursor: Optional[str] = None,
+                        limit: int = Query(50, ge=1, le=500)):
+    if not await TestCase.exists(id=case_id):
+        raise HTTPException(status_code=404, detail="Test case not found")
+    query = TestRun.filter(case_id=case_id)
+    if status:
+        query = query.filter(status=status.upper())
+    return await run_page(query, cursor, limit)
+
 @router.delete("/cases/{case_id}", status_code=204)
 async def delete_test_case(case_id: UUID):
     case = await TestCase.get_or_none(id=case_id)
     if not case:
         raise HTTPException(status_code=404, detail="Test case not found")
     await case.delete()
+    await bump_version(CASES)
     return
 
 @router.post("/cases/generate", response_model=GenerateStepsResponse)
 async def generate_test_steps(request: GenerateStepsRequest):
     try:
-        llm = ChatOpenAI(
+        cache_key = None
+        if llm_cache and llm_cache.accepts(settings.model.temperature):
+            cache_key = llm_cache.make_key(
+                settings.model.name,
+                settings.model.temperature,
+                f"{request.url}\n{request.intent}",
+                namespace="generate_steps",
+            )
+            cached = await llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        llm = llm_registry.langchain_llm(
             base_url=settings.model.base_url,
             api_key=settings.model.api_key,
             model=settings.model.name,
@@ -115,6 +251,8 @@ async def generate_test_steps(request: GenerateStepsRequest):
             "format_instructions": parser.get_format_instructions()
         })
 
+        if cache_key:
+            await llm_cache.put(cache_key, GenerateStepsResponse.model_validate(result).model_dump(mode="json"))
         return result
 
     except Exception as e:
@@ -0,0 +1,155 @@
+import asyncio
+import hashlib
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+from tortoise import timezone
+from tortoise.expressions import Subquery
+
+from backend.app.core.config import settings
+from backend.app.core.metrics import timed_write
+from backend.app.models.artifact import Artifact, RunArtifact
+from backend.app.models.test_run import TestRun
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
+
+
+def sniff_content_type(head: bytes) -> str:
+    if head.startswith(b"\x89PNG"):
+        return "image/png"
+    if head.startswith(b"\xff\xd8"):
+        return "image/jpeg"
+    if head.startswith(b"RIFF") and head[8:12] == b"WEBP":
+        return "image/webp"
+    return "application/octet-stream"
+
+
+class ArtifactStore:
+    """
+    Files on the local filesystem addressed by the sha256 of their content.
+
+    Writing the same bytes twice stores them once. Writes go to a temporary
+    file first and are renamed into place, so readers never see partial
+    files; `put` runs them in a thread to keep the event loop free.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def path(self, digest: str) -> Path:
+        # Two-level fan-out keeps directories small
+        return self.root / digest[:2] / digest
+
+    def exists(self, digest: str) -> bool:
+        return self.path(digest).exists()
+
+    def write(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{digest}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        return digest
+
+    async def put(self, data: bytes) -> str:
+        return await asyncio.to_thread(self.write, data)
+
+    def delete(self, digest: str):
+        try:
+            self.path(digest).unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _describe(path: Path):
+    with open(path, "rb") as f:
+        head = f.read(12)
+    return sniff_content_type(head), path.stat().st_size
+
+
+async def attach_artifact(run_id: UUID, digest: str, kind: str, content_type: Optional[str] = None,
+                          size: Optional[int] = None) -> RunArtifact:
+    """Reference a stored file from a run, registering it on first use."""
+    if content_type is None or size is None:
+        content_type, size = await asyncio.to_thread(_describe, artifact_store.path(digest))
+    with timed_write("run_artifacts"):
+        artifact, _ = await Artifact.get_or_create(
+            hash=digest,
+            defaults={"content_type": content_type, "size": size},
+        )
+        return await RunArtifact.create(run_id=run_id, artifact=artifact, kind=kind)
+
+
+async def collect_garbage(retention_days: Optional[float] = None, grace_seconds: Optional[float] = None) -> dict:
+    """
+    Apply the retention policy.
+
+    References of runs older than `retention_days` are dropped, then every
+    artifact no run references any more is deleted, as are files that never
+    got registered (e.g. a run that crashed mid-step). Anything younger than
+    `grace_seconds` is kept so in-flight writes are not raced.
+    """
+    config = settings.artifacts
+    retention_days = config.retention_days if retention_days is None else retention_days
+    grace_seconds = config.orphan_grace_minutes * 60 if grace_seconds is None else grace_seconds
+    now = timezone.now()
+
+    expired = 0
+    if retention_days > 0:
+        old_runs = TestRun.filter(created_at__lt=now - timedelta(days=retention_days)).values("id")
+        expired = await RunArtifact.filter(run_id__in=Subquery(old_runs)).delete()
+
+    referenced = set(await RunArtifact.all().distinct().values_list("artifact_id", flat=True))
+    cutoff = now - timedelta(seconds=grace_seconds)
+    candidates = await Artifact.filter(created_at__lt=cutoff).values_list("hash", flat=True)
+    unreferenced = [digest for digest in candidates if digest not in referenced]
+    for digest in unreferenced:
+        await asyncio.to_thread(artifact_store.delete, digest)
+    if unreferenced:
+        await Artifact.filter(hash__in=unreferenced).delete()
+
+    known = set(await Artifact.all().values_list("hash", flat=True))
+    orphans = await asyncio.to_thread(_delete_unknown_files, known, time.time() - grace_seconds)
+
+    return {"expired_references": expired, "deleted_artifacts": len(unreferenced), "deleted_orphan_files": orphans}
+
+
+def _delete_unknown_files(known: set, older_than: float) -> int:
+    deleted = 0
+    if not artifact_store.root.exists():
+        return 0
+    for path in artifact_store.root.glob("*/*"):
+        if path.name in known:
+            continue
+        try:
+            if path.stat().st_mtime < older_than:
+                path.unlink()
+                deleted += 1
+        except FileNotFoundError:
+            pass
+    return deleted
+
+
+async def run_garbage_collector(interval_hours: float):
+    while True:
+        try:
+            result = await collect_garbage()
+            if any(result.values()):
+                print(f"Artifact GC: {result}")
+        except Exception as e:
+            print(f"Artifact GC Error: {e}")
+        await asyncio.sleep(interval_hours * 3600)
+
+
+def build_artifact_store() -> ArtifactStore:
+    path = Path(settings.artifacts.path)
+    return ArtifactStore(path if path.is_absolute() else BASE_DIR / path)
+
+
+artifact_store = build_artifact_store()
@@ -0,0 +1,209 @@
+import codecs
+import json
+from typing import Any, AsyncIterator, Dict, List, Tuple
+from uuid import UUID
+
+from pydantic import ValidationError
+from tortoise.transactions import in_transaction
+
+from backend.app.core.pagination import keyset_page
+from backend.app.models.test_case import TestCase, TestStep
+from backend.app.schemas.test_case import (
+    BulkCaseError,
+    BulkImportResult,
+    TestCaseCreate,
+    TestCaseRead,
+    TestStepRead,
+)
+
+CASE_FIELDS = [name for name in TestCaseRead.model_fields if name != "steps"]
+STEP_FIELDS = list(TestStepRead.model_fields)
+# A JSON array is buffered one item at a time; anything larger is rejected rather than held in memory
+MAX_ITEM_CHARS = 1024 * 1024
+JSON_WHITESPACE = " \t\n\r"
+
+
+class NotAJSONArray(ValueError):
+    """Raised when a bulk import body that is not NDJSON does not start with a JSON array."""
+
+
+def validate_batch(items: List[Tuple[int, Any]]) -> Tuple[List[Tuple[int, TestCaseCreate]], List[BulkCaseError]]:
+    """Split (index, raw item) pairs into valid cases and per-item errors."""
+    valid, errors = [], []
+    for index, item in items:
+        if isinstance(item, BulkCaseError):
+            errors.append(item)
+            continue
+        try:
+            valid.append((index, TestCaseCreate.model_validate(item)))
+        except ValidationError as e:
+            errors.append(BulkCaseError(index=index, errors=e.errors(include_url=False, include_context=False)))
+    return valid, errors
+
+
+async def insert_cases(cases: List[TestCaseCreate]) -> List[UUID]:
+    """Insert cases and their steps with two multi-row INSERTs in one transaction."""
+    case_rows, step_rows = [], []
+    for case_in in cases:
+        # UUID primary keys are generated client-side, so steps can reference cases before the insert
+        case = TestCase(**case_in.model_dump(exclude={"steps"}))
+        case_rows.append(case)
+        step_rows.extend(TestStep(case_id=case.id, **step_in.model_dump()) for step_in in case_in.steps)
+    async with in_transaction() as conn:
+        await TestCase.bulk_create(case_rows, using_db=conn)
+        if step_rows:
+            await TestStep.bulk_create(step_rows, using_db=conn)
+    return [case.id for case in case_rows]
+
+
+async def import_cases(items: AsyncIterator[Any], chunk_size: int = 500) -> BulkImportResult:
+    """
+    Validate and insert a stream of case dicts, `chunk_size` at a time.
+
+    Each chunk is validated as a whole, then its valid cases are committed
+    in one transaction; invalid items, or every item of a chunk whose
+    transaction failed, are reported by index and the rest still go in.
+    """
+    result = BulkImportResult(created=0, failed=0)
+    chunk: List[Tuple[int, Any]] = []
+
+    async def flush():
+        valid, errors = validate_batch(chunk)
+        if valid:
+            try:
+                result.ids.extend(await insert_cases([case for _, case in valid]))
+                result.created += len(valid)
+            except Exception as e:
+                print(f"Bulk Import Error: {e}")
+                errors.extend(BulkCaseError(index=index, errors=[str(e)]) for index, _ in valid)
+        result.failed += len(errors)
+        result.errors.extend(errors)
+        chunk.clear()
+
+    index = 0
+    async for item in items:
+        chunk.append((index, item))
+        index += 1
+        if len(chunk) >= chunk_size:
+            await flush()
+    if chunk:
+        await flush()
+    return result
+
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """Decode an NDJSON byte stream line by line; a malformed line yields a BulkCaseError in its place."""
+    buffer = b""
+    index = 0
+
+    def decode(line: bytes):
+        try:
+            return json.loads(line)
+        except ValueError as e:
+            return BulkCaseError(index=index, errors=[f"Invalid JSON: {e}"])
+
+    async for data in chunks:
+        buffer += data
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield decode(line)
+                index += 1
+    if buffer.strip():
+        yield decode(buffer)
+
+
+async def parse_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """
+    Decode the items of a JSON array as its bytes arrive, holding only the
+    item being read. Raises NotAJSONArray before the first item is read.
+    Malformed JSON, or an item over MAX_ITEM_CHARS, yields a BulkCaseError
+    and ends the stream: where the next item starts is unknown.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    stream = chunks.__aiter__()
+    buffer, pos, ended = "", 0, False
+
+    async def read_more() -> bool:
+        nonlocal buffer, pos, ended
+        if ended:
+            return False
+        try:
+            data = await stream.__anext__()
+        except StopAsyncIteration:
+            data, ended = b"", True
+        buffer = buffer[pos:] + utf8.decode(data, final=ended)
+        pos = 0
+        return True
+
+    async def peek() -> str:
+        """The next non-whitespace character, "" at the end of the body."""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not await read_more():
+                return ""
+
+    index = 0
+    try:
+        if await peek() != "[":
+            raise NotAJSONArray("Body must be a JSON array of test cases")
+        pos += 1
+        if await peek() == "]":
+            return
+        while True:
+            # raw_decode does not skip leading whitespace
+            await peek()
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                    # Only final once something follows: "12" may still become "123"
+                    if end < len(buffer) or ended:
+                        break
+                except ValueError:
+                    if ended:
+                        raise
+                if len(buffer) - pos > MAX_ITEM_CHARS:
+                    raise ValueError(f"item exceeds {MAX_ITEM_CHARS} characters, use NDJSON for such cases")
+                await read_more()
+            pos = end
+            yield item
+            index += 1
+            separator = await peek()
+            if separator == "]":
+                pos += 1
+                if await peek():
+                    raise ValueError("unexpected data after the array")
+                return
+            if separator != ",":
+                raise ValueError(f"expected ',' or ']' after item {index - 1}")
+            pos += 1
+    except NotAJSONArray:
+        raise
+    except ValueError as e:
+        yield BulkCaseError(index=index, errors=[f"Invalid JSON: {e}"])
+
+
+async def fetch_steps(case_ids: List[UUID]) -> Dict[UUID, List[dict]]:
+    """Steps of several cases in one query, in order, keyed by case."""
+    steps: Dict[UUID, List[dict]] = {case_id: [] for case_id in case_ids}
+    if case_ids:
+        for step in await TestStep.filter(case_id__in=case_ids).order_by("order").values(*STEP_FIELDS):
+            steps[step["case_id"]].append(step)
+    return steps
+
+
+async def iter_case_exports(chunk_size: int = 500) -> AsyncIterator[Dict[str, Any]]:
+    """Every case with its steps, newest first, read one keyset page at a time."""
+    cursor = None
+    while True:
+        rows, cursor = await keyset_page(TestCase.all(), CASE_FIELDS, chunk_size, cursor)
+        steps = await fetch_steps([row["id"] for row in rows])
+        for row in rows:
+            yield {**row, "steps": steps[row["id"]]}
+        if not cursor:
+            return
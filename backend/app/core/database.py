@@ -1,22 +1,117 @@
 import os
 from pathlib import Path
+from typing import List
+
 from tortoise import Tortoise
+from tortoise.backends.base.config_generator import expand_db_url
+
+from backend.app.core.config import settings
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
-DB_FILE = BASE_DIR / "webuitester.db"
+DB_FILE = BASE_DIR / settings.database.url if settings.database.backend == "sqlite" else None
+
+if os.getenv("TEST_MODE"):
+    DB_URL = "sqlite://:memory:"
+else:
+    DB_URL = f"sqlite://{DB_FILE}" if DB_FILE else settings.database.url
+
+# Connection used by core/db_writer.py; absent when the dedicated writer is disabled
+WRITER_CONNECTION = "writer"
+
+MIGRATIONS_DIR = BASE_DIR / "backend" / "migrations"
+
+MODELS = [
+    "backend.app.models.test_case",
+    "backend.app.models.test_run",
+    "backend.app.models.test_suite",
+    "backend.app.models.action_trace",
+    "backend.app.models.run_event",
+    "backend.app.models.artifact",
+    "backend.app.models.step_timing",
+    "backend.app.models.version",
+]
+
+
+def sqlite_pragmas() -> dict:
+    """PRAGMAs from config.yaml, passed to Tortoise's SQLite client which runs them on connect."""
+    config = settings.database
+    return {
+        "journal_mode": config.journal_mode,
+        "synchronous": config.synchronous,
+        "busy_timeout": config.busy_timeout_ms,
+        # Negative means KiB rather than pages
+        "cache_size": -config.cache_size_mb * 1024,
+        "mmap_size": config.mmap_size_mb * 1024 * 1024,
+    }
+
+
+def sqlite_connection(file_path) -> dict:
+    return {
+        "engine": "tortoise.backends.sqlite",
+        "credentials": {"file_path": str(file_path), **sqlite_pragmas()},
+    }
+
+
+def postgres_connection(url: str) -> dict:
+    """asyncpg client for a postgres:// URL, with the pool bounds from config.yaml."""
+    connection = expand_db_url(url)
+    connection["engine"] = "tortoise.backends.asyncpg"
+    connection["credentials"].setdefault("min_size", settings.database.pool_min_size)
+    connection["credentials"].setdefault("max_size", settings.database.pool_max_size)
+    return connection
+
+
+def build_connections() -> dict:
+    if os.getenv("TEST_MODE"):
+        # Every connection to :memory: is a separate database, so there is no writer connection
+        return {"default": DB_URL}
+    config = settings.database
+    if config.backend == "postgres":
+        # The pool already lets the writer and readers run side by side
+        return {"default": postgres_connection(config.url)}
+    if config.backend != "sqlite":
+        raise ValueError(f"Unsupported database backend: {config.backend}")
+    connections = {"default": sqlite_connection(DB_FILE)}
+    if config.dedicated_writer:
+        connections[WRITER_CONNECTION] = sqlite_connection(DB_FILE)
+    return connections
 
-DB_URL = "sqlite://:memory:" if os.getenv("TEST_MODE") else f"sqlite://{DB_FILE}"
 
 TORTOISE_ORM = {
-    "connections": {"default": DB_URL},
+    "connections": build_connections(),
     "apps": {
         "models": {
-            "models": ["backend.app.models.test_case", "backend.app.models.test_run", "aerich.models"],
+            "models": MODELS + ["aerich.models"],
             "default_connection": "default",
         },
     },
 }
 
+
+def migration_command():
+    from aerich import Command
+
+    return Command(tortoise_config=TORTOISE_ORM, app="models", location=str(MIGRATIONS_DIR))
+
+
+async def apply_migrations() -> List[str]:
+    """Apply pending aerich migrations to the initialised database; returns the applied versions."""
+    command = migration_command()
+    await command.init()
+    return await command.upgrade(run_in_transaction=True)
+
+
+async def prepare_schema():
+    """Bring the schema of an initialised database up to date, per `database.migrate`."""
+    if settings.database.migrate:
+        applied = await apply_migrations()
+        if applied:
+            print(f"Applied migrations: {', '.join(applied)}")
+    else:
+        await Tortoise.generate_schemas()
+
+
 async def init():
+    # Standalone setup (init_db.py); the server and workers are initialised by their own entry points
     await Tortoise.init(config=TORTOISE_ORM)
-    await Tortoise.generate_schemas()
+    await prepare_schema()
@@ -0,0 +1,111 @@
+import asyncio
+from typing import List, Optional, Sequence, Tuple, Type
+
+from tortoise import Model, connections
+from tortoise.transactions import in_transaction
+
+from backend.app.core.config import settings
+from backend.app.core.database import WRITER_CONNECTION
+
+# (model, rows, future resolved once the rows are committed)
+_Batch = Tuple[Type[Model], Sequence[Model], asyncio.Future]
+
+
+class DBWriter:
+    """
+    Serializes high-frequency inserts through a single task.
+
+    Concurrent runs hand their batches over instead of each opening a write
+    transaction; batches queued while one transaction commits go into the
+    next one, so N runs flushing at once cost one commit (one fsync) rather
+    than N competing for SQLite's single write lock. Inserts use the
+    dedicated writer connection when one is configured, which keeps the
+    default connection free for reads while a batch is written.
+    """
+
+    def __init__(self, max_rows: Optional[int] = None):
+        self.max_rows = max_rows or settings.database.writer_batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.transactions = 0
+
+    def _connection_name(self) -> str:
+        return WRITER_CONNECTION if WRITER_CONNECTION in connections.db_config else "default"
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        # Restart after close() or when used from a new event loop
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run(), name="db-writer")
+
+    async def bulk_create(self, model: Type[Model], rows: Sequence[Model]):
+        """Insert `rows`, returning once they are committed; raises if they could not be."""
+        if not rows:
+            return
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((model, rows, future))
+        await future
+
+    def _take_batches(self, first: _Batch) -> Tuple[List[_Batch], bool]:
+        """Merge queued batches up to max_rows; also reports whether close() was requested."""
+        batches = [first]
+        size = len(first[1])
+        while size < self.max_rows and not self._queue.empty():
+            batch = self._queue.get_nowait()
+            if batch is None:
+                return batches, True
+            batches.append(batch)
+            size += len(batch[1])
+        return batches, False
+
+    async def _write(self, batches: List[_Batch]):
+        async with in_transaction(self._connection_name()) as conn:
+            for model, rows, _ in batches:
+                await model.bulk_create(rows, using_db=conn)
+        self.transactions += 1
+
+    async def _commit(self, batches: List[_Batch]):
+        try:
+            await self._write(batches)
+        except Exception as e:
+            if len(batches) > 1:
+                # Don't let one bad batch fail the others sharing its transaction
+                for batch in batches:
+                    await self._commit([batch])
+                return
+            outcome = e
+        else:
+            outcome = None
+        for _, _, future in batches:
+            if future.done():
+                continue
+            if outcome is None:
+                future.set_result(None)
+            else:
+                future.set_exception(outcome)
+
+    async def _run(self):
+        while True:
+            first = await self._queue.get()
+            if first is None:
+                return
+            batches, closing = self._take_batches(first)
+            await self._commit(batches)
+            if closing:
+                return
+
+    async def close(self):
+        """Commit what is queued, then stop the writer task."""
+        if self._task is None:
+            return
+        if not self._task.done() and self._loop is asyncio.get_running_loop():
+            self._queue.put_nowait(None)
+            await self._task
+        self._task = None
+
+
+db_writer = DBWriter()
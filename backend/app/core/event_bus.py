@@ -0,0 +1,226 @@
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from backend.app.core.config import settings
+from backend.app.core.socket_manager import manager
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
+
+# Channel carrying run control messages (stop requests) instead of WebSocket events
+CONTROL_CHANNEL = "control"
+
+# Header carrying scheduler.worker_token when a worker forwards events over HTTP instead of the bus
+WORKER_TOKEN_HEADER = "X-Worker-Token"
+
+Handler = Callable[[str, dict], Awaitable[None]]
+
+
+class EventBus:
+    """
+    In-memory bus: every subscriber lives in this process, nothing to relay.
+
+    Publishing is for *other* processes; callers deliver locally themselves
+    (ConnectionManager.broadcast, the local stop event), so this backend
+    is a no-op and is the right choice for a single API process.
+    """
+
+    # True when published messages reach other processes
+    shared = False
+
+    def __init__(self):
+        self._handler: Optional[Handler] = None
+
+    async def start(self, handler: Handler):
+        self._handler = handler
+
+    async def publish(self, channel: str, message: dict):
+        pass
+
+    async def close(self):
+        pass
+
+    def stats(self) -> dict:
+        return {"backend": "memory", "shared": self.shared}
+
+
+class SQLiteEventBus(EventBus):
+    """
+    Cross-process bus over a shared SQLite file, no broker service needed.
+
+    Messages are appended in batches by a writer task and every process
+    polls for rows newer than the last one it saw, skipping its own. Rows
+    older than `retention_seconds` are deleted.
+    """
+
+    shared = True
+
+    def __init__(self, path: Path, poll_interval: float = 0.1, retention_seconds: float = 300.0,
+                 batch_size: int = 200, max_pending: int = 10000):
+        super().__init__()
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self.batch_size = batch_size
+        self.origin = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._tasks: List[asyncio.Task] = []
+        self._last_id = 0
+        self._last_cleanup = 0.0
+        self.published = 0
+        self.received = 0
+        self.dropped = 0
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=10.0)
+        # WAL lets pollers read while another process appends
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS bus_messages ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, origin TEXT NOT NULL, channel TEXT NOT NULL, "
+            "payload TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn = conn
+        # Subscribe from now on; history belongs to the REST API and the WebSocket replay buffers
+        self._last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM bus_messages").fetchone()[0]
+
+    async def start(self, handler: Handler):
+        await super().start(handler)
+        await asyncio.to_thread(self._connect)
+        self._tasks = [asyncio.create_task(self._write_loop()), asyncio.create_task(self._poll_loop())]
+
+    async def publish(self, channel: str, message: dict):
+        # Never block the caller (usually the agent loop) on the bus
+        try:
+            self._queue.put_nowait((channel, message))
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def _insert(self, batch: List[Tuple[str, dict]]):
+        now = time.time()
+        rows = [(self.origin, channel, json.dumps(message), now) for channel, message in batch]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO bus_messages (origin, channel, payload, created_at) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def _take_batch(self, first) -> list:
+        batch = [first]
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _write(self, batch: list):
+        try:
+            await asyncio.to_thread(self._insert, batch)
+            self.published += len(batch)
+        except Exception as e:
+            self.dropped += len(batch)
+            print(f"Event Bus Error: {e}")
+
+    async def _write_loop(self):
+        while True:
+            first = await self._queue.get()
+            await self._write(self._take_batch(first))
+
+    def _fetch(self) -> List[Tuple[int, str, str, str]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, origin, channel, payload FROM bus_messages WHERE id > ? ORDER BY id LIMIT ?",
+                (self._last_id, self.batch_size),
+            ).fetchall()
+            now = time.time()
+            if now - self._last_cleanup > self.retention_seconds / 10:
+                self._last_cleanup = now
+                self._conn.execute("DELETE FROM bus_messages WHERE created_at < ?", (now - self.retention_seconds,))
+        return rows
+
+    async def poll_once(self) -> int:
+        rows = await asyncio.to_thread(self._fetch)
+        for row_id, origin, channel, payload in rows:
+            self._last_id = row_id
+            if origin == self.origin:
+                continue
+            self.received += 1
+            try:
+                await self._handler(channel, json.loads(payload))
+            except Exception as e:
+                print(f"Event Bus Handler Error: {e}")
+        return len(rows)
+
+    async def _poll_loop(self):
+        while True:
+            try:
+                # A full page means more rows are waiting, keep reading
+                if await self.poll_once() < self.batch_size:
+                    await asyncio.sleep(self.poll_interval)
+            except Exception as e:
+                print(f"Event Bus Error: {e}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._conn is not None:
+            while not self._queue.empty():
+                await self._write(self._take_batch(self._queue.get_nowait()))
+            with self._lock:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> dict:
+        return {
+            "backend": "sqlite",
+            "shared": self.shared,
+            "origin": self.origin,
+            "path": str(self.path),
+            "pending": self._queue.qsize(),
+            "published": self.published,
+            "received": self.received,
+            "dropped": self.dropped,
+        }
+
+
+async def dispatch(channel: str, message: dict):
+    """Handle a message published by another process."""
+    if channel == CONTROL_CHANNEL:
+        if message.get("type") == "stop":
+            from backend.app.api.endpoints.runs import active_runs
+            control = active_runs.get(message.get("run_id"))
+            if control:
+                control["stop_event"].set()
+        return
+    manager.deliver(channel, message)
+
+
+async def start_event_bus():
+    await event_bus.start(dispatch)
+    if event_bus.shared:
+        manager.bus = event_bus
+
+
+def build_event_bus() -> EventBus:
+    config = settings.event_bus
+    if config.backend == "sqlite":
+        path = Path(config.path)
+        return SQLiteEventBus(
+            path=path if path.is_absolute() else BASE_DIR / path,
+            poll_interval=config.poll_interval,
+            retention_seconds=config.retention_seconds,
+        )
+    return EventBus()
+
+
+event_bus = build_event_bus()
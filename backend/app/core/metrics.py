@@ -0,0 +1,218 @@
+import math
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, List, Sequence, Tuple
+
+# Seconds; covers a fast DB write up to a long agent run
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, Tuple[str, ...], Tuple[str, ...], float]]:
+        return [(self.name, self.labelnames, key, value) for key, value in self._values.items()]
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        for name, labelnames, labelvalues, value in self.samples():
+            lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def set(self, value: float, **labels):
+        self._values[self._key(labels)] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # labels -> (per-bucket counts, sum, count)
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[0][i] += 1
+                break
+        series[1] += value
+        series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def samples(self):
+        samples = []
+        for key, (counts, total, count) in self._series.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = key + (_format_value(bound),)
+                samples.append((f"{self.name}_bucket", self.labelnames + ("le",), labels, cumulative))
+            samples.append((f"{self.name}_sum", self.labelnames, key, total))
+            samples.append((f"{self.name}_count", self.labelnames, key, count))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Process-local metrics rendered in the Prometheus text exposition format.
+
+    Counters and histograms are updated where things happen. Gauges that
+    mirror state owned elsewhere (queue length, open sockets) are refreshed
+    by collectors run at scrape time. Each API or worker process exposes
+    its own values; Prometheus sums them across instances.
+    """
+
+    def __init__(self, prefix: str = "webuitester"):
+        self.prefix = prefix
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Awaitable[None]]] = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(f"{self.prefix}_{name}", documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(f"{self.prefix}_{name}", documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(f"{self.prefix}_{name}", documentation, labelnames, buckets))
+
+    def collector(self, func: Callable[[], Awaitable[None]]):
+        """Register a coroutine function refreshing gauges before each scrape."""
+        self._collectors.append(func)
+        return func
+
+    async def render(self) -> str:
+        for collect in self._collectors:
+            try:
+                await collect()
+            except Exception as e:
+                print(f"Metrics Collector Error: {e}")
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+RUNS_STARTED = registry.counter("runs_started_total", "Test runs started by this process.")
+RUNS_FINISHED = registry.counter(
+    "runs_finished_total", "Test runs finished by this process, by final status.", ["status"]
+)
+RUNS_RECOVERED = registry.counter(
+    "runs_recovered_total",
+    "Orphaned RUNNING runs taken over from a lost worker, by outcome (requeued, failed).",
+    ["outcome"],
+)
+RUN_DURATION = registry.histogram("run_duration_seconds", "Wall-clock duration of test runs.", ["status"])
+AGENT_STEPS = registry.counter("agent_steps_total", "Agent steps executed; rate() gives steps per second.")
+STEP_DURATION = registry.histogram("step_duration_seconds", "Duration of one agent step, including event handling.")
+LLM_REQUESTS = registry.counter(
+    "llm_requests_total", "LLM calls made by agents, by outcome (ok, cached, error).", ["outcome"]
+)
+LLM_LATENCY = registry.histogram("llm_request_duration_seconds", "Latency of LLM calls made by agents.")
+DB_WRITE_DURATION = registry.histogram(
+    "db_write_duration_seconds", "Latency of database writes on the run path, by table.", ["table"]
+)
+DB_WRITE_ERRORS = registry.counter(
+    "db_write_errors_total", "Failed database writes on the run path, by table.", ["table"]
+)
+WS_MESSAGES_SENT = registry.counter("websocket_messages_sent_total", "Messages sent to WebSocket clients.")
+WS_MESSAGES_DROPPED = registry.counter(
+    "websocket_messages_dropped_total",
+    "Messages dropped for slow WebSocket clients, by reason (overflow, coalesced).",
+    ["reason"],
+)
+WS_EVICTIONS = registry.counter("websocket_evictions_total", "WebSocket clients evicted as dead or too slow.")
+
+ACTIVE_RUNS = registry.gauge("active_runs", "Runs executing in this process.")
+QUEUE_LENGTH = registry.gauge("queue_length", "PENDING runs waiting in the queue.")
+WS_CONNECTIONS = registry.gauge("websocket_connections", "Open WebSocket connections.")
+WS_QUEUED = registry.gauge("websocket_queued_messages", "Messages waiting in WebSocket send queues.")
+
+
+@contextmanager
+def timed_write(table: str):
+    """Observe the latency of a database write, counting failures."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        DB_WRITE_ERRORS.inc(table=table)
+        raise
+    finally:
+        DB_WRITE_DURATION.observe(time.perf_counter() - start, table=table)
@@ -0,0 +1,50 @@
+import base64
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+
+
+class InvalidCursor(ValueError):
+    """Raised for a cursor that was not produced by encode_cursor."""
+
+
+def encode_cursor(created_at: datetime, id) -> str:
+    """Opaque position of a row in (created_at, id) order."""
+    raw = f"{created_at.isoformat()}|{id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), id
+    except ValueError as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+
+
+async def keyset_page(query: QuerySet, fields: Sequence[str], limit: Optional[int],
+                      cursor: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+    """
+    One page of `query`, newest first, as dicts of `fields`, plus the cursor of the next page.
+    `fields` must include created_at and id; without a `limit` every remaining row is returned.
+
+    Rows are ordered by (created_at, id) and a page starts strictly after the
+    cursor's row, so the database seeks through the index instead of
+    skipping OFFSET rows, and rows inserted meanwhile neither shift nor
+    repeat pages. The cursor is None on the last page.
+    """
+    if cursor:
+        created_at, id = decode_cursor(cursor)
+        query = query.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=id))
+    query = query.order_by("-created_at", "-id")
+    if limit is None:
+        return await query.values(*fields), None
+    # One extra row tells whether another page follows
+    rows = await query.limit(limit + 1).values(*fields)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
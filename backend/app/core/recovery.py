@@ -0,0 +1,102 @@
+import os
+import socket
+from datetime import timedelta
+from typing import Dict, Iterable, Optional, Set
+from uuid import UUID
+
+from tortoise import timezone
+from tortoise.expressions import Q
+
+from backend.app.core.config import settings
+from backend.app.core.metrics import RUNS_RECOVERED
+from backend.app.core.run_events import RunEventWriter
+from backend.app.core.socket_manager import manager
+from backend.app.core.suite_runs import refresh_suite_run
+from backend.app.models.test_run import TestRun
+
+
+def lease_owner_id() -> str:
+    """Identifies this process in TestRun.lease_owner."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+async def renew_leases(owner: str, run_ids: Iterable[UUID]) -> Set[UUID]:
+    """Heartbeat the RUNNING runs `owner` executes; returns the ones it no longer holds."""
+    run_ids = set(run_ids)
+    if not run_ids:
+        return set()
+    await TestRun.filter(id__in=run_ids, status="RUNNING", lease_owner=owner).update(heartbeat_at=timezone.now())
+    held = await TestRun.filter(id__in=run_ids, status="RUNNING", lease_owner=owner).values_list("id", flat=True)
+    return run_ids - set(held)
+
+
+def _expired(lease_seconds: float) -> Q:
+    cutoff = timezone.now() - timedelta(seconds=lease_seconds)
+    return (
+        Q(heartbeat_at__lt=cutoff)
+        # Claimed before runs had leases
+        | Q(heartbeat_at__isnull=True, started_at__lt=cutoff)
+        | Q(heartbeat_at__isnull=True, started_at__isnull=True)
+    )
+
+
+async def recover_orphaned_runs(lease_seconds: Optional[float] = None, max_attempts: Optional[int] = None,
+                                all_running: bool = False) -> Dict[str, int]:
+    """
+    Requeue or fail RUNNING runs whose worker is gone.
+
+    active_runs only lives in the memory of the executing process, so a run
+    whose process crashed or was restarted stays RUNNING forever. Its lease
+    tells us: without a heartbeat for `lease_seconds` the run goes back to
+    PENDING, unless it was already started `max_attempts` times, in which
+    case it is marked FAILED with the reason. `all_running` treats every
+    RUNNING run as orphaned, for a process starting up that knows it is the
+    only one executing runs.
+    """
+    config = settings.scheduler
+    lease_seconds = config.lease_seconds if lease_seconds is None else lease_seconds
+    max_attempts = config.max_attempts if max_attempts is None else max_attempts
+
+    query = TestRun.filter(status="RUNNING")
+    if not all_running:
+        query = query.filter(_expired(lease_seconds))
+    candidates = await query.values("id", "suite_run_id", "attempts")
+
+    recovered = {"requeued": 0, "failed": 0}
+    suite_run_ids = set()
+    for row in candidates:
+        run_id, attempts = row["id"], row["attempts"]
+        # Conditional update: skip runs whose lease was renewed, or that finished, since the read above
+        guard = TestRun.filter(id=run_id, status="RUNNING")
+        if not all_running:
+            guard = guard.filter(_expired(lease_seconds))
+
+        if attempts < max_attempts:
+            outcome, status = "requeued", "PENDING"
+            message = f"Worker lost, run requeued (attempt {attempts} of {max_attempts})"
+            updated = await guard.update(status=status, started_at=None, lease_owner=None, heartbeat_at=None)
+        else:
+            outcome, status = "failed", "FAILED"
+            message = f"Worker lost after {attempts} attempts, no heartbeat for {lease_seconds:g}s"
+            updated = await guard.update(
+                status=status, result_summary=message, finished_at=timezone.now(), lease_owner=None
+            )
+        if not updated:
+            continue
+
+        recovered[outcome] += 1
+        RUNS_RECOVERED.inc(outcome=outcome)
+        print(f"Recovered run {run_id}: {message}")
+        events = RunEventWriter(run_id)
+        for event in ({"type": "log", "data": message}, {"type": "status", "data": status}):
+            await manager.broadcast(str(run_id), await events.append(event))
+        await events.close()
+        if row["suite_run_id"]:
+            suite_run_ids.add(row["suite_run_id"])
+
+    for suite_run_id in suite_run_ids:
+        try:
+            await refresh_suite_run(suite_run_id)
+        except Exception as e:
+            print(f"Suite Progress Error: {e}")
+    return recovered
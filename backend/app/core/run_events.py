@@ -0,0 +1,164 @@
+import asyncio
+from typing import AsyncIterator, List, Optional
+from uuid import UUID
+
+from tortoise import timezone
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
+
+from backend.app.core.config import settings
+from backend.app.core.db_writer import db_writer
+from backend.app.core.metrics import timed_write
+from backend.app.models.run_event import RunEvent
+from backend.app.models.test_run import TestRun
+
+# Live-view only: screenshots are too large to keep per run, budget snapshots are superseded by the next one
+UNPERSISTED_TYPES = {"screenshot", "budget"}
+
+
+async def next_seq(run_id: UUID) -> int:
+    last = await RunEvent.filter(run_id=run_id).order_by("-seq").first().values_list("seq", flat=True)
+    return (last or 0) + 1
+
+
+class RunEventWriter:
+    """
+    Buffers the events of one run and appends them to run_events in batches.
+
+    A batch is written when `flush_size` events are pending or `flush_interval`
+    seconds after the first pending one, whichever comes first, so a long run
+    costs one INSERT per batch instead of rewriting its whole log per line.
+    """
+
+    def __init__(self, run_id: UUID, flush_size: Optional[int] = None, flush_interval: Optional[float] = None):
+        self.run_id = run_id
+        self.flush_size = flush_size or settings.run_events.flush_size
+        self.flush_interval = flush_interval if flush_interval is not None else settings.run_events.flush_interval
+        self._pending: List[RunEvent] = []
+        self._next_seq: Optional[int] = None
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+
+    async def append(self, event: dict) -> dict:
+        """
+        Queue an event and return it stamped with its RunEvent seq.
+
+        The stamped copy is what gets broadcast, so WebSocket clients and
+        GET /runs/{id}/events share one sequence. Unpersisted events are
+        returned as they are, without a seq.
+        """
+        if event.get("type") in UNPERSISTED_TYPES:
+            return event
+        async with self._lock:
+            if self._next_seq is None:
+                # A requeued run keeps appending after its previous events
+                self._next_seq = await next_seq(self.run_id)
+            seq = self._next_seq
+            self._pending.append(RunEvent(
+                run_id=self.run_id,
+                seq=seq,
+                type=event.get("type", "log"),
+                payload=event,
+                created_at=timezone.now(),
+            ))
+            self._next_seq += 1
+            full = len(self._pending) >= self.flush_size
+        if full:
+            await self.flush()
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+        return {**event, "seq": seq}
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        # close() cancels the timer; a batch already being written must still land
+        await asyncio.shield(self.flush())
+
+    async def flush(self):
+        async with self._lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            try:
+                with timed_write("run_events"):
+                    await db_writer.bulk_create(RunEvent, batch)
+            except Exception as e:
+                print(f"Run Event Write Error: {e}")
+
+    async def close(self):
+        if self._timer and not self._timer.done():
+            self._timer.cancel()
+        await self.flush()
+
+
+async def load_run_logs(run_id: UUID) -> List[dict]:
+    """Log events of a run in order, in the shape TestRun.logs used to hold."""
+    return await RunEvent.filter(run_id=run_id, type="log").order_by("seq").values_list("payload", flat=True)
+
+
+async def fetch_events(run_id: UUID, after: int = 0, limit: int = 100) -> List[RunEvent]:
+    """Events with seq > after, oldest first (keyset pagination on (run_id, seq))."""
+    return await RunEvent.filter(run_id=run_id, seq__gt=after).order_by("seq").limit(limit)
+
+
+async def iter_events(run_id: UUID, after: int = 0, chunk_size: int = 500) -> AsyncIterator[RunEvent]:
+    """Every event of a run, fetched chunk by chunk so exports never load the whole log."""
+    while True:
+        chunk = await fetch_events(run_id, after, chunk_size)
+        for event in chunk:
+            yield event
+        if len(chunk) < chunk_size:
+            return
+        after = chunk[-1].seq
+
+
+async def migrate_legacy_logs(batch_size: int = 100) -> int:
+    """
+    Move events still stored in TestRun.logs into run_events.
+
+    Runs written before the run_events table existed keep their log in the
+    JSON column. Only those runs are visited, by keyset on id; each is
+    claimed by emptying its column with a conditional update in the same
+    transaction that inserts its events, so API processes starting together
+    never convert a run twice and the migration is cheap to run at every start.
+    """
+    migrated = 0
+    legacy = TestRun.filter(~Q(logs=[])).order_by("id")
+    last_id = None
+    while True:
+        page = legacy.filter(id__gt=last_id) if last_id else legacy
+        run_ids = await page.limit(batch_size).values_list("id", flat=True)
+        if not run_ids:
+            return migrated
+        last_id = run_ids[-1]
+        for run_id in run_ids:
+            if await migrate_run_logs(run_id):
+                migrated += 1
+
+
+async def migrate_run_logs(run_id: UUID) -> bool:
+    """Convert the legacy log of one run; False if another process got to it first."""
+    logs = await TestRun.filter(id=run_id).first().values_list("logs", flat=True)
+    if not logs:
+        return False
+    try:
+        async with in_transaction():
+            claimed = await TestRun.filter(~Q(logs=[]), id=run_id).update(logs=[])
+            if not claimed:
+                return False
+            start = await next_seq(run_id)
+            await RunEvent.bulk_create([
+                RunEvent(
+                    run_id=run_id,
+                    seq=start + index,
+                    type=event.get("type", "log") if isinstance(event, dict) else "log",
+                    payload=event if isinstance(event, dict) else {"type": "log", "data": event},
+                    created_at=timezone.now(),
+                )
+                for index, event in enumerate(logs)
+            ])
+    except IntegrityError:
+        # Lost the race on (run, seq) to a concurrent migration; its transaction holds the events
+        return False
+    return True
@@ -0,0 +1,269 @@
+import asyncio
+import heapq
+from typing import Awaitable, Callable, List, Optional, Sequence, Set
+from uuid import UUID
+
+from tortoise import timezone
+from tortoise.expressions import F, Q
+from tortoise.functions import Count
+
+from backend.app.core.config import settings
+from backend.app.core.recovery import lease_owner_id, recover_orphaned_runs, renew_leases
+from backend.app.models.test_run import TestRun
+from backend.app.models.test_suite import SuiteRun
+
+# Signature of the function that actually executes a claimed run
+RunExecutor = Callable[[UUID, UUID], Awaitable[None]]
+# Called with the id of a run still executing here after its lease was lost
+LeaseLostHandler = Callable[[UUID], None]
+
+
+class QueueFullError(Exception):
+    """Raised when a run is submitted while the pending queue is at capacity."""
+
+    def __init__(self, pending: int, retry_after: float):
+        super().__init__(f"Run queue is full ({pending} pending)")
+        self.pending = pending
+        self.retry_after = retry_after
+
+
+class RunScheduler:
+    """
+    Executes PENDING TestRuns from the database with a bounded pool of workers.
+
+    The database is the queue: runs are created as PENDING and claimed in
+    creation order with an atomic PENDING -> RUNNING update, so the queue
+    survives restarts and several schedulers can share it safely.
+
+    A claimed run is leased to this process and the lease is renewed every
+    `heartbeat_interval` seconds while it executes. The same loop requeues
+    runs whose lease expired because their process died.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue_size: int = 100,
+        poll_interval: float = 2.0,
+        default_run_seconds: float = 60.0,
+        slots: Optional[int] = None,
+        heartbeat_interval: float = 15.0,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 2,
+    ):
+        self.max_workers = max_workers
+        # Runs executing cluster-wide; differs from max_workers when external workers are used
+        self.slots = slots or max_workers
+        self.max_queue_size = max_queue_size
+        self.poll_interval = poll_interval
+        # Exponentially weighted moving average of run durations, used for ETAs
+        self.avg_run_seconds = default_run_seconds
+        self._executor: Optional[RunExecutor] = None
+        self._on_lease_lost: Optional[LeaseLostHandler] = None
+        self._workers: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._running = False
+        self._claim_lock = asyncio.Lock()
+        self.busy_workers = 0
+        self.heartbeat_interval = heartbeat_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.owner = lease_owner_id()
+        # Runs claimed by this scheduler's workers and still executing
+        self._claimed: Set[UUID] = set()
+        self._lease_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    async def start(self, executor: RunExecutor, on_lease_lost: Optional[LeaseLostHandler] = None):
+        if self._running:
+            return
+        self._executor = executor
+        self._on_lease_lost = on_lease_lost
+        self._running = True
+        self._wakeup = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker_loop(i), name=f"run-worker-{i}")
+            for i in range(self.max_workers)
+        ]
+        self._lease_task = asyncio.create_task(self._maintain_leases(), name="run-leases")
+
+    async def stop(self):
+        self._running = False
+        tasks = self._workers + ([self._lease_task] if self._lease_task else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._lease_task = None
+
+    def notify(self):
+        """Wake idle workers after a new run has been queued."""
+        self._wakeup.set()
+
+    async def pending_count(self) -> int:
+        return await TestRun.filter(status="PENDING").count()
+
+    async def admit(self, count: int = 1):
+        """Admission control: refuse new runs once the queue would overflow."""
+        pending = await self.pending_count()
+        if pending + count > self.max_queue_size:
+            raise QueueFullError(pending, retry_after=self.estimate_wait(pending, await self.running_remaining()))
+
+    async def queue_position(self, run: TestRun) -> Optional[int]:
+        """1-based position of a PENDING run in the queue, None otherwise."""
+        if run.status != "PENDING":
+            return None
+        # Same (created_at, id) order as claim_next, so runs created in the same instant get distinct positions
+        ahead = await TestRun.filter(
+            Q(created_at__lt=run.created_at) | Q(created_at=run.created_at, id__lt=run.id), status="PENDING"
+        ).count()
+        return ahead + 1
+
+    async def running_remaining(self) -> List[float]:
+        """Expected seconds left for each RUNNING run, from its start time and the average duration."""
+        now = timezone.now()
+        started = await TestRun.filter(status="RUNNING").values_list("started_at", flat=True)
+        return [
+            max(self.avg_run_seconds - (now - at).total_seconds(), 0.0) if at else self.avg_run_seconds
+            for at in started
+        ]
+
+    def estimate_wait(self, ahead: int, running: Sequence[float] = ()) -> float:
+        """
+        Seconds until a run with `ahead` runs queued before it is expected to start.
+
+        `running` holds the seconds left on runs already executing; each slot
+        takes the next queued run as soon as it frees up.
+        """
+        slots = max(self.slots, 1)
+        # When each slot is next free; idle slots are free now
+        free = sorted(running)[:slots]
+        free += [0.0] * (slots - len(free))
+        heapq.heapify(free)
+        for _ in range(max(ahead, 0)):
+            heapq.heapreplace(free, free[0] + self.avg_run_seconds)
+        return round(free[0], 1)
+
+    async def _saturated_suite_runs(self) -> List[UUID]:
+        """Suite runs already executing as many members as their concurrency allows."""
+        rows = (
+            await TestRun.filter(status="RUNNING", suite_run_id__isnull=False)
+            .annotate(running=Count("id"))
+            .group_by("suite_run_id")
+            .values("suite_run_id", "running")
+        )
+        if not rows:
+            return []
+        running = {row["suite_run_id"]: row["running"] for row in rows}
+        limits = await SuiteRun.filter(id__in=list(running)).values("id", "concurrency")
+        return [row["id"] for row in limits if running[row["id"]] >= row["concurrency"]]
+
+    async def claim_next(self) -> Optional[TestRun]:
+        """Atomically move the oldest eligible PENDING run to RUNNING and return it."""
+        # The lock keeps workers of this process from overshooting suite concurrency together
+        async with self._claim_lock:
+            query = TestRun.filter(status="PENDING")
+            saturated = await self._saturated_suite_runs()
+            if saturated:
+                # NOT IN alone would also drop standalone runs (NULL suite_run_id)
+                query = query.filter(Q(suite_run_id__isnull=True) | ~Q(suite_run_id__in=saturated))
+            candidates = await query.order_by("created_at", "id").limit(self.max_workers)
+            for run in candidates:
+                now = timezone.now()
+                claimed = await TestRun.filter(id=run.id, status="PENDING").update(
+                    status="RUNNING",
+                    started_at=now,
+                    lease_owner=self.owner,
+                    heartbeat_at=now,
+                    attempts=F("attempts") + 1,
+                )
+                if claimed:
+                    run.status = "RUNNING"
+                    run.started_at = now
+                    run.lease_owner = self.owner
+                    run.heartbeat_at = now
+                    run.attempts += 1
+                    return run
+            return None
+
+    def record_duration(self, seconds: float, weight: float = 0.2):
+        self.avg_run_seconds = (1 - weight) * self.avg_run_seconds + weight * seconds
+
+    async def heartbeat(self):
+        """Renew the leases of our runs, then take over runs whose worker stopped renewing."""
+        lost = await renew_leases(self.owner, self._claimed)
+        for run_id in lost:
+            # Finished, stopped, or requeued after we stalled; in the last case it may already run elsewhere
+            self._claimed.discard(run_id)
+            if self._on_lease_lost:
+                self._on_lease_lost(run_id)
+        recovered = await recover_orphaned_runs(self.lease_seconds, self.max_attempts)
+        if recovered["requeued"]:
+            self.notify()
+
+    async def _maintain_leases(self):
+        while self._running:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.heartbeat()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Scheduler heartbeat failed: {e}")
+
+    async def _wait_for_work(self):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _worker_loop(self, index: int):
+        while self._running:
+            try:
+                run = await self.claim_next()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Scheduler worker {index} failed to claim a run: {e}")
+                run = None
+
+            if run is None:
+                await self._wait_for_work()
+                continue
+
+            self.busy_workers += 1
+            self._claimed.add(run.id)
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            try:
+                await self._executor(run.id, run.case_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Scheduler worker {index} run {run.id} crashed: {e}")
+            finally:
+                self.busy_workers -= 1
+                self._claimed.discard(run.id)
+                self.record_duration(loop.time() - started)
+
+
+def build_scheduler(max_workers: Optional[int] = None) -> RunScheduler:
+    config = settings.scheduler
+    max_workers = max_workers or config.max_workers
+    slots = max_workers if config.mode == "inline" else max_workers * config.worker_processes
+    return RunScheduler(
+        max_workers=max_workers,
+        max_queue_size=config.max_queue_size,
+        poll_interval=config.poll_interval,
+        default_run_seconds=config.default_run_seconds,
+        slots=slots,
+        heartbeat_interval=config.heartbeat_interval,
+        lease_seconds=config.lease_seconds,
+        max_attempts=config.max_attempts,
+    )
+
+scheduler = build_scheduler()
@@ -1,31 +1,261 @@
-from typing import Dict, List
+import asyncio
+import base64
+import json
+import struct
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Deque, Dict, Optional
 from fastapi import WebSocket
 
+from backend.app.core.config import settings
+from backend.app.core.metrics import WS_EVICTIONS, WS_MESSAGES_DROPPED, WS_MESSAGES_SENT
+
+def encode_frame(message: dict) -> bytes:
+    """
+    Binary WebSocket frame for a screenshot event: a 4-byte big-endian header
+    length, the JSON header (the event without its image) and the JPEG bytes.
+    """
+    data = dict(message["data"])
+    image = base64.b64decode(data.pop("thumbnail"))
+    header = json.dumps({**message, "data": data}).encode("utf-8")
+    return struct.pack(">I", len(header)) + header + image
+
+def is_binary(message: dict) -> bool:
+    # Thumbnails travel base64-encoded between processes and as raw bytes to browsers
+    data = message.get("data")
+    return message.get("type") == "screenshot" and isinstance(data, dict) and "thumbnail" in data
+
+@dataclass
+class _Channel:
+    """Last seq and recent history of one broadcast channel (run or suite)."""
+    buffer: Deque[dict]
+    seq: int = 0
+    # Highest seq pushed out of the buffer (or never received); clients behind it cannot be replayed
+    evicted_seq: int = 0
+    # Latest unsequenced message of each type (screenshot, budget, suite progress), replayed as current state
+    state: Dict[str, dict] = field(default_factory=dict)
+
+class _Subscriber:
+    """
+    One WebSocket with its own bounded outbound queue, drained by its own task.
+
+    Producers only enqueue, so a slow client never blocks a broadcast. A new
+    screenshot replaces one still waiting in the queue; when the queue is full
+    the oldest message is dropped (and the client told to resync) or, with the
+    "disconnect" policy, the client is evicted.
+    """
+
+    def __init__(self, manager: "ConnectionManager", channel: str, websocket: WebSocket):
+        self.manager = manager
+        self.channel = channel
+        self.websocket = websocket
+        self.queue: Deque[dict] = deque()
+        self.wakeup = asyncio.Event()
+        # Set when log events were dropped; the client must reload what it missed
+        self.lagged = False
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self.task = asyncio.create_task(self._drain())
+
+    def put(self, message: dict, force: bool = False):
+        manager = self.manager
+        if message.get("type") == "screenshot":
+            for queued in self.queue:
+                if queued.get("type") == "screenshot":
+                    self.queue.remove(queued)
+                    manager.coalesced += 1
+                    WS_MESSAGES_DROPPED.inc(reason="coalesced")
+                    break
+        if not force and len(self.queue) >= manager.send_queue_size:
+            if manager.slow_consumer_policy == "disconnect":
+                manager._evict(self)
+                return
+            dropped = self.queue.popleft()
+            manager.dropped += 1
+            WS_MESSAGES_DROPPED.inc(reason="overflow")
+            if dropped.get("type") != "screenshot":
+                self.lagged = True
+        self.queue.append(message)
+        manager.max_queue_depth = max(manager.max_queue_depth, len(self.queue))
+        self.wakeup.set()
+
+    async def _drain(self):
+        while True:
+            if not self.queue:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+            message = self.queue.popleft()
+            try:
+                if self.lagged:
+                    self.lagged = False
+                    await self._send({"type": "resync", "data": {"seq": message.get("seq", 1) - 1}})
+                await self._send(message)
+                WS_MESSAGES_SENT.inc()
+            except Exception:
+                self.manager._evict(self)
+                return
+
+    async def _send(self, message: dict):
+        if is_binary(message):
+            send = self.websocket.send_bytes(encode_frame(message))
+        else:
+            send = self.websocket.send_json(message)
+        await asyncio.wait_for(send, timeout=self.manager.send_timeout)
+
+    def stop(self):
+        if self.task and self.task is not asyncio.current_task():
+            self.task.cancel()
+
 class ConnectionManager:
-    def __init__(self):
-        # run_id -> List[WebSocket]
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+    def __init__(self, buffer_size: int = 500, max_channels: int = 200, send_queue_size: int = 256,
+                 slow_consumer_policy: str = "drop_oldest", send_timeout: float = 10.0):
+        # run_id -> {WebSocket: _Subscriber}
+        self.active_connections: Dict[str, Dict[WebSocket, _Subscriber]] = {}
+        # Optional hook receiving every broadcast, e.g. to forward events from a worker process to the API
+        self.relay: Optional[Callable[[str, dict], Awaitable[None]]] = None
+        # Cross-process event bus (app.core.event_bus), set at startup when one is configured
+        self.bus = None
+        self.buffer_size = buffer_size
+        self.max_channels = max_channels
+        self.send_queue_size = send_queue_size
+        self.slow_consumer_policy = slow_consumer_policy
+        self.send_timeout = send_timeout
+        # Least recently used channels are forgotten first
+        self._channels: "OrderedDict[str, _Channel]" = OrderedDict()
+        self.dropped = 0
+        self.coalesced = 0
+        self.evicted = 0
+        self.max_queue_depth = 0
 
-    async def connect(self, run_id: str, websocket: WebSocket):
+    def _channel(self, run_id: str) -> _Channel:
+        channel = self._channels.get(run_id)
+        if channel is None:
+            channel = _Channel(buffer=deque(maxlen=self.buffer_size))
+            self._channels[run_id] = channel
+            while len(self._channels) > self.max_channels:
+                self._channels.popitem(last=False)
+        else:
+            self._channels.move_to_end(run_id)
+        return channel
+
+    def last_seq(self, run_id: str) -> int:
+        channel = self._channels.get(run_id)
+        return channel.seq if channel else 0
+
+    async def connect(self, run_id: str, websocket: WebSocket, since: Optional[int] = None):
+        """
+        Accept and subscribe a socket. With `since`, buffered events with a
+        greater seq are queued first; if some were already dropped from the
+        buffer (or the server restarted) a `resync` event tells the client to
+        reload the run through the REST API instead.
+        """
         await websocket.accept()
-        if run_id not in self.active_connections:
-            self.active_connections[run_id] = []
-        self.active_connections[run_id].append(websocket)
+        subscriber = _Subscriber(self, run_id, websocket)
+        # No await until subscribed, so no broadcast can slip in between replay and subscription
+        if since is not None:
+            self._replay(self._channel(run_id), subscriber, since)
+        self.active_connections.setdefault(run_id, {})[websocket] = subscriber
+        subscriber.start()
+
+    def _replay(self, channel: _Channel, subscriber: _Subscriber, since: int):
+        if since > channel.seq or since < channel.evicted_seq:
+            subscriber.put({"type": "resync", "data": {"seq": channel.seq}}, force=True)
+            since = channel.evicted_seq
+        for message in channel.buffer:
+            if message["seq"] > since:
+                subscriber.put(message, force=True)
+        for message in channel.state.values():
+            subscriber.put(message, force=True)
+
+    def send_personal(self, run_id: str, websocket: WebSocket, message: dict):
+        """Queue a message for one socket only, in order with its broadcasts."""
+        subscriber = self.active_connections.get(run_id, {}).get(websocket)
+        if subscriber:
+            subscriber.put(message, force=True)
 
     def disconnect(self, run_id: str, websocket: WebSocket):
         if run_id in self.active_connections:
-            if websocket in self.active_connections[run_id]:
-                self.active_connections[run_id].remove(websocket)
+            subscriber = self.active_connections[run_id].pop(websocket, None)
+            if subscriber:
+                subscriber.stop()
             if not self.active_connections[run_id]:
                 del self.active_connections[run_id]
 
+    def _evict(self, subscriber: _Subscriber):
+        # Dead or hopelessly slow client: stop feeding it and close the socket
+        self.evicted += 1
+        WS_EVICTIONS.inc()
+        self.disconnect(subscriber.channel, subscriber.websocket)
+        asyncio.create_task(self._close(subscriber.websocket))
+
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+    def deliver(self, run_id: str, message: dict):
+        """
+        Fan a message out to this process's sockets only (used for events from other processes).
+
+        Events carry the seq their producer gave them (RunEvent.seq for run
+        events) and are never renumbered, so every process agrees on them.
+        One already recorded is dropped; one past a gap makes subscribers
+        resync, since the events in between never reached this process.
+        Messages without a seq are current state rather than history.
+        """
+        channel = self._channel(run_id)
+        subscribers = list(self.active_connections.get(run_id, {}).values())
+        seq = message.get("seq")
+        if not isinstance(seq, int):
+            channel.state[message.get("type")] = message
+        elif seq <= channel.seq:
+            return
+        else:
+            if seq > channel.seq + 1:
+                channel.buffer.clear()
+                channel.evicted_seq = seq - 1
+                for subscriber in subscribers:
+                    subscriber.put({"type": "resync", "data": {"seq": seq - 1}}, force=True)
+            channel.seq = seq
+            if len(channel.buffer) == channel.buffer.maxlen:
+                channel.evicted_seq = channel.buffer[0]["seq"]
+            channel.buffer.append(message)
+        for subscriber in subscribers:
+            subscriber.put(message)
+
     async def broadcast(self, run_id: str, message: dict):
-        if run_id in self.active_connections:
-            for connection in self.active_connections[run_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    # Handle disconnected clients gracefully if needed
-                    pass
-
-manager = ConnectionManager()
+        """Send a message to every process's sockets; run events must already carry their seq."""
+        if self.relay:
+            await self.relay(run_id, message)
+        self.deliver(run_id, message)
+        if self.bus:
+            await self.bus.publish(run_id, message)
+
+    def stats(self) -> dict:
+        channels = {}
+        for run_id, subscribers in self.active_connections.items():
+            depths = [len(subscriber.queue) for subscriber in subscribers.values()]
+            channels[run_id] = {"connections": len(depths), "queued": sum(depths), "max_depth": max(depths)}
+        return {
+            "connections": sum(c["connections"] for c in channels.values()),
+            "queued": sum(c["queued"] for c in channels.values()),
+            "max_queue_depth": self.max_queue_depth,
+            "send_queue_size": self.send_queue_size,
+            "slow_consumer_policy": self.slow_consumer_policy,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "evicted": self.evicted,
+            "channels": channels,
+        }
+
+manager = ConnectionManager(
+    buffer_size=settings.websocket.buffer_size,
+    max_channels=settings.websocket.max_buffered_channels,
+    send_queue_size=settings.websocket.send_queue_size,
+    slow_consumer_policy=settings.websocket.slow_consumer_policy,
+    send_timeout=settings.websocket.send_timeout,
+)
@@ -0,0 +1,67 @@
+from typing import Optional
+from uuid import UUID
+
+from tortoise import timezone
+from tortoise.functions import Count
+
+from backend.app.core.socket_manager import manager
+from backend.app.models.test_run import TestRun
+from backend.app.models.test_suite import SuiteRun
+
+FINISHED_STATUSES = ("PASSED", "FAILED", "STOPPED")
+
+def suite_channel(suite_run_id) -> str:
+    """WebSocket channel carrying aggregate progress for one suite run."""
+    return f"suite:{suite_run_id}"
+
+def suite_progress(suite_run: SuiteRun) -> dict:
+    return {
+        "suite_run_id": str(suite_run.id),
+        "status": suite_run.status,
+        "total": suite_run.total,
+        "passed": suite_run.passed,
+        "failed": suite_run.failed,
+        "stopped": suite_run.stopped,
+        "finished": suite_run.passed + suite_run.failed + suite_run.stopped,
+    }
+
+async def refresh_suite_run(suite_run_id: UUID) -> Optional[SuiteRun]:
+    """
+    Recompute a suite run's counters from its member runs and broadcast them.
+
+    Counting from the database (instead of incrementing) keeps the aggregate
+    correct when several members finish at the same time.
+    """
+    suite_run = await SuiteRun.get_or_none(id=suite_run_id)
+    if not suite_run:
+        return None
+
+    rows = (
+        await TestRun.filter(suite_run_id=suite_run_id)
+        .annotate(count=Count("id"))
+        .group_by("status")
+        .values("status", "count")
+    )
+    counts = {row["status"]: row["count"] for row in rows}
+    suite_run.passed = counts.get("PASSED", 0)
+    suite_run.failed = counts.get("FAILED", 0)
+    suite_run.stopped = counts.get("STOPPED", 0)
+    finished = sum(counts.get(status, 0) for status in FINISHED_STATUSES)
+
+    if finished >= suite_run.total:
+        if suite_run.failed:
+            suite_run.status = "FAILED"
+        elif suite_run.stopped:
+            suite_run.status = "STOPPED"
+        else:
+            suite_run.status = "PASSED"
+        if not suite_run.finished_at:
+            suite_run.finished_at = timezone.now()
+    elif finished or counts.get("RUNNING"):
+        suite_run.status = "RUNNING"
+    else:
+        suite_run.status = "PENDING"
+
+    await suite_run.save()
+    await manager.broadcast(suite_channel(suite_run.id), {"type": "suite_progress", "data": suite_progress(suite_run)})
+    return suite_run
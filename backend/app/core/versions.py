@@ -0,0 +1,24 @@
+from tortoise.expressions import F
+
+from backend.app.models.version import ResourceVersion
+
+CASES = "test_cases"
+
+
+async def get_version(name: str) -> int:
+    version = await ResourceVersion.filter(name=name).first().values_list("version", flat=True)
+    return version or 0
+
+
+async def bump_version(name: str):
+    """
+    Mark the collection as changed.
+
+    The counter lives in the database rather than in memory so that every
+    API process sees the same version, and none answers 304 for a listing
+    another process has modified.
+    """
+    updated = await ResourceVersion.filter(name=name).update(version=F("version") + 1)
+    if not updated:
+        # First write; a concurrent creator wins the row, either way the version moved past 0
+        await ResourceVersion.get_or_create(name=name, defaults={"version": 1})
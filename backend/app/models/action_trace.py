@@ -0,0 +1,18 @@
+import uuid
+
+from tortoise import fields, models
+
+
+class ActionTrace(models.Model):
+    """Browser-use action history of a successful run, replayable without the LLM."""
+    id = fields.UUIDField(pk=True, default=uuid.uuid4)
+    case = fields.ForeignKeyField("models.TestCase", related_name="traces")
+    run = fields.ForeignKeyField("models.TestRun", related_name="traces", null=True, on_delete=fields.SET_NULL)
+    # Hash of the case URL and steps at record time; a trace is stale once the case changes
+    fingerprint = fields.CharField(max_length=64)
+    history = fields.JSONField()
+    action_count = fields.IntField(default=0)
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "action_traces"
@@ -0,0 +1,25 @@
+import uuid
+
+from tortoise import fields, models
+
+
+class Artifact(models.Model):
+    """A stored file, addressed by the sha256 of its content."""
+    hash = fields.CharField(max_length=64, pk=True)
+    content_type = fields.CharField(max_length=100)
+    size = fields.IntField()
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "artifacts"
+
+class RunArtifact(models.Model):
+    """Reference from a run to an artifact; identical files are stored once."""
+    id = fields.UUIDField(pk=True, default=uuid.uuid4)
+    run = fields.ForeignKeyField("models.TestRun", related_name="artifacts", on_delete=fields.CASCADE)
+    artifact = fields.ForeignKeyField("models.Artifact", related_name="references", on_delete=fields.CASCADE)
+    kind = fields.CharField(max_length=20)  # screenshot, ...
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "run_artifacts"
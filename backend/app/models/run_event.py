@@ -0,0 +1,17 @@
+from tortoise import fields, models
+
+
+class RunEvent(models.Model):
+    """One event of a run (log line, status change, error), appended in batches."""
+    id = fields.BigIntField(pk=True)
+    run = fields.ForeignKeyField("models.TestRun", related_name="events", on_delete=fields.CASCADE)
+    # Position of the event within its run, starting at 1
+    seq = fields.IntField()
+    type = fields.CharField(max_length=20)
+    # The event exactly as broadcast ({"type": ..., "data": ...})
+    payload = fields.JSONField()
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "run_events"
+        unique_together = (("run", "seq"),)
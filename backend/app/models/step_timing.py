@@ -0,0 +1,21 @@
+from tortoise import fields, models
+
+
+class StepTiming(models.Model):
+    """Where the time of one agent step went (see app.agent.timing)."""
+    id = fields.BigIntField(pk=True)
+    run = fields.ForeignKeyField("models.TestRun", related_name="timings", on_delete=fields.CASCADE)
+    step = fields.IntField()
+    started_at = fields.DatetimeField()
+    duration_ms = fields.FloatField()
+    llm_calls = fields.IntField(default=0)
+    input_tokens = fields.IntField(default=0)
+    output_tokens = fields.IntField(default=0)
+    # Screenshot sent to the LLM at this step; None when browser-use decided
+    vision = fields.BooleanField(null=True)
+    # [{"name", "start_ms", "duration_ms"}], offsets relative to the step start
+    spans = fields.JSONField(default=list)
+
+    class Meta:
+        table = "step_timings"
+        unique_together = (("run", "step"),)
@@ -5,7 +5,15 @@ class TestCase(models.Model):
     id = fields.UUIDField(pk=True, default=uuid.uuid4)
     name = fields.CharField(max_length=255)
     url = fields.CharField(max_length=2048)
-    created_at = fields.DatetimeField(auto_now_add=True)
+    # Run budget overrides; None falls back to the `budget` section of config.yaml
+    max_steps = fields.IntField(null=True)
+    max_tokens = fields.IntField(null=True)
+    max_seconds = fields.FloatField(null=True)
+    max_cost = fields.FloatField(null=True)
+    # Screenshot policy (app.agent.vision); None uses `vision.policy` from config.yaml
+    vision_policy = fields.CharField(max_length=20, null=True)
+    # Case listings are keyset-paginated on (created_at, id)
+    created_at = fields.DatetimeField(auto_now_add=True, db_index=True)
     
     steps: fields.ReverseRelation["TestStep"]
     runs: fields.ReverseRelation["TestRun"]
@@ -19,6 +27,8 @@ class TestStep(models.Model):
     order = fields.IntField()
     instruction = fields.TextField()
     expected_result = fields.TextField(null=True)
+    # Overrides the case's vision policy while the agent works on this step
+    vision_policy = fields.CharField(max_length=20, null=True)
 
     class Meta:
         table = "test_steps"
@@ -4,10 +4,21 @@ import uuid
 class TestRun(models.Model):
     id = fields.UUIDField(pk=True, default=uuid.uuid4)
     case = fields.ForeignKeyField("models.TestCase", related_name="runs")
-    status = fields.CharField(max_length=50, default="PENDING")  # PENDING, RUNNING, PASSED, FAILED
+    suite_run = fields.ForeignKeyField("models.SuiteRun", related_name="runs", null=True)
+    status = fields.CharField(max_length=50, default="PENDING")  # PENDING, RUNNING, PASSED, FAILED, STOPPED
+    mode = fields.CharField(max_length=20, default="agent")  # agent, replay
     logs = fields.JSONField(default=list)
     result_summary = fields.TextField(null=True)
     created_at = fields.DatetimeField(auto_now_add=True)
+    started_at = fields.DatetimeField(null=True)
+    finished_at = fields.DatetimeField(null=True)
+    # Lease of the scheduler executing the run, renewed by its heartbeat; see core/recovery.py
+    lease_owner = fields.CharField(max_length=255, null=True)
+    heartbeat_at = fields.DatetimeField(null=True)
+    # Times the run has been claimed, i.e. started and possibly requeued after its worker died
+    attempts = fields.IntField(default=0)
 
     class Meta:
         table = "test_runs"
+        # Run history per case and by status, both listed newest first with keyset pagination
+        indexes = (("case", "created_at"), ("status", "created_at"))
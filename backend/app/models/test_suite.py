@@ -0,0 +1,36 @@
+import uuid
+from typing import TYPE_CHECKING
+
+from tortoise import fields, models
+
+if TYPE_CHECKING:
+    from backend.app.models.test_run import TestRun
+
+class TestSuite(models.Model):
+    id = fields.UUIDField(pk=True, default=uuid.uuid4)
+    name = fields.CharField(max_length=255)
+    description = fields.TextField(null=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+    cases = fields.ManyToManyField("models.TestCase", related_name="suites", through="test_suite_cases")
+
+    suite_runs: fields.ReverseRelation["SuiteRun"]
+
+    class Meta:
+        table = "test_suites"
+
+class SuiteRun(models.Model):
+    id = fields.UUIDField(pk=True, default=uuid.uuid4)
+    suite = fields.ForeignKeyField("models.TestSuite", related_name="suite_runs")
+    status = fields.CharField(max_length=50, default="PENDING")  # PENDING, RUNNING, PASSED, FAILED, STOPPED
+    concurrency = fields.IntField(default=1)
+    total = fields.IntField(default=0)
+    passed = fields.IntField(default=0)
+    failed = fields.IntField(default=0)
+    stopped = fields.IntField(default=0)
+    created_at = fields.DatetimeField(auto_now_add=True)
+    finished_at = fields.DatetimeField(null=True)
+
+    runs: fields.ReverseRelation["TestRun"]
+
+    class Meta:
+        table = "suite_runs"
@@ -0,0 +1,10 @@
+from tortoise import fields, models
+
+
+class ResourceVersion(models.Model):
+    # Change counter of a collection, bumped on every write; listings derive their ETag from it
+    name = fields.CharField(max_length=50, pk=True)
+    version = fields.IntField(default=0)
+
+    class Meta:
+        table = "resource_versions"
@@ -1,12 +1,16 @@
-from pydantic import BaseModel, ConfigDict
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, List, Literal, Optional
 from uuid import UUID
 from datetime import datetime
 
+# When the LLM is shown the screenshot, see app.agent.vision.VisionPolicy
+VisionPolicyName = Literal["never", "verification", "on_failure", "always", "auto"]
+
 class TestStepBase(BaseModel):
     order: int
     instruction: str
     expected_result: Optional[str] = None
+    vision_policy: Optional[VisionPolicyName] = None
 
 class TestStepCreate(TestStepBase):
     pass
@@ -20,6 +24,12 @@ class TestStepRead(TestStepBase):
 class TestCaseBase(BaseModel):
     name: str
     url: str
+    # Run budget overrides, see BudgetConfig
+    max_steps: Optional[int] = Field(None, ge=1)
+    max_tokens: Optional[int] = Field(None, ge=0)
+    max_seconds: Optional[float] = Field(None, ge=0)
+    max_cost: Optional[float] = Field(None, ge=0)
+    vision_policy: Optional[VisionPolicyName] = None
 
 class TestCaseCreate(TestCaseBase):
     steps: List[TestStepCreate] = []
@@ -41,3 +51,14 @@ class GenerateStepsRequest(BaseModel):
 class GenerateStepsResponse(BaseModel):
     name: str
     steps: List[TestStepCreate]
+
+class BulkCaseError(BaseModel):
+    # Position of the item in the submitted array or NDJSON stream, from 0
+    index: int
+    errors: List[Any]
+
+class BulkImportResult(BaseModel):
+    created: int
+    failed: int
+    ids: List[UUID] = []
+    errors: List[BulkCaseError] = []
@@ -1,20 +1,111 @@
 from pydantic import BaseModel
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any, Literal
 from uuid import UUID
 from datetime import datetime
 
+# agent: the LLM drives every step; replay: re-execute the last recorded trace, LLM as fallback
+RunMode = Literal["agent", "replay"]
+
 class TestRunBase(BaseModel):
     status: str = "PENDING"
-    logs: List[Any] = []
+    mode: str = "agent"
     result_summary: Optional[str] = None
 
 class TestRunCreate(BaseModel):
     case_id: UUID
+    mode: RunMode = "agent"
 
-class TestRunRead(TestRunBase):
+class TestRunSummary(TestRunBase):
     id: UUID
     case_id: UUID
     created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    attempts: int = 0
+    # Only set while the run is PENDING in the scheduler queue
+    queue_position: Optional[int] = None
+    eta_seconds: Optional[float] = None
 
     class Config:
         from_attributes = True
+
+class TestRunRead(TestRunSummary):
+    logs: List[Any] = []
+
+class RunPage(BaseModel):
+    items: List[TestRunSummary]
+    # Pass as `cursor` to fetch the next page; null on the last page
+    next_cursor: Optional[str] = None
+
+class RunEventRead(BaseModel):
+    seq: int
+    type: str
+    data: Any = None
+    created_at: datetime
+
+class RunEventPage(BaseModel):
+    items: List[RunEventRead]
+    # Pass as `after` to fetch the next page; null once the end of the log is reached
+    next_after: Optional[int] = None
+
+class RunArtifactRead(BaseModel):
+    # Served by GET /api/artifacts/{hash}
+    hash: str
+    kind: str
+    content_type: str
+    size: int
+    created_at: datetime
+
+class TimingSpan(BaseModel):
+    # browser_state, llm, actions, screenshot, persist or broadcast
+    name: str
+    start_ms: float
+    duration_ms: float
+
+class StepTimingRead(BaseModel):
+    step: int
+    started_at: datetime
+    # From the start of the first step
+    offset_ms: float
+    duration_ms: float
+    llm_calls: int
+    input_tokens: int
+    output_tokens: int
+    vision: Optional[bool] = None
+    # Milliseconds per span name, plus "other" for time outside any span
+    totals: Dict[str, float]
+    spans: List[TimingSpan]
+
+class VisionSavings(BaseModel):
+    steps_with_screenshot: int
+    steps_without_screenshot: int
+    # Steps where browser-use decided (vision policy "auto")
+    steps_auto: int
+    image_tokens_per_call: int
+    # False when image_tokens_per_call is the configured estimate
+    measured: bool
+    # Compared to sending the screenshot at every step
+    estimated_tokens_saved: int
+
+class TimingSummary(BaseModel):
+    steps: int
+    total_ms: float
+    mean_step_ms: float
+    slowest_step: Optional[int] = None
+    llm_calls: int
+    input_tokens: int
+    output_tokens: int
+    totals: Dict[str, float]
+    # Fraction of total step time per span name
+    shares: Dict[str, float]
+    vision: VisionSavings
+
+class RunTimings(BaseModel):
+    run_id: UUID
+    steps: List[StepTimingRead]
+    summary: TimingSummary
+
+class PublishedEvent(BaseModel):
+    # Event forwarded by a worker process: channel is a run id or suite channel
+    channel: str
+    message: dict
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.app.schemas.test_run import RunMode
+
+
+class TestSuiteBase(BaseModel):
+    name: str
+    description: Optional[str] = None
+
+class TestSuiteCreate(TestSuiteBase):
+    case_ids: List[UUID] = []
+
+class TestSuiteUpdate(TestSuiteBase):
+    case_ids: List[UUID] = []
+
+class TestSuiteRead(TestSuiteBase):
+    id: UUID
+    created_at: datetime
+    case_ids: List[UUID] = []
+
+class SuiteRunCreate(BaseModel):
+    # Member runs allowed to execute at once; defaults to scheduler.default_suite_concurrency
+    concurrency: Optional[int] = Field(default=None, ge=1)
+    mode: RunMode = "agent"
+
+class SuiteMemberRun(BaseModel):
+    id: UUID
+    case_id: UUID
+    status: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+class SuiteRunRead(BaseModel):
+    id: UUID
+    suite_id: UUID
+    status: str
+    concurrency: int
+    total: int
+    passed: int
+    failed: int
+    stopped: int
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    runs: List[SuiteMemberRun] = []
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,97 @@
+"""
+Bulk case import and export throughput.
+
+Usage (from the project root):
+    python -m backend.benchmarks.case_import --cases 10000 --steps 5
+
+Imports generated cases into a fresh SQLite file (tuned settings from
+config.yaml) through the bulk path used by `POST /api/cases/bulk`, then
+streams them back like `GET /api/cases/export`. For comparison, the first
+`--baseline-cases` are also inserted one row at a time, the way
+`POST /api/cases` used to create a case and each of its steps.
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from tortoise import Tortoise
+
+from backend.app.core.bulk_cases import import_cases, iter_case_exports
+from backend.app.core.database import MODELS, sqlite_connection
+from backend.app.models.test_case import TestCase, TestStep
+
+
+def generate_cases(count: int, steps: int):
+    for i in range(count):
+        yield {
+            "name": f"Case {i}",
+            "url": f"https://example.com/page/{i}",
+            "steps": [
+                {"order": n + 1, "instruction": f"Click button {n + 1}", "expected_result": f"Panel {n + 1} opens"}
+                for n in range(steps)
+            ],
+        }
+
+
+async def as_stream(items):
+    for item in items:
+        yield item
+
+
+async def rowwise_import(count: int, steps: int) -> float:
+    started = time.perf_counter()
+    for item in generate_cases(count, steps):
+        case = await TestCase.create(name=item["name"], url=item["url"])
+        for step in item["steps"]:
+            await TestStep.create(case=case, **step)
+    return time.perf_counter() - started
+
+
+async def main(cases: int, steps: int, chunk_size: int, baseline_cases: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        config = {
+            "connections": {"default": sqlite_connection(Path(tmp) / "bench.db")},
+            "apps": {"models": {"models": MODELS, "default_connection": "default"}},
+        }
+        await Tortoise.init(config=config)
+        await Tortoise.generate_schemas()
+        try:
+            print(f"{cases} cases x {steps} steps, chunks of {chunk_size}")
+            if baseline_cases:
+                elapsed = await rowwise_import(baseline_cases, steps)
+                rate = baseline_cases / elapsed
+                print(f"  row by row: {rate:>8.0f} cases/s ({baseline_cases} cases in {elapsed:.2f}s)")
+                await TestStep.all().delete()
+                await TestCase.all().delete()
+
+            started = time.perf_counter()
+            result = await import_cases(as_stream(generate_cases(cases, steps)), chunk_size)
+            elapsed = time.perf_counter() - started
+            assert result.created == cases and not result.errors, result.errors[:3]
+            print(f"  bulk:       {cases / elapsed:>8.0f} cases/s ({cases} cases in {elapsed:.2f}s)")
+
+            started = time.perf_counter()
+            exported = 0
+            async for _ in iter_case_exports(chunk_size):
+                exported += 1
+            elapsed = time.perf_counter() - started
+            assert exported == cases
+            print(f"  export:     {exported / elapsed:>8.0f} cases/s ({exported} cases in {elapsed:.2f}s)")
+        finally:
+            await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark bulk case import and export")
+    parser.add_argument("--cases", type=int, default=10000, help="cases imported through the bulk path")
+    parser.add_argument("--steps", type=int, default=5, help="steps per case")
+    parser.add_argument("--chunk-size", type=int, default=500, help="cases per transaction")
+    parser.add_argument("--baseline-cases", type=int, default=1000,
+                        help="cases inserted row by row for comparison (0 skips)")
+    args = parser.parse_args()
+    asyncio.run(main(args.cases, args.steps, args.chunk_size, args.baseline_cases))
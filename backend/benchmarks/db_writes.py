@@ -0,0 +1,127 @@
+"""
+Run-event write throughput under concurrent runs.
+
+Usage (from the project root):
+    python -m backend.benchmarks.db_writes --runs 8 --events 2000
+
+Simulates N runs flushing their event batches while a reader polls like
+`GET /api/cases`. It reports inserted events per second and reader latency
+for SQLite's defaults (rollback journal, synchronous FULL, each run writing
+its own transactions) and for the tuned settings from config.yaml with the
+dedicated writer. Each scenario uses a fresh database file in a temporary
+directory.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from tortoise import Tortoise, timezone
+
+from backend.app.core.database import MODELS, WRITER_CONNECTION, sqlite_connection
+from backend.app.core.db_writer import DBWriter
+from backend.app.models.run_event import RunEvent
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+
+DEFAULT_PRAGMAS = {"journal_mode": "DELETE", "synchronous": "FULL", "busy_timeout": 5000}
+
+
+def scenario_config(path: Path, tuned: bool) -> dict:
+    if tuned:
+        connections = {"default": sqlite_connection(path), WRITER_CONNECTION: sqlite_connection(path)}
+    else:
+        connections = {
+            "default": {
+                "engine": "tortoise.backends.sqlite",
+                "credentials": {"file_path": str(path), **DEFAULT_PRAGMAS},
+            },
+        }
+    return {"connections": connections, "apps": {"models": {"models": MODELS, "default_connection": "default"}}}
+
+
+async def simulate_run(run_id, events: int, flush_size: int, writer) -> None:
+    for start in range(1, events + 1, flush_size):
+        batch = [
+            RunEvent(
+                run_id=run_id,
+                seq=seq,
+                type="log",
+                payload={"type": "log", "data": f"step {seq}"},
+                created_at=timezone.now(),
+            )
+            for seq in range(start, min(start + flush_size, events + 1))
+        ]
+        if writer:
+            await writer.bulk_create(RunEvent, batch)
+        else:
+            await RunEvent.bulk_create(batch)
+        # Yield like a run does between agent steps
+        await asyncio.sleep(0)
+
+
+async def poll_reads(stop: asyncio.Event, latencies: list) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await TestCase.all().limit(50)
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.01)
+
+
+async def run_scenario(name: str, tuned: bool, runs: int, events: int, flush_size: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        await Tortoise.init(config=scenario_config(Path(tmp) / "bench.db", tuned))
+        await Tortoise.generate_schemas()
+        try:
+            case = await TestCase.create(name="Benchmark", url="http://bench.local")
+            run_ids = [(await TestRun.create(case=case, status="RUNNING")).id for _ in range(runs)]
+            writer = DBWriter() if tuned else None
+
+            stop = asyncio.Event()
+            latencies: list = []
+            reader = asyncio.create_task(poll_reads(stop, latencies))
+            started = time.perf_counter()
+            await asyncio.gather(*(simulate_run(run_id, events, flush_size, writer) for run_id in run_ids))
+            elapsed = time.perf_counter() - started
+            stop.set()
+            await reader
+            if writer:
+                await writer.close()
+
+            written = await RunEvent.all().count()
+            assert written == runs * events, f"expected {runs * events} events, found {written}"
+            return {
+                "scenario": name,
+                "events_per_second": written / elapsed,
+                "seconds": elapsed,
+                "transactions": writer.transactions if writer else runs * -(-events // flush_size),
+                "read_p50_ms": statistics.median(latencies) if latencies else 0.0,
+                "read_max_ms": max(latencies, default=0.0),
+            }
+        finally:
+            await Tortoise.close_connections()
+
+
+async def main(runs: int, events: int, flush_size: int):
+    print(f"{runs} concurrent runs x {events} events, flushed every {flush_size} events")
+    for name, tuned in (("sqlite defaults", False), ("tuned + writer", True)):
+        result = await run_scenario(name, tuned, runs, events, flush_size)
+        print(
+            f"{result['scenario']:>16}: {result['events_per_second']:>9.0f} events/s "
+            f"in {result['seconds']:.2f}s, {result['transactions']} transactions, "
+            f"reads p50 {result['read_p50_ms']:.1f} ms / max {result['read_max_ms']:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark run-event writes under concurrent runs")
+    parser.add_argument("--runs", type=int, default=8, help="concurrent runs")
+    parser.add_argument("--events", type=int, default=2000, help="events written by each run")
+    parser.add_argument("--flush-size", type=int, default=50, help="events per flush, like run_events.flush_size")
+    args = parser.parse_args()
+    asyncio.run(main(args.runs, args.events, args.flush_size))
@@ -9,9 +9,19 @@ if sys.platform == 'win32':
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from tortoise.contrib.fastapi import register_tortoise
-from backend.app.core.database import TORTOISE_ORM
-from backend.app.api.endpoints import test_cases, runs, config
+from backend.app.core.database import TORTOISE_ORM, prepare_schema
+from backend.app.api.endpoints import test_cases, runs, config, suites, stats, artifacts, metrics
 from backend.app.core.patches import apply_browser_use_patches
+from backend.app.core.scheduler import scheduler
+from backend.app.core.config import settings
+from backend.app.agent.browser_pool import browser_pool
+from backend.app.agent.llm_registry import llm_registry
+from backend.app.agent.llm_cache import llm_cache
+from backend.app.core.run_events import migrate_legacy_logs
+from backend.app.core.event_bus import event_bus, start_event_bus
+from backend.app.core.artifacts import run_garbage_collector
+from backend.app.core.recovery import recover_orphaned_runs
+from backend.app.core.db_writer import db_writer
 
 # Apply patches to external libraries
 apply_browser_use_patches()
@@ -31,12 +41,17 @@ app.add_middleware(
 app.include_router(test_cases.router, prefix="/api", tags=["Test Cases"])
 app.include_router(runs.router, prefix="/api/runs", tags=["Test Runs"])
 app.include_router(config.router, prefix="/api", tags=["Configuration"])
+app.include_router(suites.router, prefix="/api", tags=["Test Suites"])
+app.include_router(stats.router, prefix="/api/stats", tags=["Stats"])
+app.include_router(artifacts.router, prefix="/api/artifacts", tags=["Artifacts"])
+app.include_router(metrics.router, tags=["Metrics"])
 
 # Database
 register_tortoise(
     app,
     config=TORTOISE_ORM,
-    generate_schemas=True, # Auto-create tables for now
+    # Created or migrated in startup_event, per database.migrate
+    generate_schemas=False,
     add_exception_handlers=True,
 )
 
@@ -44,6 +59,35 @@ register_tortoise(
 async def startup_event():
     loop = asyncio.get_running_loop()
     print(f"DEBUG: Current Event Loop: {type(loop)}")
+    await prepare_schema()
+    await start_event_bus()
+    migrated = await migrate_legacy_logs()
+    if migrated:
+        print(f"Moved logs of {migrated} runs to run_events")
+    # A single inline process owns every run, so whatever is still RUNNING was cut off by the restart
+    sole_executor = settings.scheduler.mode == "inline" and settings.server.workers == 1
+    recovered = await recover_orphaned_runs(all_running=sole_executor)
+    if any(recovered.values()):
+        print(f"Recovered orphaned runs: {recovered['requeued']} requeued, {recovered['failed']} failed")
+    app.state.artifact_gc = asyncio.create_task(run_garbage_collector(settings.artifacts.gc_interval_hours))
+    if settings.scheduler.mode == "inline":
+        if browser_pool:
+            await browser_pool.start()
+        await scheduler.start(runs.run_agent_task, runs.abandon_run)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    artifact_gc = getattr(app.state, "artifact_gc", None)
+    if artifact_gc:
+        artifact_gc.cancel()
+    await scheduler.stop()
+    await db_writer.close()
+    await event_bus.close()
+    if browser_pool:
+        await browser_pool.close()
+    await llm_registry.close()
+    if llm_cache:
+        llm_cache.close()
 
 @app.get("/")
 async def root():
@@ -0,0 +1,93 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "test_cases" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "name" VARCHAR(255) NOT NULL,
+    "url" VARCHAR(2048) NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL
+);
+CREATE TABLE IF NOT EXISTS "test_steps" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "order" INT NOT NULL,
+    "instruction" TEXT NOT NULL,
+    "expected_result" TEXT,
+    "case_id" UUID NOT NULL REFERENCES "test_cases" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "test_runs" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "status" VARCHAR(50) NOT NULL,
+    "logs" JSONB NOT NULL,
+    "result_summary" TEXT,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "case_id" UUID NOT NULL REFERENCES "test_cases" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "aerich" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "version" VARCHAR(255) NOT NULL,
+    "app" VARCHAR(100) NOT NULL,
+    "content" JSONB NOT NULL
+);"""
+    return """
+        CREATE TABLE IF NOT EXISTS "test_cases" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "name" VARCHAR(255) NOT NULL,
+    "url" VARCHAR(2048) NOT NULL,
+    "created_at" TIMESTAMP NOT NULL
+);
+CREATE TABLE IF NOT EXISTS "test_steps" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "order" INT NOT NULL,
+    "instruction" TEXT NOT NULL,
+    "expected_result" TEXT,
+    "case_id" CHAR(36) NOT NULL REFERENCES "test_cases" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "test_runs" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "status" VARCHAR(50) NOT NULL,
+    "logs" JSON NOT NULL,
+    "result_summary" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "case_id" CHAR(36) NOT NULL REFERENCES "test_cases" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "aerich" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "version" VARCHAR(255) NOT NULL,
+    "app" VARCHAR(100) NOT NULL,
+    "content" JSON NOT NULL
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
+
+
+MODELS_STATE = (
+    "eJztmWtP2zAUhv9KlU8gbQhKuWiaJpVSoANaRMOGmCbLTdw2IrGLY49WrP99Pm7S3AtlXE"
+    "u/UHousf3kxHl9emd4zCauv2YSX9SwT4wvpTuDYg/+yfg+lQw8GEQeMAjccXWwUFHIUmHa"
+    "jDu+4NgSytPFrk+UySa+xZ2BcBhVVipdF4zMUoEO7UUmSZ0bSZBgPSL6hCvHr9/K7FCbDN"
+    "XFg6+Da9R1iGsnJuzYMLa2IzEaaNvFRWP/QEfCcB1kMVd6NIoejESf0Wm4lI69Bjng6xFK"
+    "OBbEji0DZhmsOTRNZqwMgksynaodGWzSxdIFGMbXrqQWMCjpkeBP5VswtVgYQs2Widp1Ey"
+    "FjDnYWo8DdoQJA3Y0n142AaKsBA9SOqucrm9urGgHzRY9rp8ZljHUiFniSqqFHlPVnhnOt"
+    "j3k+5zA+RVpN9DGMQ0MEOSqwEF8I6BmQGh4eIpfQnuirr+WtrRmMf1TPNWYVpTkz9URMHp"
+    "Zm4CpPfMA74iu5Ow/eIHwR6a5Xdh+CV4UV89XOJGCLE0CCsMhy3lce4Xgkn3UyM4XcDlLX"
+    "wn/e4w1QC7Rb1B0Fm9cM/GbjtN42q6dnMJzn+zeu5lc16+Apa+soZV3ZTt2o6UVKPxvmUQ"
+    "m+lq5azXp6W5rGmVcGzAlLwRBltwjbsX02tIbUxvCm6F7HdjEwdLB1fYu5jRKeqDx8QQZ+"
+    "tjL2grSD43PiYg02WwOxV2ZbXeYdVsA4rPnQGlVChIhL+gSEziVdJEBQW6zMiqot6/LKXt"
+    "qCKe7pJcHYMFK6oAr0WVhs9+izaWkv9dni6jPGbcKzoBtU5HOexqdQQ2m/v8dTzVd9fC5v"
+    "VHYqu5vblV0Voic6tezMwN5omimx4MDVpRXuZkmmJhkWQE2lLYQ6myUG6pdmQgeECmzltH"
+    "q5mtACJ63mYRgeU2y1k9ZeCj0ZDogFckvVPixkDvw5qY+6BcEG8VHvAJzn0Xy7dizlKbfu"
+    "twv+np06I0GTdLNoDxgnTo8ek5EG3FDzwNTKO0Hn9GfeJ9aMllJmjm+nCiJeVGr9atVETE"
+    "7F1Xatul83xsW6/rlVGYjYAlEW6Nt7NFmopZeSbHElmXqEhcw5MRV3daKMl5MOxlm9ud9o"
+    "Hj4X22R3Z2v9Ab2drfXCzg64km8rl/VyGH9vt5r5jMP4dB/HsUTpb8l1/GfTv7Ga7kjHFU"
+    "otrsF4r1HWwGe2cEhrhFT9wwXSwmEiu5AvPQ/z0TzKLZu5FG6PEG7LFucHaXEu5fpSri/l"
+    "+oPkepVwx+obOWo98MwU6ziKeTNKvbCnl/tE5zT0grv3fwr9zXfzioX5H8L93M5esTKPpS"
+    "xEV+8FftGGh2oOwkH4AtLdWH/IoUdFFdLVvpTWY1QQmiP0ik8+sZSXP/y8znv/yY45c/ym"
+    "/PQvs/E/Q5QYZg=="
+)
@@ -0,0 +1,80 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE INDEX IF NOT EXISTS "idx_test_runs_status_e7931c" ON "test_runs" ("status", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_test_runs_case_id_032a49" ON "test_runs" ("case_id", "created_at");"""
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_test_runs_case_id_032a49" ON "test_runs" ("case_id", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_test_runs_status_e7931c" ON "test_runs" ("status", "created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        DROP INDEX IF EXISTS "idx_test_runs_case_id_032a49";
+        DROP INDEX IF EXISTS "idx_test_runs_status_e7931c";"""
+    return """
+        DROP INDEX IF EXISTS "idx_test_runs_status_e7931c";
+        DROP INDEX IF EXISTS "idx_test_runs_case_id_032a49";"""
+
+
+MODELS_STATE = (
+    "eJztXWtz4jgW/SsuPiVVmVSaPGd3a6tIQvewTaCLkJ2p6dpyKUaAK8aibbnTTE/++0ryW5"
+    "YMBgPG0ZfuIN0r2Uevc6+u5J+NGRpByz0dQhffARc2/qH9bNhgRv/I5J1oDTCfxzk0AYNn"
+    "iwljIqUbRIwlg2cXO8DAJGcMLBeSpBF0DcecYxPZJNX2LIsmIoMImvYkTvJs85sHdYwmEE"
+    "+hQzK+/o8km/YI/iCFBz/nL/rYhNYo9cDmiNbN0nW8mLO0p6fO/UcmSat71g1keTM7lp4v"
+    "8BTZkbjnmaNTqkPzJtCGDsBwlHgN+pTBO4dJ/hOTBOx4MHrUUZwwgmPgWRSMxr/Gnm1QDD"
+    "RWE/3n4t/BoyXEdL3XH+qP7aGuNwpgZyCb4m7amAL1880vNwaEpTZoBXe/tQZH51fHDALk"
+    "4onDMhlcjTemCDDwVRnoMcrs/wzOd1PgiHEO5TmkyYOug3GYEIMcd7AQvhCgLUDamIEfug"
+    "XtCZ6Sn83LyxyM/9saMJiJFMMZkRHhD5ZekNX08yjeMb6eYxWBNxCvI7pnFzerwEvE5Piy"
+    "zDTAtBIXw7mbhbljYzHKKR0Oa/L0K2AdzAWVgXpCH+KX5oeL64ub86uLGyLCnjNKuc7Bvt"
+    "MbCkDF6AXaRVGNlRSsYlhdSCoZCXD9aCGQ119jPQ7aMVU8PHBzkLvvP91229qXQfuu89jp"
+    "92gts4X7zYozaRJJMDGDYNBudQVYG2QtLAx0qKRQXgHl76ZLHkifI8s0FkUWuoziWktexc"
+    "DmV7yV1ruc1Y5f6wwHUix0IOjV9yQHmzMohjutyWE9ClRPwz8OkWyQFxz1bWsR9Ioc6Ied"
+    "h/bjsPXwhXV4N+zwrWGb5jTTwyBIPbrimikqRPu9M/xNoz+1P/u9Nk/BI7nhnw36TMDDSL"
+    "fRqw5GCZsiTA1Re6NW0fglwdhpwjMwXl6BM9JTOXH3kNCg20Dt4+cBtAADNtsHEubhIynm"
+    "AHvAW9jnw9S4J8QQOZ6I0hRFaODZdQWIGvpwQ4hazCYe0pLqBBMdgqiJZIMymzVrzsTj1C"
+    "MLqgDjB2Avhoj+yybxDnkAYBsiczs5Wmlh2/Fv7AHkk+DddIHbKnpTh/ZAsphFy2LoqBoj"
+    "hzXFC1w0Qi+WD7bu+4eixkpIUO0gG08d5E2mad3YD0YagDwM9MnQXevxrnXP5ns9CX3UVW"
+    "bABhOWRCF4O8nOsRL3XDj/LnHPRbO9cs/V1z2HnBF0Ctjgkfxa5nfVpuKy7W+Tlu4Z4eqV"
+    "xnQIf0hA5dRq4ZzL48ftP4YpahyaJEcPrT+OU/S42+99CsUTJsxdt3/LQQ9/zKFBJ23S9+"
+    "mLFIBfoFoHY3HXLaBM9Z2a6jGrWHWNTKiUuVBWt5svWRczNnAaXYFjDznQnNifYRH+HG6G"
+    "HiasIgLtgNeIryU7lZC+vskdCxvaO0s5MLWiJRQ4MLCXMODQmN8qAf4adbaED43IfCXzHs"
+    "Cey+cowrxXwhw3yqrLW6yxO2LX+NLu3Xd6n7aFbXp1u1xldbuUr26XmdWNjsgiGIfyO0SY"
+    "zDu+zXOI7MFCE0Ef/s9jvyfGN5TnHfumgbW/Nct0t2b9JeaMZ8+0MLGVTml9+5g2KD75tJ"
+    "lnyNz8QgvgabNvdOiuN5sBR8Cb5XZLVrMOxHnXZova85LPQvXa80q2OlmUnfVaPa1ZQqsf"
+    "0PirUCOHmOS28ti0TXe6VjNzqqqdq9zOFqRWKHq1Rb5sOWvk1Oqweu4g4nQKyQT4TJa+NU"
+    "YVr6uGVZWHFcAYzua4SIxmUmV3W0Rn2xpNJe8PKadtCb4ZLs6BeukKYsrrbQDs4cw+yhm+"
+    "MaybO8OFvbcEbFnoympRY9XssUuh5cds0c2GfUagHQjk6f3079AWrfxFUCIdsv0dHmRkyE"
+    "oYES5rjoFRAkytoKS6IkW4PCljQ5xo3NqQFVQnmLa5CxotC4Jt0OSSId8HjaZdFQmoNjbV"
+    "xubGG5ukOsNzHGiLQqSkVjWntTvD+sO2YC7ZsMYIA8E5aCmgkbzyUfBQzoHrQsGMK8UyVl"
+    "Bg8mCOgWkVAjNWUGDyYLoYzeeF0ExoKDgzzki18f0ON77Vluj72LvxDbd1/OJqs2EVp7gb"
+    "HhYswSu+9hHLagC7ou92U7/tLo9WV3Ni2q3zKO6ZsnOkYbdddpA0Oo6s/Ef19R+pi962G3"
+    "aTfLIMzPIgYU6tDjFOKkK4Mk1RM0NpvVtxUlskG2xvrb6HX7VusP0rTeIrOFL4rnWjybpB"
+    "KAd3oUn4ovx9Jon7YbIXmiRiWES3maTvOynjQpN46EmpaDLcQkBGuWgMOR0FTFCPI0CWEt"
+    "LGrYNeXej84rlQ89W1qeli5Cw0NNaA5noGKcsde5ZGpoATzYFzCyxohdqrSXqghzXCV7Vu"
+    "9+G0wTV02WUrilxxijwmVUJn7gTO51WZMqdWQ8J8dbECX766kNJlmsUFqfvjKAuz/IxjQm"
+    "X3xxz3Q5e3cqAxmGQN5Im6uTxynFNTGzZqw+a92iHqzMDWzgwUPy2gzgmocwL7PCdQzgmB"
+    "2u198JhKjgaQ6rXeU7e7r4uIohh4gd2ajI+XG630xeJo/OUWa9+GGpP3jUiirh1ZaELoq0"
+    "2k/aBNzZgCYlScaNBxkHN8opHqIWnfkWba2jPAxhS6WXu11JIF1urXsK+78Jt/0dG6tuut"
+    "OZESTeFcLqCXQSerrEcooJe/Npvn59fNs/Orm8uL6+vLm7OIZ2az8gjnbecT5ZwpnhOS0J"
+    "ywYdJUq5P8QFpdHiqKYaVoZKCUuwVC+Rr6A8q/8GgOFhYCgplC7g9IqCh/wAb+AGW2ynt9"
+    "fc3WPdlZVWvhrRhau7YIKgrquibBnq8mjc56inayEudAc7axkudOlxsELY06tgkDH5sWyS"
+    "ZjmPQ0l/x+XrD9I3cKmpdXlNObmPB3ZGNC8bPsf/1iNtiYmgJ3WoQUhfLlkKL98vutbJHI"
+    "mXzQYnpRHsrr1ZCPfjhbhZASKSn8LI87zmL+JcBZbjoF4sp2Ulsj75hjrhWi5cAxpKdnN7"
+    "32o6Y3NWzZ/5lHeDhE872gBXnPIGx1beygWeCwxEgDthaW9E/NHJG1yzSAxWiNS3JgyHMQ"
+    "Uc3SoNJKVeE6FbCy8gjRC3m/IkQolK8hAVKfGlUrdhleoXCGFLqG5COLU6vhACs/Ak454J"
+    "QDruoOONHUUAKwNeToPLLcjFgl/2bimjbRtWOpS9xyLh4jcnri2rjldP93QqIh80TSdZ/6"
+    "IZENNfaZFo2Wpr3Sv45cCGlMwinLOPVrOM7S/I1Ly41voF9gVQEOhxHgEHwtd1U3XSCu3H"
+    "TCG3wq89WNqkF9ICQ/xCSX5Y88hznS9JnA3/bRQkB2Vjmtx7XymCrWq2Xv+0+33bb2ZdC+"
+    "6zx2gtiLqClZJlsuvln+NQyNQbvV5T/lZc10A1hWkVv6UzrqoEX2M85zD5OV+wWKzvTK11"
+    "1OTQHLA4s8vBayGT0FLQ+t/xFlAVFEyILAFuMaK3GAPhOtFRCtZqi4kPv1+93U8nnb4W9+"
+    "eHq4bQ+OPhynZ1wBiZkDUeeVBxJGCurriakmKOXricrLtQR25eXat5drT2Fm0DGNaUMUZO"
+    "bnnOSGmMUylbmz6704PDbkBHJXxnfoiEmCfOcloVLDXZetXNRFB1UBhAPxGqK7lai5INqw"
+    "CP9KqKiDHAW5VoFwq/IXs7f/AwOCnH0="
+)
@@ -0,0 +1,83 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "resource_versions" (
+    "name" VARCHAR(50) NOT NULL PRIMARY KEY,
+    "version" INT NOT NULL
+);
+        CREATE INDEX IF NOT EXISTS "idx_test_cases_created_c2f56b" ON "test_cases" ("created_at");"""
+    return """
+        CREATE TABLE IF NOT EXISTS "resource_versions" (
+    "name" VARCHAR(50) NOT NULL PRIMARY KEY,
+    "version" INT NOT NULL
+);
+        CREATE INDEX IF NOT EXISTS "idx_test_cases_created_c2f56b" ON "test_cases" ("created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_test_cases_created_c2f56b";
+        DROP TABLE IF EXISTS "resource_versions";"""
+
+
+MODELS_STATE = (
+    "eJztXWtz4jgW/SsuPiVVmVSaPPdRWwUJ3cMOgS5CZqama8sljABXjEXbctJsb/77SvJblo"
+    "0NBoyjL91Buleyj17nXl3JPxsLNIGGfT6CNr4HNmz8XfnZMMGC/pHIO1MaYLkMc2gCBmOD"
+    "CWMipWpEjCWDsY0toGGSMwWGDUnSBNqapS+xjkySajqGQRORRgR1cxYmOab+3YEqRjOI59"
+    "AiGd/+Q5J1cwJ/kMK9n8sXdapDYxJ7YH1C62bpKl4tWdrzc/fhM5Ok1Y1VDRnOwgyllys8"
+    "R2Yg7jj65Jzq0LwZNKEFMJxEXoM+pffOfpL7xCQBWw4MHnUSJkzgFDgGBaPxz6ljahQDhd"
+    "VE/7n6l/doETFV7Q9G6lNnpKqNAthpyKS46yamQP18d8sNAWGpDVrB/a+t4cnlzSmDANl4"
+    "ZrFMBlfjnSkCDFxVBnqIMvs/gfP9HFhinH15DmnyoJtg7CeEIIcdzIfPB2gHkDYW4IdqQH"
+    "OG5+Rn8/o6A+PfW0MGM5FiOCMyItzB0veymm4exTvE17GMIvB64nVE9+LqLg+8RCwdX5YZ"
+    "B5hWYmO4tJMwd00sRjmmw2FNnj4H1t5cUBmoZ/Qhfml+urq9uru8ubojIuw5g5TbDOy7/Z"
+    "EAVIxeoFkU1VBJwiqG1YakkokA188GAln9NdTjoJ1SxeMDNwO5h8Fzu9dRvg47992n7qBP"
+    "a1ms7O9GmEmTSIKOGQTDTqsnwFoja2FhoH0liXIOlF91mzyQukSGrq2KLHQJxY2WvIqBza"
+    "94uda7jNWOX+s0C1IsVCDo1Q8kB+sLKIY7rslhPfFUz/0/yiEbCb68S+TJ+00GprHy6s1A"
+    "ftR97DyNWo9fWX+3/f7eGnVoTjM+CrzUkxuulYJClD+6o18V+lP5a9Dv8Aw8kBv91aDPBB"
+    "yMVBO9qWASgchP9WF8p0bR9CVC2GnCGGgvb8CaqLGcsHeksKC2p/b5tyE0AAM22QUi1uET"
+    "KeYI2ea73+X91LAnhBBZjojRFEVo6Jh1BYja+XBLiFrMJB7RkuoEEx2CqInSBmUya9FciM"
+    "epQ9ZTAcaPwFyNEP2XzeFd8gDA1ETWdnS00sJ24944AMhn3rupAq9V8KYW7YFkLQtWRd9P"
+    "NUUWa4oXuGr4TiwXbNV1DwWNFZGg2l42nlvImc3juqEbjDQAeRjocqH71tN964HN92oU+q"
+    "CrLIAJZiyJQvB+lpxjU7xz/vy7xjsXzPbSO1df7xyyJtAqYIIH8htZ31Wbiss2v3VauqP5"
+    "q1cc0xH8kQIqp1YL31wWP+78OYpRY98iOXls/Xkao8e9Qf+LLx6xYO57gzYHPfyxhBqdtE"
+    "nfpy9SAH6Bah1sxX23gLTU92qph6wi7xoZUSlzoaxuN1+zLiZs4Di6Ar8esqA+M3+DRfiz"
+    "vxd6nLCKCLQF3gK+Fu1UQvr6nu5Y2NLeWcuBqRWdQoE9A3sNA/aN+Z0S4G9BZ4u40IjMNz"
+    "LvAezYfI4kzAclzGGj5F3eQo39EbvG107/odv/sits46vbdZ7V7Tp9dbtOrG50RBbB2Jff"
+    "I8Jk3nFtnmNkDwaaCfrwv58GfTG+vjzv19c1rPxPMXR7Z9ZfZM4YO7qBia10Tus7xLRB8c"
+    "mmzTxD5uYXWgBPm12jQ7WdxQJYAt6cbrckNetAnPdtthzXltd+bZh67XlFW50sytZmrR7X"
+    "LKHVj2j8VaiRfUwyW3mqm7o936iZOVXZzlVuZwNSKxS9mSJfdjpr5NTqsHruIeB0DskEOC"
+    "ZL3wajiteVw6rKwwpgDBdLXCREM6qyvy2ii12NppL3h6TTtgTfDBfnQL10BTHl9bYA9nhm"
+    "H+kM3xrW7Z3hwt5bArYsdCVf1Fg1e+xaaPkxW3Sz4ZARaEcCeXw//RWaopW/CEqkQ3Ze4V"
+    "FGhuTCiHBZfQq0EmBqeSXVFSnC5UkZW+JE49ZGrKA6wbTLXdBgWRBsg0aXjPR90GDalZGA"
+    "cmNTbmxuvbFJqtMcy4KmKEQq1armtPZnWH/aFcwlG9YYYSA4Bp0KaCAvfRQ8lEtg21Aw46"
+    "ZiGSpIMHkwp0A3CoEZKkgweTBtjJbLQmhGNCScCWek3Pj+gBvfckv0Y+zduIbbJn5xudmQ"
+    "xylu+4cFS/CKb3zEshrA5vTdbuu33efR6mpOTPt1HoU9M+0cqd9t1x0kDY4jS/9Rff1H8p"
+    "633YbdRJ8sAXN6kDCnVocYJxkhXJmmqJmhtNmtOLEtki22t/Lv4VetG+z+SpPwCo4Yvhvd"
+    "aLJpEMrRXWjivyh/n0nkfpjkhSaRGBbRbSbx+07KuNAkHHqpVDQabiEgo1w0RjodBUxQDS"
+    "NA1hLSRttCbza0fnFsqLjqyly3MbJWCpoqQLEdjZRlTx1DIVPAmWLBpQFWtELlTSc90MEK"
+    "4atKr/d43uAauuyyJUWuOEWekiqhtbQ853Nepsyp1ZAw31zl4Ms3V6l0mWZxQeruOErCnH"
+    "7GMaKy/2OOh6HLOznQ6E2yGnJE3Tw9cpxTkxs2csPmo9oh8szAzs4MFD8tIM8JyHMChzwn"
+    "UM4JgdrtffCYphwNINUr/ede71AXEQUx8AK7NRofn2600hcLo/HXW6wDEypM3jUiibpyYq"
+    "AZoa8mkXaDNhVtDohRcaZAy0LW6ZlCqoekfSeKbipjgLU5tJP2aqklC6zVb35ft+F396Kj"
+    "TW3Xtj5LJZrCuVxAL71OVlmPkEcv/9ZsXl7eNi8ub+6ur25vr+8uAp6ZzMoinO3uF8o5Yz"
+    "zHJ6EZYcOkqfKTfE9aXh4qimGlaCSgTHcL+PI19AeUf+HREqwMBAQzRbo/IKIi/QFb+AOk"
+    "2Zre6+trth7IzqpaC+/E0Nq3RVBRUDc1CQ58NWlw1lO0kxU5B5qxjRU9d7reIGgp1LFNGP"
+    "hUN0g2GcOkp9nk93jF9o/sOWhe31BOr2PC35GJCcVPsv/Ni9liY2oO7HkRUuTLl0OKDsvv"
+    "d7JFks7kvRZTi/JQXq+GfPTTRR5CSqRS4Wd53HEW/b8CnNNNJ09c2k5ya+QDc8yNQrQsOI"
+    "X09Oy2137U9KaGHfs/swgPh2i2F7Qg7xn6ra5MLbTwHJYYKcBU/JL+oegTsnbpGjAYrbFJ"
+    "DvR5DiKqSRpUWqkyXKcCVlYWIXoh71eECPnyNSRAH/1Lo3LFLscr5M+QQtdQ+sji1Go4wM"
+    "qPgJMOOOmAq7oDTjQ1lABsDTk6jyw3I1bJvxm5pk107VjsEreMi8eInBq5Nm493f+DkGjI"
+    "PJF03ad+SGRChX2mRaGlKW/0rxMbQhqTcM4yzt0aTpM0f+vSMuMb6BdYZYDDcQQ4eF/Lze"
+    "um88Slm054g09lvrpRNaiPhOT7mGSy/IljMUeauhD42z4bCKSdVY7rca08pYr1atmHwXO7"
+    "11G+Djv33aeuF3sRNCXLZMvFd8O9hqEx7LR6/Ke8jIWqAcMockt/TEcetEh+xnnpYLJyv0"
+    "DRmd70dZdTk8DywCIHb4RsQk9Cy0PrfkRZQBQRMiAwxbiGShygY6KVA9FqhooLud9g0Ist"
+    "n+0uf/PD82O7Mzz5dBqfcQUkZglEnTc9kDBQkF9PjDVBKV9PlF6uNbBLL9ehvVwHOngCbe"
+    "RYGvwdWrb74snNV07kLHMD1hNWX13pA17oddirpioUFFbW/eTp3o/XsGvk5GoRDcnSRqIZ"
+    "9kBhp9DStbloGvByMkc/CGUqc4ffR3GAbmkjbDC406fS9NFdh13YnVzcRwdVAYQ98Rqiu5"
+    "MoWi/6uIg9FlGRB7sK2l4HXcze/w+L1epF"
+)
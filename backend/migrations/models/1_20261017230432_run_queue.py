@@ -0,0 +1,45 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        ALTER TABLE "test_runs" ADD "started_at" TIMESTAMPTZ;
+        ALTER TABLE "test_runs" ADD "finished_at" TIMESTAMPTZ;"""
+    return """
+        ALTER TABLE "test_runs" ADD "started_at" TIMESTAMP;
+        ALTER TABLE "test_runs" ADD "finished_at" TIMESTAMP;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "test_runs" DROP COLUMN "started_at";
+        ALTER TABLE "test_runs" DROP COLUMN "finished_at";"""
+
+
+MODELS_STATE = (
+    "eJztmm1vGjkQx78K2lep1ItSStLodDqJEtJybaAK27uqp5Nldg1Y2bWp126Ccnz385g1+0"
+    "wCR1KgvAlhZrz2/jzr/c+IeyfkPgmiY5dEsoUj4vxau3cYDuGfgu9lzcGTSeIBg8SDwARL"
+    "HYU8HWbMeBBJgT2pPUMcRESbfBJ5gk4k5UxbmQoCMHJPB1I2SkyK0W+KIMlHRI6J0I6//9"
+    "Fmynxypy8ef53coCElgZ9ZMPVhbmNHcjoxts+fOxeXJhKmGyCPBypkSfRkKsecLcKVov4x"
+    "jAHfiDAisCR+6jZglfE9W9N8xdoghSKLpfqJwSdDrAKA4fw2VMwDBjUzE/xp/B4vLRWGUL"
+    "fnon7bRchZgZ3HGXCnTAKo+9n8ugkQY3Vggtb75vXR67MXBgGP5EgYp8HlzMxALPF8qIGe"
+    "UDafBc6tMRblnG18jrRe6DqMrSGBnCSYxWcBPQFSJ8R3KCBsJMf6a/30dAnjP5vXBrOOMp"
+    "y5fiLmD0s3dtXnPuCd8FUiWAVvHL6PdE8a54/Bq8Oq+RpnFrAnCCBBWBY5X2iPpCEpZ50d"
+    "mUPux0OP7T+7uAH6Bv0eC6bx4bUEv9u5avfd5tUnmC6Mom+B4dd02+CpG+s0Zz06y23U4i"
+    "K1vzru+xp8rX3tddv5Y2kR5351YE1YSY4Yv0XYT52z1mqpzeBNMbxJnWJgGGDv5hYLH2U8"
+    "SXpEkkyiYma8jYddfrgmATZgizmQemX29WV2MANmNuetNcmEBJFQbAOErhXbJ0CQW7zOq7"
+    "Kt6ArrYd6CGR6ZW4K5YaZ8QlXoM5tsD+izRWof9Nn+6jMufCKKoDtMlnNexOdQQ2rv3uOp"
+    "16s/fqm/arxpnL8+a5zrELPQheXNEuydrpsTCxSurjx7mmWZuuSuAmpu2F6os2VioP3Fze"
+    "gAq8COrppfXmS0wMde950NTym21sfe2xx6cjchHsgtnftwIyvgLxm61hbEB8TPugNQz6PV"
+    "Tu3UkE0e3dsL/oGTuiBBs3SLaC+5IHTEPpCpAdzR68DMK6ugS/ozu4m1oKW0WeDbhYJIJ5"
+    "W+f33XRM6r4ma/1bxoO7NqXf/UqgxEbIUoi/XtA5rMaumDJNtfSaYfYalKKqbqrk4y4vmk"
+    "g/Op3b3odN89Fdtsd+f05BG9ndOTys4OuLJvq4CPShj/0e91yxnb+Hwfh3qy9m8toNGT6d"
+    "9UTg8UDaRWi8cw349Ia+CzXDjkNUIu/+ECeeEwl10oUmGIxXQV5VYceRBuawi3Q4vzJ2lx"
+    "pnddvzTEerueHbmBXd+h52+LNtkyWbrLQ8poNF5rm3NDD/u8zft8KL4Pxfeh+K4svptEUG"
+    "/slNTeseflstIbJzFbU3dXduhLn+iS9ny8e/+v3t763nx1mf2diKi0T19dZ6eG7EWP/hl+"
+    "nwIP1QqE4/A9pPvq5DEtDB1VSdf4cpUbZ5KwEmVX3cdIDXn+VsaPee9vrGmxwi9ENv8ym/"
+    "0HUqNO4Q=="
+)
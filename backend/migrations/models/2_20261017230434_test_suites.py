@@ -0,0 +1,111 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "test_suites" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "name" VARCHAR(255) NOT NULL,
+    "description" TEXT,
+    "created_at" TIMESTAMPTZ NOT NULL
+);
+        CREATE TABLE IF NOT EXISTS "suite_runs" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "status" VARCHAR(50) NOT NULL,
+    "concurrency" INT NOT NULL,
+    "total" INT NOT NULL,
+    "passed" INT NOT NULL,
+    "failed" INT NOT NULL,
+    "stopped" INT NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "finished_at" TIMESTAMPTZ,
+    "suite_id" UUID NOT NULL REFERENCES "test_suites" ("id") ON DELETE CASCADE
+);
+        ALTER TABLE "test_runs" ADD "suite_run_id" UUID;
+        CREATE TABLE "test_suite_cases" (
+    "test_suites_id" UUID NOT NULL REFERENCES "test_suites" ("id") ON DELETE CASCADE,
+    "testcase_id" UUID NOT NULL REFERENCES "test_cases" ("id") ON DELETE CASCADE
+);
+        CREATE UNIQUE INDEX IF NOT EXISTS "uidx_test_suite__test_su_367ccb"
+    ON "test_suite_cases" ("test_suites_id", "testcase_id");
+        ALTER TABLE "test_runs" ADD CONSTRAINT "fk_test_run_suite_ru_6a7b1e9f" FOREIGN KEY ("suite_run_id")
+    REFERENCES "suite_runs" ("id") ON DELETE CASCADE;"""
+    return """
+        CREATE TABLE IF NOT EXISTS "test_suites" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "name" VARCHAR(255) NOT NULL,
+    "description" TEXT,
+    "created_at" TIMESTAMP NOT NULL
+);
+        CREATE TABLE IF NOT EXISTS "suite_runs" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "status" VARCHAR(50) NOT NULL,
+    "concurrency" INT NOT NULL,
+    "total" INT NOT NULL,
+    "passed" INT NOT NULL,
+    "failed" INT NOT NULL,
+    "stopped" INT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "finished_at" TIMESTAMP,
+    "suite_id" CHAR(36) NOT NULL REFERENCES "test_suites" ("id") ON DELETE CASCADE
+);
+        ALTER TABLE "test_runs" ADD "suite_run_id" CHAR(36) REFERENCES "suite_runs" ("id") ON DELETE CASCADE;
+        CREATE TABLE "test_suite_cases" (
+    "test_suites_id" CHAR(36) NOT NULL REFERENCES "test_suites" ("id") ON DELETE CASCADE,
+    "testcase_id" CHAR(36) NOT NULL REFERENCES "test_cases" ("id") ON DELETE CASCADE
+);
+        CREATE UNIQUE INDEX IF NOT EXISTS "uidx_test_suite__test_su_367ccb"
+    ON "test_suite_cases" ("test_suites_id", "testcase_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        ALTER TABLE "test_runs" DROP CONSTRAINT IF EXISTS "fk_test_run_suite_ru_6a7b1e9f";
+        DROP TABLE IF EXISTS "test_suite_cases";
+        ALTER TABLE "test_runs" DROP COLUMN "suite_run_id";
+        DROP TABLE IF EXISTS "test_suite_cases";
+        DROP TABLE IF EXISTS "test_suites";
+        DROP TABLE IF EXISTS "suite_runs";"""
+    return """
+        DROP TABLE IF EXISTS "test_suite_cases";
+        ALTER TABLE "test_runs" DROP COLUMN "suite_run_id";
+        DROP TABLE IF EXISTS "test_suite_cases";
+        DROP TABLE IF EXISTS "test_suites";
+        DROP TABLE IF EXISTS "suite_runs";"""
+
+
+MODELS_STATE = (
+    "eJztm2tv2zYUhv+KoU8tkAWJm6TBMAxwE6f12thFom5Fh0FgJNoWIlEqRS0xMv/3kbSoC0"
+    "XZli0ntsMvuZDnSNTDI+rlIflk+IEDvejQhBG5ABE0fm09GQj47I9S3UHLAGGY1bACAu48"
+    "bkyolWVTM14M7iKCgU1ozRB4EaRFDoxs7IbEDRAtRbHnscLApoYuGmVFMXJ/xtAiwQiSMc"
+    "S04u9/aLGLHPhIL578G95bQxd6TqHBrsPuzcstMgl52bdvvcsrbslud2fZgRf7KLMOJ2Qc"
+    "oNQ8jl3nkPmwuhFEEAMCndxjsFYmzyyKZi2mBQTHMG2qkxU4cAhij8EwfhvGyGYMWvxO7M"
+    "fJ70nTcmaW1R+Y1m3XtCyjBjs7QIy7iwgD9TSdXTcDwksNdoOLT52bN+/O3nIEQURGmFdy"
+    "XMaUOwICZq4cekaZ/y5xvhgDrOYs7CXStKGrMBYFGeQswAQ+AWgDSA0fPFoeRCMypv+2T0"
+    "/nMP6zc8MxUyvOOaBvxOxl6SdV7Vkd453xjbFXB29ivo90j07Ol8FLzar58soiYBtDhsQC"
+    "pMz5ktYQ14dq1kVPCbmTuB6KP3axA+gDOgPkTZLBaw5+s3fdvTU711/Z7fwo+ulxfh2zy2"
+    "ravHQilb45kzoqvUjrr575qcX+bf0Y9LvysJTamT8M1iYQk8BCwYMFnNw4K0oFtSn7Ugzv"
+    "c6MYK7gD9v0DwI5VqMnCIyIwjMqR8SFxu/p8Az3AwZZjIPfJvKWX2cEImIqYF6VZJGSIcI"
+    "waIHQTo30CxGIraAdV0Vau8tu+OgBjl0AF32uAJmbAfvLRqUcbAJCt+rbmw5BdbDNi5gUg"
+    "HyTPZik0avqkmEUfHaXT8V6o0mGAeVfcw0kqWWewrZkYTDsrZ8G8k2oyxkE8Ghd9M9FLO4"
+    "A2BpLZB7tze9G55AOZlUefhooPEBjxIoZgelAePCq0uBhYFmjxdBjTWnx/tXiAHYjLoHuI"
+    "qDmn9hJq9obt3lBM20t//dI+Pnl/cv7u7OScmvCGpiXv52Dv9U1JGLrs6rEtvlxFpiZ8rI"
+    "Aque2FEp8n/LrfzYLmE2r7zXXn+9uC7vsy6H8U5jl1fvFl8EFCDx9DaLNBm8Y+e5Aa+BWu"
+    "K3VBMkC81h7IfeeWHbVzLk0O3dsLfsFIXZpuFOmW0V4FGLoj9BnWUXQiF7ebWFWSDoOHVE"
+    "Hkg0opqKbVc7g1FfhCVcYmLBWiLJnLLNBkYt6kJdn+SjL6CpNYMXurzuBlHs8nHYyv3f5l"
+    "r/9xU2yLmbzToyXyeKdHlVk8VlX8WnnBSMH4j9tBX81Y2Ms5O9cmrf9anhttTP/mYvoudj"
+    "1C1eIhu99LhDXjM184yBpBin92AVk4zGQXnQz7PsCTOsqt7KmF2wrCTaezX0k6O9/r9KOB"
+    "V+v1omcDvb5D798WdbJgMreXhy5yo/FK3Sy56n7e5n7Wk+8GNLm0gsJmWzWZyn5rgN2dl0"
+    "UnNdbGun5SQxm9DbDli2LLLbRuZ8QuRCu/s9uUNErpK7JG+Z6pThulT6fzRjpvpPNGa+eN"
+    "6O3sGGOIbEWmonLZVPJ6vsXT401hbnjllAQEKHYtVgJN7Z8P5dGOoAxBFEHFiFvJMnPQMG"
+    "WYQ+B6tWBmDhqmDDMiQRjWopnz0DhlnDpvW416f/O2OqP3OjJ6s4nbKuknndNbJvcUid2+"
+    "DSSfVt4jvR1gl0yRrJYeeZlN/9s5MDW+53/xPnAemVUbwUXYLtoJnp4n0Pmj/c0f6WOZmz"
+    "2WmW9ZCXP1HhfJTW9w0Rtc9ESp2fOahSWS1dVJjaWybQuDzZ9JzM7QrX8kcdW13p07kSge"
+    "VD6QmDvgWT6RmFsqVh1HLB5YbOJEYvbqVUrRDsSuPVbp0KRmrggFmc3W6M/KlKVSfiqylU"
+    "nfb228NpOtrJab/0IcKaVQteLMuWjRuZzoZC9VDcKJ+R7SPT5aZimYWlXS5XWlxWACkUJV"
+    "Vp8jyLk8/1GCl9H0jR0aqKHums+rTP8HGe0X9A=="
+)
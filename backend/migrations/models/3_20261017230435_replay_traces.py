@@ -0,0 +1,74 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "action_traces" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "fingerprint" VARCHAR(64) NOT NULL,
+    "history" JSONB NOT NULL,
+    "action_count" INT NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "case_id" UUID NOT NULL REFERENCES "test_cases" ("id") ON DELETE CASCADE,
+    "run_id" UUID REFERENCES "test_runs" ("id") ON DELETE SET NULL
+);
+COMMENT ON TABLE "action_traces" IS 'Browser-use action history of a successful run, replayable without the LLM.';
+        ALTER TABLE "test_runs" ADD "mode" VARCHAR(20) NOT NULL DEFAULT 'agent';"""
+    return """
+        CREATE TABLE IF NOT EXISTS "action_traces" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "fingerprint" VARCHAR(64) NOT NULL,
+    "history" JSON NOT NULL,
+    "action_count" INT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "case_id" CHAR(36) NOT NULL REFERENCES "test_cases" ("id") ON DELETE CASCADE,
+    "run_id" CHAR(36) REFERENCES "test_runs" ("id") ON DELETE SET NULL
+) /* Browser-use action history of a successful run, replayable without the LLM. */;
+        ALTER TABLE "test_runs" ADD "mode" VARCHAR(20) NOT NULL DEFAULT 'agent';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "test_runs" DROP COLUMN "mode";
+        DROP TABLE IF EXISTS "action_traces";"""
+
+
+MODELS_STATE = (
+    "eJztnP1P2zgYx/+VKD9tEkOMFTadTid1wLbeoEyQ3U07nSKTuG1EmmSOPah2/d/Pdt4du2"
+    "3atLTFvwyw/eTlY/vJ93ls75c5Dl3ox4cWjPEZiKH5m/HLDMCY/VKrOzBMEEVFDSvA4M7n"
+    "jTFtZTu0GS8GdzFGwMG0ZgD8GNIiF8YO8iLshQEtDYjvs8LQoQ29YFgUkcD7QaCNwyHEI4"
+    "hoxT//0mIvcOEjvXj6Z3RvDzzou5UH9lx2b15u40nEy75+7Z1/4C3Z7e5sJ/TJOChaRxM8"
+    "CoO8OSGee8hsWN0QBhABDN3Sa7CnTN85K0qemBZgRGD+qG5R4MIBID6DYf4+IIHDGBj8Tu"
+    "yfzh/po5Wa2Xb/2rJvLyzbNhuwc8KAcfcCzED9mibXLYDwUpPd4OxT9+bFm9OXHEEY4yHi"
+    "lRyXOeWGAIPElEMvKPOfNc5nI4DknLP2Amn6oMswzgoKyMUAy/BlgNaA1ByDR9uHwRCP6J"
+    "/HJyczGP/VveGYaSvOOaQzIpks/bTqOKljvAu+BPlN8KbN95HuUefdInhpMzVfXlkF7CDI"
+    "kNgA1zmf0xrsjaGcddVSQO6mpofZL7vYAfQF3evAn6TOawZ+q3d1cWt1r76w243j+IfP+X"
+    "WtC1ZzzEsnQumLU6Gj8osYf/esTwb70/h+3b8Q3VLezvpusmcCBId2ED7YwC352aw0ozZl"
+    "X4rBfcmLsYI74Nw/AOTalZpieMQYRnF9ZLxPzT58voE+4GDrY6D0ybyll9nBETDNxnxWWo"
+    "yEAhEiQQuEbkiwr4CY+IErIupynWCxK+0TJjYFw+NQNSnrVePjsXyeEg/LGF+BYGKF7F/u"
+    "xHv0AUDgyCRIebayi61H8z0B5IP03WyJlM/fFLERSD9m+WcxE++DEPGuuIcTM1P2CWw70c"
+    "x5Z5VaMOu0Go9QSIajqm0RG9AOoA8DcaJrurdn3XPu7+0y+nyojEEAhryIIZge1H2sImTJ"
+    "/O+ckCX39jpk2d+QJUQuRHXQvQDLOeftBdRshu2eK6bPS3+8On7dedt59+a084424Q+al7"
+    "ydgb3XtwT97LGrEyf7elWZWvBRAVUw24uAZZY+vvhmVaRxFpS8uOp+e1mRx5fX/Y9Z81IQ"
+    "c3Z5/V5ADx8j6DCnTcc+e5EG+CWmS3VB6iCeaw+UvnOLeu2SSZuue3vBz/HUtaisSreO9k"
+    "OIoDcMPsMmii5LWe4mVpmkQ+AhVxDlQSUVVFN1qLuiAp+rylhcpxBlacg3R5Nl4aWWZPsr"
+    "yegUxkQSvakTnYXF5qSD+eWif97rf1wX22rC8+RogXTnyZEy2cmqql8rNsOaMM7ab5Aw9S"
+    "OJqt5EQnmhdPKMZLLI1w+HkjH85+11X843ay+mjj0HG/8ZvhevLb4o+Yw74vmYqvFDdr+n"
+    "cBuMz2xhJmowwb+wC4jCLJG1dkzGY4AmTZRx3VIL4yWEsV5VeSarKuVepx9ltFyvVy1b6P"
+    "Udmn9b1MkZk5m9PPACLx4t1c2Cqe7nbe5nndxoIeYRVqhYNNuQqWi3AtjdmSw6abQy1tWT"
+    "RtLR2wJbvui42Hr/do7YuWjFOds0KfeUewd2BPmqWwdmJi7zESrJXJZHrzp1mY8AnbvUuU"
+    "udu1w5d0lv5xCEYOBIsjnKpXvBanML+K/Xhbnl1XscYiDZYKwEmrffHMqjHUEZgTiGEo+r"
+    "ZFkYaJgizAHw/EYwCwMNU4QZ4zCKGtEsWWicIk6d21aj3t/cts56Po+sZxK4LZOi03nPRf"
+    "JzcbbjvIUE3dL79LcD7IJppFVTSJs8n7OdjmmzyaNiZKoOI2TDdt5phPxMi84f7W/+SJ+g"
+    "Xu8J6vKT1TCr9wEJZnoTkN4EpAOldo9WV5ZIllcnDZYTt20YrP9cbHGOs8J3qWOxy66H79"
+    "yp2OxFxUOxpUPG9VOxpeV02ZHY6qHZNk7FFlNPKUXLK78SMSosDKvlKOAN7WIxeq4gNd+j"
+    "8CGG6BWJoZGYGyMvxiGaGOHAAEZMHHqteEB8g7qAAwPByAcTdkPjwaMjkGCD6lXj8vLq0B"
+    "Q6uu1ra4m85RJ5QG8JUYTS5POiSlkw20PBfNpZQC+fdpRymVVVNVs6j+qY1ccYSiabP8nw"
+    "NHJ5LWcWUifrhEQ2zJVrNaKZXrDRCzbPNQ7R25fXtn25+cZlvWVZb1l+yi3L7WxW3ru1D5"
+    "GpYpcyvb3R/3p5+VT/d0AXIs8ZmbKoNak5mBmwFm22ZulEqeCkTlKi29Le29pUSzu6TR0G"
+    "/oQolmbx1SFgyWQPw7+1rJewSdWAcNp8D+m+PlpkFzNtpaTL62r7mDGUxXfq+LpkouPrhv"
+    "F1g4WJ9j9m0/8BSHYO9w=="
+)
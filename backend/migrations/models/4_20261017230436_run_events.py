@@ -0,0 +1,75 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "run_events" (
+    "id" BIGSERIAL NOT NULL PRIMARY KEY,
+    "seq" INT NOT NULL,
+    "type" VARCHAR(20) NOT NULL,
+    "payload" JSONB NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "run_id" UUID NOT NULL REFERENCES "test_runs" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_run_events_run_id_722a93" UNIQUE ("run_id", "seq")
+);
+COMMENT ON TABLE "run_events" IS 'One event of a run (log line, status change, error), appended in batches.';"""
+    return """
+        CREATE TABLE IF NOT EXISTS "run_events" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "seq" INT NOT NULL,
+    "type" VARCHAR(20) NOT NULL,
+    "payload" JSON NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "run_id" CHAR(36) NOT NULL REFERENCES "test_runs" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_run_events_run_id_722a93" UNIQUE ("run_id", "seq")
+) /* One event of a run (log line, status change, error), appended in batches. */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "run_events";"""
+
+
+MODELS_STATE = (
+    "eJztXG1v2zYQ/iuCPqVAGriO87JhGOAkbustsYvE3YoWhcBItC1EllyKamJ0/u8jqXeKtC"
+    "2/W+GXOCbvJOrh8fTc8ehf+sizoOOf9KCPr4EP9d+1X7oLRvSfQt+xpoPxOO2hDRg8OkwY"
+    "EynDJGKsGTz6GAETk54+cHxImizom8geY9tzSasbOA5t9EwiaLuDtClw7R8BNLA3gHgIEe"
+    "n49p00264FX8jFo6/jJ6NvQ8fKDdi26L1Zu4EnY9b2+XP75j2TpLd7NEzPCUZuKj2e4KHn"
+    "JuJBYFsnVIf2DaALEcDQyjwGHWX0zHFTOGLSgFEAk6FaaYMF+yBwKBj6H/3ANSkGGrsT/d"
+    "P4MxpaRswwOt2e8dDqGYZeAjvTcynutospUL+m4XVTQFirTm9w/bF5f3R6/oZB4Pl4gFgn"
+    "g0ufMkWAQajKQE9RZp8FnK+HAIlxjuU5pMlAl8E4bkhBTg0shi8GaAOQ6iPwYjjQHeAh+V"
+    "o/O5uB8T/NewYzkWI4e2RFhIulE3XVwz6Kd4pvgJwy8EbiVUS31rhcBF4iJseXdeYBNhGk"
+    "kBgAF3G+IT3YHkEx1nlNDnIrUj2J/znECSAPaHVdZxI5rxnw99p3rYde8+4Tvd3I9384DL"
+    "9mr0V76qx1wrUenXMTlVxE+7fd+6jRr9rXbqfFu6VErvdVp2MCAfYM13s2gJXxs3FrjNqU"
+    "vin6TxkvRhsegfn0DJBl5HpS8/AxHPtFy7iK1N7/fQ8dwIAt2kDmlflALnOAFjCNbT5uTS"
+    "0hhQgF7hoQug/cqgJEyQ9cEaIm4wk9eqUqwUSXoFf3ZIuy2DWqj8TrNLCxCOM74E56Hv3L"
+    "nHibDAC4poiCZFcrvdhmON8OQD6Ons0QUPnkSRG1QPIyS16LMXnve4hNxROc6DGzD8E2Qs"
+    "6cTFZGgmpH3XiIvGAwzOumsQGZADIYiENe03y4bt4wf29koU9MZQRcMGBNFILpcdHHSkKW"
+    "2P/OCVkSb69CluqGLB6yICoC3XaxGOdEnoOarrDDc8VkvOTjbf1d46JxeXreuCQibKBJy8"
+    "UM2NudHsefbXr1wIzfXnlMe/BFAiqnVomAZRY/bn3p5ahxHJQc3TW/vMnR49tu50Msngli"
+    "rm+7Vxz08GUMTeq0ie3TBykBv0B1qSmIHMRrnYHMe25Rr51RWafr3l/g53jqQlSWR7cI7X"
+    "sPQXvg/g3LMLo4ZXmYsIooHQLPCYPIGpWQUE3loe6KDHwuK6NxnYSURSHfHE4Wh5eKklWX"
+    "kpEljANB9CZPdKYa26MO+qdW56bd+bApbPMJz7PaAunOs5o02Um78m8rusLKYBzLbxFh4k"
+    "dCVr2NhPJC6eQZyWQeX8cbCGz4r4duR4xvLM+njm0Ta/9pju1vLL7I+IzHwHYwYeMn9H67"
+    "cBsUn9nEjOdgnH+hF+CJWUhrDT8YjQCalGHGRU1FjJcgxmpX5ZXsqmRnnbyU0XKzntdcw6"
+    "wf0Prbo0mOMZk5y33btf3hUtPMqap53ud5VsmNNcQ83A4VjWZLYsrrrQDs4SwWlTRaGdbV"
+    "k0ZC610DtmzTcbH9/v202LnQ8mu2bFJul7UDBwJ5fifkJ6TiK6FEDLL1Ex7knt6myitmJn"
+    "eTVSzI7mZXuDy9m6wSld9V+V2V3105v0tuZwYIQdcUZLyk5Q2c1vaKHN5tCuY1VzhgDwNB"
+    "EbYU0ER+e1DWDgTKMfB9KPC4UixTBQUmD2Yf2E4pMFMFBSYPpo+98bgUmhkNBScPp8r/y6"
+    "Gubv5fZYZfR2Y4DNyWSWOq3PAiOUw/rspfQxJz6bMM+wHsgqm2VdNs2zzDtJ+OabvJo9Qy"
+    "ZQc2YrOdd2IjOfej8kfVzR+pU+abPWWeHVkBZnmtFKemCqVUoZQKlNZ7/Dy3RbI8Oymx5b"
+    "pvZrD5s8PpWdccvksdHV62ZuDgTg7HD8ofHM4cxC6eHM6UHIiODecPFq/j5HC69KRUNLs7"
+    "LiCj3Oa5nI4CJmikG/ZzCal+hbxnH6K3gQ+1UF0b2j720ETz+hrQ/MAk1/L7gaMRF3CsIT"
+    "h2wITeUHu2iQUGWCN8Vbu9vTvRuYle97UVRd5zitwnt4RojKLk86JMmVOrIGE+byzAl88b"
+    "UrpMu/KcLVpHRZjlRz0yKts/7bEburyRcx2RkzW9QGTm0r0aXk1t2KgNm9cah6gS742VeJ"
+    "cv7lZl3aqse5dl3esp6K7c3gePqaSSm9xe63y+vd3V7yskJcuCuDVbziwPWumDpcXT8yPW"
+    "rgs1Jh8GkURdO3K8AaGvLpEOizY1cwhIUHGsQYQ89OZYI7eHZH4tzXa1R4DNIfSL8epary"
+    "yIVr/Ftu7DH/r3VWLXK3sgJZpCXy6gl5GR7W1GKKKXv9Xrp6cX9drp+eVZ4+Li7LKW8Mxi"
+    "1yzCedX+QDlnjufEJHRG2TCZqsVJfiStfqVLVMNK0ShAKU8LxPIVzAes/3cfxmDieEDgKe"
+    "T5gIyKygeskA9QYavc6qsbtu4oztq3Gd5IoLXtiGBPQV02JNjxL641IbLNoS7axwp7ZkYD"
+    "IJXZm2Kq10K1V6R6chL9EyJfWNcjZ38ZlSoSwE1UUNFFVQLhSLyC6L6rLcKviZQUXdZXON"
+    "mIoWjHR86wMyqKYZdk2CVKldb/Mpv+D4zfSoA="
+)
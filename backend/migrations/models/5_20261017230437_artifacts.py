@@ -0,0 +1,90 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "artifacts" (
+    "hash" VARCHAR(64) NOT NULL PRIMARY KEY,
+    "content_type" VARCHAR(100) NOT NULL,
+    "size" INT NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL
+);
+COMMENT ON TABLE "artifacts" IS 'A stored file, addressed by the sha256 of its content.';
+        CREATE TABLE IF NOT EXISTS "run_artifacts" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "kind" VARCHAR(20) NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "artifact_id" VARCHAR(64) NOT NULL REFERENCES "artifacts" ("hash") ON DELETE CASCADE,
+    "run_id" UUID NOT NULL REFERENCES "test_runs" ("id") ON DELETE CASCADE
+);
+COMMENT ON TABLE "run_artifacts" IS 'Reference from a run to an artifact; identical files are stored once.';"""
+    return """
+        CREATE TABLE IF NOT EXISTS "artifacts" (
+    "hash" VARCHAR(64) NOT NULL PRIMARY KEY,
+    "content_type" VARCHAR(100) NOT NULL,
+    "size" INT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL
+) /* A stored file, addressed by the sha256 of its content. */;
+        CREATE TABLE IF NOT EXISTS "run_artifacts" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "kind" VARCHAR(20) NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "artifact_id" VARCHAR(64) NOT NULL REFERENCES "artifacts" ("hash") ON DELETE CASCADE,
+    "run_id" CHAR(36) NOT NULL REFERENCES "test_runs" ("id") ON DELETE CASCADE
+) /* Reference from a run to an artifact; identical files are stored once. */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "run_artifacts";
+        DROP TABLE IF EXISTS "artifacts";"""
+
+
+MODELS_STATE = (
+    "eJztXFlv2zgQ/iuCnlogDVLHOfbAAs7RrreJUyTubtGiEBiZtoXIoktRTbzd/PclJVEHRd"
+    "qWLV8KX3KQM5T0kRx9M5zRT3OEetD197vQJ+fAh+avxk/TAyP2R6FvzzDBeJz2sAYC7t1Q"
+    "mFApy6ZiYTO49wkGNqE9feD6kDb1oG9jZ0wc5NFWL3Bd1ohsKuh4g7Qp8JzvAbQIGkAyhJ"
+    "h2fP1Gmx2vB5/o4PG/4wer70C3l7thp8euHbZbZDIO2z59al+8CyXZ5e4tG7nByEulxxMy"
+    "RF4iHgROb5/psL4B9CAGBPYyj8HuMn5m3hTdMW0gOIDJrfbShh7sg8BlYJi/9wPPZhgY4Z"
+    "XYj+Yf8a1lxCyrc9O17i67lmWWwM5GHsPd8QgD6udzNG4KSNhqsguc/9m6fXV4/DqEAPlk"
+    "gMPOEC7zOVQEBESqIegpyuHvAs7nQ4DlOHN5AWl6o4tgzBtSkNMFxuHjAK0AUnMEniwXeg"
+    "MypP82jo6mYPx36zaEmUqFOCO6I6LN0om7GlEfwzvFN8BuGXhj8Tqie9A8nQdeKqbGN+zM"
+    "A2xjyCCxACnifEF7iDOCcqzzmgLkvVh1n/+xixNAH7B347mT2HhNgb/bvr6867auP7LLjX"
+    "z/uxvi1+pesp5G2DoRWl8dCxOVDGL80+7+abB/jS83nUvRLCVy3S8muycQEGR56NECvYyd"
+    "5a0ctWf2pug/ZKwYa7gH9sMjwD0r15MuD5/AsV9cGWex2rsPt9AFIbDFNZB5Zd7RYXZwBT"
+    "zzNc9b05WQQoQDrwKEbgOvrgAx8gOXhKgV8oQuG6lOMLEtiBpItSmLXaPGSL5PA4fIML4G"
+    "3qSL2M/QiLfpDQDPllGQ7G5lg62G820A5L342SwJlU+eFLMVSF9myWuRk/c+wuFUPMCJyZ"
+    "l9BLYVceZksjISTDvuJkOMgsEwr5v6BnQC6M1AEvGa1t156yK091YW+mSpjIAHBmETg+B5"
+    "r2hjFS4Lt78zXJbE2muXpb4uC8I9iItAtz0ixzmRF6BmO2z3TDG9X/rrTeNt86R5enjcPK"
+    "Ui4Y0mLSdTYG93ugJ/dtjogc3fXnlMu/BJAaqgVguHZRo/vvzczVFj7pS8um59fp2jx1c3"
+    "nfdcPOPEnF/dnAnQw6cxtJnRpmufPUgJ+CWqC01BbCBe6gxk3nPzWu2MSpWme3uBn2GpC1"
+    "5ZHt0itO8Qhs7A+wDLMDoestxNWGWUDoPHhEFkF5WUUD2rXd0lGfhMVsb8OgUpi12+GZyM"
+    "u5eaktWXktEtTAKJ96YOdKYa66MO5sfLzkW7835V2OYDnkcHc4Q7jw6UwU7WlX9bsR1WBm"
+    "Muv0aEqR2JWPU6AspzhZOnBJNFfF00kKzhv+5uOnJ8ubwYOnZsYvxnuI6/Mv8iYzPuA8cl"
+    "lI3vs+ttwmwwfKYTM5GDCfaFDSASs4jWWn4wGgE8KcOMi5qaGC9AjPWpygs5VcnOOn0p48"
+    "VmPa9Zwazv0P7boknmmEyd5b7jOf5woWkWVPU8b/M86+BGBT6PcELFvNmSmIp6SwC7O5tF"
+    "B42WhnX5oJF09VaAbXjoON95/3au2JnQinu2bFBuk7kDOwJ5/iTkB2TiS6FEF+TlD7iTZ3"
+    "pzYUQJttMHdgUwteKR6oTUKsPgib2TxMGztlAdCE/siY6E60i4joQvHQmnl7MDjKFnS2KD"
+    "ykQQQWt96SBvVwVzxbkgBBEgSVdXAprIrw/Kgx2Bcgx8H0osrhLLVEGDKYLZB45bCsxUQY"
+    "MpgukTNB6XQjOjoeEU4dQnJWqo63tSomPoLyOGHjluiwR8dRR9nmivz+sXKgj3Llz1sR3A"
+    "zhmUXDYguc5qr+00TOsNHqUrU1XawpftrNqWpEJKx4/qGz/S9firrcfP3lkBZnVWmaCmU8"
+    "p0Spl2lKot1M8dkSzOTkocTm/bMlh9lXVaFZzDd6Ei60WzK3auxpo/qFhinSlZL9ZYZ5Iz"
+    "ZAXW+RLsKmqs062npKLZPAIJGRXSDNR0FISCVpraMJOQmmcYPfoQvwl8aETqxtDxCcITA/"
+    "UNYPiBTcfy+4FrUBOwZ2A4dsGEXdB4dOgKDIhB+apxdXW9bwoTXfXYmiJvOUXu00tCPMZx"
+    "8Hlepiyo1ZAwHzfn4MvHTSVdZl15zhbvoyLM6qKYjMr662I2Q5dXUgETG1kbBbJlrjyrEd"
+    "X0gY0+sHmpfohOhl9ZMnz5NHidAK8T4DeZAF9N6nvtzj5ETBU57/TyRufT1dWmvkSRJHdL"
+    "/NZs4rfaaWUPlqaZz/ZYbzxohPKRE0nVjVcuGlD66lHpKGnTsIeAOhV7BsQY4dd7Br08pP"
+    "PbMxzPuAfEHkK/6K9WOrLEW/3K17oPv5vflvFdz5yBkmhKbbmEXsaLbGsjQjG9/KXRODw8"
+    "aRwcHp8eNU9Ojk4PEp5Z7JpGOM/a7xnnzPEcTkKnpA3TqZqf5MfS+ntmshxWhkYBSnVYgM"
+    "vXMB5Q/RcyxmDiIiCxFOp4QEZFxwOWiAdot1W96uvrtm7Iz9q2GV6Jo7Vuj2BLQV3UJdjw"
+    "t+mSIkbZSVamwHHKMVa2oHK2Q9AyWGCbMvC+49JuuofpSvPp//eT8PzIH4LG0THj9A6h/B"
+    "15hFL8IvtffJglDqaGwB+WIUVcvhpStFl+v5IjEjWTj2fMKstDRb0a8tG3B/MQUiqlhD/s"
+    "E8pZnH8lOKtdp1hc+076aOQFc8yFUrQw7ENWPbvs9yz0JwgWiX9OIzwCotOjoCV5zy2fda"
+    "OP0SgOWBJkAM/gI/1mOD367nJs4Ia0xqc9kPMcRFWLNKiyUXW6zhZ4WdMI0QN9vjJEiMvX"
+    "kABVH5DTb+yX8saWfQpIGhpS7yxBrYYbrPoMOB2A0wG4bQ/AyUxDBcDWkKOLyAoWcavimx"
+    "A79tCURTejnqk8H6QyW1Ms+lJSCZYMx6iZ9A+IfWndovqVn1Gp4et+JRWibFOVIVWReA3R"
+    "XUm4Ng5zFxFWZxBkVHQGQckMghJxvupfZs//A5EebnU="
+)
@@ -0,0 +1,91 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "step_timings" (
+    "id" BIGSERIAL NOT NULL PRIMARY KEY,
+    "step" INT NOT NULL,
+    "started_at" TIMESTAMPTZ NOT NULL,
+    "duration_ms" DOUBLE PRECISION NOT NULL,
+    "llm_calls" INT NOT NULL,
+    "input_tokens" INT NOT NULL,
+    "output_tokens" INT NOT NULL,
+    "spans" JSONB NOT NULL,
+    "run_id" UUID NOT NULL REFERENCES "test_runs" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_step_timing_run_id_7ad0fd" UNIQUE ("run_id", "step")
+);
+COMMENT ON TABLE "step_timings" IS 'Where the time of one agent step went (see app.agent.timing).';"""
+    return """
+        CREATE TABLE IF NOT EXISTS "step_timings" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "step" INT NOT NULL,
+    "started_at" TIMESTAMP NOT NULL,
+    "duration_ms" REAL NOT NULL,
+    "llm_calls" INT NOT NULL,
+    "input_tokens" INT NOT NULL,
+    "output_tokens" INT NOT NULL,
+    "spans" JSON NOT NULL,
+    "run_id" CHAR(36) NOT NULL REFERENCES "test_runs" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_step_timing_run_id_7ad0fd" UNIQUE ("run_id", "step")
+) /* Where the time of one agent step went (see app.agent.timing). */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "step_timings";"""
+
+
+MODELS_STATE = (
+    "eJztXVlv47Ya/SuEnzJAGmSctb0XBZzEM3WbOIPEc1u0KARGpm0hsuihqMm40/z3S9JaKV"
+    "K2bHlT+JKF5EfJh9v5Nvp7Y4z7yPWPesin19BHjZ/A94YHx/yPXN0haMDJJKnhBRQ+uaIx"
+    "Za0smzUTxfDJpwTalNUMoOsjVtRHvk2cCXWwx0q9wHV5IbZZQ8cbJkWB53wJkEXxENERIq"
+    "zir79ZseP10TfWefjv5NkaOMjtZ17Y6fNni3KLTiei7PPnzs0H0ZI/7smysRuMvaT1ZEpH"
+    "2IubB4HTP+IyvG6IPEQgRf3Ux+BvGX7mqGj2xqyAkgDFr9pPCvpoAAOXg9H47yDwbI4BEE"
+    "/iP05/Dl8t1cyyuvc967Hds6xGCexs7HHcHY9yoL6/zvpNABGlDf6A619aDwcn5+8EBNin"
+    "QyIqBVyNVyEIKZyJCtATlMXvHM7XI0jUOEftJaTZiy6DcVSQgJxMsAi+CKA1QNoYw2+Wi7"
+    "whHbF/m2dnBRj/r/UgYGatBM6YrYjZYumGVc1ZHcc7wTcgbhl4w+Z1RPf49HIReFkzPb6i"
+    "MguwTRCHxII0j/MNq6HOGKmxzkpKkPdD0aPoj30cAPYB+/eeOw03rwL4e5279mOvdfeJP2"
+    "7s+19cgV+r1+Y1TVE6lUoPzqWBijsBv3d6vwD+L/jzvtuWt6W4Xe/PBn8nGFBsefjFgv3U"
+    "PhuVRqi98pNi8JzaxXjBE7SfXyDpW5maZHr4FE38/My4CsU+/PaAXCiAzc+B1JH5yLrZwx"
+    "nwGs35qDSZCQlEJPAqQOgh8OoKECc/aEWIWoIn9HhPdYKJL0HcxLpFma8aN8fqdRo4VIXx"
+    "HfSmPcx/ik28w14AeraKgqRXK+9sPZxvCyAfhp/NUlD5+JMSPgPZYRYfixF5H2AihuIZTR"
+    "sRs5+Bbc04czxYqRZcOqymI4KD4Sgrm+gGbADYyyA64zWtx+vWjdjvrTT08VQZQw8ORRGH"
+    "4PUwv8dqVJZo/52jssS7vVFZ6quyYNJHJA90x6NqnOP2EtR8he3fVszel/36ofn+9OL08u"
+    "T89JI1ES8al1wUwN7p9iT+7PDeAzs6vbKY9tA3DaiSWC0UliJ+3P6jl6HGkVJycNf6412G"
+    "Ht/edz9GzVNKzPXt/ZUEPfo2QTbftNnc5x+kBPwK0aWGINwg3uoIpM65RXftlEiVW/fuAj"
+    "9np85pZVl089B+wAQ5Q+83VIbRRSbL/YRVRekIfIkZRHpSKQnVq17VXZGBz2VlXK/TkLJQ"
+    "5ZvDySL10lCy+lIytoRpoNDe9IbORGJz1KHxqd296XQ/rgvbrMHz7HgBc+fZsdbYyauypx"
+    "VfYWUwjtpvEGG2j8xY9SYMyguZkwuMyTK+Lh4q5vCvj/ddNb5Re9l07NgU/Atcx1+bfpHa"
+    "M54Cx6WMjR/x521j2+D4FBMzmYNJ+wvvQCZmM1pr+cF4DMm0DDPOSxpivAQxNl6VN+JVSY"
+    "86O5TJcqOelaxg1Pdo/e3QIEeYFI7ywPEcf7TUMEuiZpx3eZyNcaMCnUfyUHFttiSmstwK"
+    "wO7PYjFGo5VhXd1opJy9FWArnI6L+ft3c8bOhVZes2WNctuMHdgTyLOekK+IN18JJTYh21"
+    "/RXvr0FsKIEWxnAO0KYGqFPdUVKUY9WR8r4sQjDnqiozrBtE5vQXwsKNwF6SND7y+It13j"
+    "MDAOA+MwWNlhwB5nB4Qgz1aYULXxMpLU5qJm3q8L5opDZiimUBHVrwU0br85KI/3BMoJ9H"
+    "2k2HG1WCYCBkwZzAF03FJgJgIGTBlMn+LJpBSaKQkDpwyncSjpoa6vQ8m4Gt6Gq2GmuC1j"
+    "FzfOhkWM4n6U5lGBVXzp5JjdAHZB2+2qdttNJsXt5sa0WeNRMjN1GUDRtJ2XAhQnkhn7UX"
+    "3tR+bagvVeW5B+sxzM+uA7ScxE3pnIO6MoVXufQcZFsoJ7a3Ef/q5Ng/UnoyfJ0xl8l8pF"
+    "XzYIZe9S0aMPKmeipzL786noqRgWVR56NlO9ilT0ZOlpqWg63EJBRqVoDD0dhaKhlUSAzC"
+    "WkjSuCX3xEfgh8BGbiYOT4FJMpwAMAgR/YrC9/ELiAbQGHgKCJC6f8geDFYTMwoIDxVXB7"
+    "e3fUkAa66r4NRd5xijxgj0RkQkLj86JMWRKrIWE+P12AL5+faukyr8pytnAd5WHW5w6lRD"
+    "afPrQduryWRKFwk7VxoJrmWl+NLGYcNsZh81b1EJMzsLacgfLZAiZPwOQJbDNPoJoMgdr5"
+    "PmRMNakB7PGg+/n2dlsXdsQx8Aq9NR0fr1da+QdLovHna6z3HgKi/UyJZOLgwMVDRl891n"
+    "oWtAnsEWRKxSFAhGDy7hCwxyM2vn3geOAJUnuE/Ly+WmnPCm31r2iu++hL4+9VdNcrZ6gl"
+    "msq9XEEvw0m2sxahkF7+2GyenFw0j0/OL89OLy7OLo9jnpmvKiKcV52PnHNmeE5EQgvCht"
+    "lQLU7yw9bm2jdVDCtHIwel3iwQta+hPaD6i0QmcOpiqNgp9PaAlIixB6xgDzBqq37W11dt"
+    "3ZKetWsjvBZFa9MawY6CuqxKsOUr/OJcT5UnK5UHWuDGSuedzlcIWoAbthkDHzguq2ZrmM"
+    "00n/3/NBX+I38Em2fnnNM7lPF37FFG8fPsf/luVnBMjaA/KkOKovbVkKLt8vu1uEj0TD4c"
+    "MassD5XlashH3x8vQkhZKy38ok5KZ3H+UeCsV53C5kZ3Mq6RN8wxlwrRImiAePbsqtd+1P"
+    "SmhjXbP4sIj4RosRW0JO95iEYdDAgehwZLigH0QNTTf4DTZ2eXY0NX0Bqf1aCI52AmmqdB"
+    "lfVqwnV2QMsqIkTP7POVIUJR+xoSoOoNcubEfisnturGJKVpSL+yJLEaLrDqI+CMAc4Y4H"
+    "bdAKfaGioAtoYcXUZW2hF3yb6ZuqZNde1Y5hK3govHWDsrdW3cfLr/OyPRSFgi+bnP7ZDY"
+    "Q0B8/QHgvYEX/teBjxCPSTgSFUezJ7zL0/yVeyuMb+DfnWcCHPYjwCH8nsNFzXRhc2OmU9"
+    "7gszO32e8a1HtC8iNMCll+PyDCkGaNFfa2Dy6GulzlrJw0ygMuWK+Rvbn/fHXbBp8e2ted"
+    "x04YexEPpagUx8UXd3YNQ+Oh3bqVvyLHHVs2dF0F1NpNKiNjEi3yX8A5CSg7uZ+RKqdXf+"
+    "5KYgZYGVgc0KWQzckZaHNH6wSqINWHt8UC5ruyMudqJd+VZWwvc2A3tpdt2162FPyEiGOP"
+    "GqrQp1nNYWHgU9JmZ26Seitq+IonlV7B/oqIr7zUSO8PSInU0Bewluuj+KIqgXDYvIbori"
+    "WWK4yBK8O/UiImvaAk1yoRBFT9Yfb6f7f69Hk="
+)
@@ -0,0 +1,84 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        ALTER TABLE "test_cases" ADD "max_steps" INT;
+        ALTER TABLE "test_cases" ADD "max_cost" DOUBLE PRECISION;
+        ALTER TABLE "test_cases" ADD "max_tokens" INT;
+        ALTER TABLE "test_cases" ADD "max_seconds" DOUBLE PRECISION;"""
+    return """
+        ALTER TABLE "test_cases" ADD "max_cost" REAL;
+        ALTER TABLE "test_cases" ADD "max_tokens" INT;
+        ALTER TABLE "test_cases" ADD "max_steps" INT;
+        ALTER TABLE "test_cases" ADD "max_seconds" REAL;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        ALTER TABLE "test_cases" DROP COLUMN "max_steps";
+        ALTER TABLE "test_cases" DROP COLUMN "max_cost";
+        ALTER TABLE "test_cases" DROP COLUMN "max_tokens";
+        ALTER TABLE "test_cases" DROP COLUMN "max_seconds";"""
+    return """
+        ALTER TABLE "test_cases" DROP COLUMN "max_cost";
+        ALTER TABLE "test_cases" DROP COLUMN "max_tokens";
+        ALTER TABLE "test_cases" DROP COLUMN "max_steps";
+        ALTER TABLE "test_cases" DROP COLUMN "max_seconds";"""
+
+
+MODELS_STATE = (
+    "eJztXW1v27YW/iuCP6VAFqTO63YvBjiJ23lL7CJx74YNg8BItC1EFl2Kaup1+e+XpPVKkb"
+    "Jly7Gs8Esbk+dQ0kOKfM45PNT31hTZ0PWPhtAn18CHrZ+M7y0PTNkfubpDowVms6SGFRDw"
+    "6HJhQqVMi4rxYvDoEwwsQmtGwPUhLbKhb2FnRhzk0VIvcF1WiCwq6HjjpCjwnC8BNAkaQz"
+    "KBmFb89TctdjwbfqONhz9nT+bIga6duWHHZtfm5SaZz3jZ58+9mw9ckl3u0bSQG0y9RHo2"
+    "JxPkxeJB4NhHTIfVjaEHMSDQTj0Gu8vwmaOixR3TAoIDGN+qnRTYcAQCl4HR+u8o8CyGgc"
+    "GvxP45/Tm8tZSYafYHQ/OhOzTNVgnsLOQx3B2PMKC+vyzaTQDhpS12getfOvcHJ+fvOATI"
+    "J2PMKzlcrReuCAhYqHLQE5T5/zmcrycAy3GO5AWk6Y2ug3FUkICcDLAIvgigLUDamoJvpg"
+    "u9MZnQn+2zswKM/9e55zBTKY4zom/E4mXph1XtRR3DO8E3wG4ZeEPxJqJ7fHq5CrxUTI0v"
+    "r8wCzC7iEzjz8zD3PCJHOaMjYE3vfgWsw7mgNlCP2U380H5/enF6eXJ+eklF+H3GJRcF2P"
+    "f6QwmoBD1BryyqiZKGVQ6rD+lFbAmuH1wEisZroidAO2KK+wduAXI3g89Xt13j0333uvfQ"
+    "G/TZVaZz/4ubVLIiWuAQDsF9t3Mrwdqia2FpoCMljfIKKFsYMihMIMH5htYQZwrlUGc1Bb"
+    "DtUPUo+mMflz/6gPbAc+fhoCjoiWHvrvsw7Nx94l3gR13QGXZZTTvbMWHpwbmwTMaNGL/3"
+    "hr8Y7Kfx56DfFUlhLDf8s8XuCQQEmR56NoGdYrlRaYTaC+Ppo6cUh2QFj8B6egbYNjM1yf"
+    "BQLMxXodqH3+6hCziw+TGQMlgeaDN7OAJeojEflSYjIYEIB7JFtixC94HXVICY6Qk3hKjD"
+    "rbQha6lJMLFXELWR6qXMV03bU/l7GtApXoLxHfDmQ8T+5ZN4j94A8CyZAZh+W1lj27G4dw"
+    "DyYfhspsSREj8pZiOQLmbxshi5TkYI8654gvNW5FdZgG0uPBZxZ6UkmHZYTSYYBeNJVjfx"
+    "zNAOoDcDF8vzdefhunPD53szDX08VKbAA2NexCB4OczPsQqHUTT/LnEYxbO9dhg112GEsA"
+    "1xCaswll/LIKzbVFy1Reiw1gMrWr2ymA7hNwWogloj3EVF/Lj7xzBDjSOX0MFd5493GXp8"
+    "O+h/jMRTLqTr28GVAD38NoMWm7Tp2GcPUgJ+iepaXbA/tuJWeiC1zq06a6dUqpy66wv8kp"
+    "k6Z5Vl0ZU4PxCGztj7DZZhdFHAaD9hlVE6DJ5jBpEeVFJC9aI2dTdk4EtZGbPrFKQsNPmW"
+    "cLLIvNSUrLmUjL7CJJBYb+owU6LxetSh9anbv+n1P24L22y46ex4hWDT2bEy1MSqBIcyfc"
+    "PKYBzJvyLCdB5ZsOrXCOetFMwrCOWJ+LpoLBnDvz4M+nJ8I3nRdexYxPjXcB1/a/ZFas54"
+    "DByXUDZ+xK63i2mD4VNMzEQOJswvrAGRmC1orekH0ynA8zLMOK+pifEaxFhHVd5IVCXd63"
+    "RRxuv1elazgl7fo/evRp0cYVLYyyPHc/zJWt0sqOp+rnM/a+dGBTaPEKFi1mxJTEW9DYDd"
+    "n5dFO402hnVzp5F09FaALQ86rhbvr+eIXQqt+M6Wdcrtcu/AnkCejYR8hUx8I5TogOx+hX"
+    "sZ01sJI0qwnRGwKoCpE7bUVKQo9aRtbIgT23Ew5A01CaZtRgviZUESLkgvGep4QTzt6oCB"
+    "DhjogMHGAQN6OSvAGHqWxIWq3C8jaL3erpn324K54i0zBBEgyalSAhrLvx6Ux3sC5Qz4Pp"
+    "TMuEosEwUNpgjmCDhuKTATBQ2mCKZP0GxWCs2UhoZThFMHlNRQNzegpEMNbyPUsDDc1vGL"
+    "62DDKk5xP0rzqMArvnZyTD2AXdF3u6nf9jWT4uo5Mb2u8ygZmaoMoGjYLksBihPJtP+ouf"
+    "4jfWjMdg+NSd9ZDmb15jtBTe+80zvvtKFU7XkGmRDJBuGt1WP4dRsG209GT5KnM/iulYu+"
+    "7iaUvUtFjx5UzERPZfbnU9FTe1hkeejZTPUqUtGTV09JRdPbLSRkVNiNoaajgAuayQ6QpY"
+    "S0dYXRsw/xD4EPjYW6MXF8gvDcQCMDGH5g0bb8UeAadAo4NDCcuWDOLmg8O3QEBsSgfNW4"
+    "vb07agkdXXXbmiLXnCKP6CUhnuHQ+bwqUxbUGkiYz09X4Mvnp0q6zKqynC18j/Iwq3OHUi"
+    "qvnz60G7q8lUShcJK1UCAb5spYjaimAzY6YPNW7RCdM7C1nIHy2QI6T0DnCewyT6CaDIHG"
+    "xT5ETBWpAfTyRv/z7e2uDuyI98BL7Nb0/ni10coeLNmNv9xiHXjQ4PILI5KqGwcuGlP66l"
+    "HpxaZNw5oAalQcGhBjhN8dGvTykPavbTie8QiINYF+3l6ttGWJtfpXNNZ9+KX19ya265Uz"
+    "VhJN6VwuoZfhIKutRyiklz+22ycnF+3jk/PLs9OLi7PL45hn5quKCOdV7yPjnBmeE5HQgm"
+    "3DtKtWJ/mhtD72TbaHlaGRg1LtFojkG+gPqP4gkRmYuwhIZgq1PyClov0BG/gDtNmqHvXN"
+    "NVt3ZGfVrYe3Ymi9tkVQU1DXNQl2fIRfnOspi2Sl8kALwljpvNPlBkHHYI5tysBHjkur6T"
+    "tMR5pPfz/OefzIn4D22Tnj9A6h/B15hFL8PPtfv5kNAlMT4E/KkKJIvhpStFt+v5UQiZrJ"
+    "hz1mluWhol4D+ej741UIKZVSws/rhHQW5x8JzmrTKRTXtpMOjbxhjrnWFi0MR5Blz2567E"
+    "dDT2rYsv+ziPAIiBZ7QUvynvuo140RRtPQYUmQATwjauk/hmPTtcuxgMtpjU9rYMRzEFXN"
+    "06DKWtXbdWpgZRURoif6fGWIUCTfQAJUvUNOr9hvZcWWnZgkdQ2p3yxBrYEvWPU74LQDTj"
+    "vg6u6Ak00NFQDbQI4uIivMiHXyb6aOaZMdO5Y5xK3g4DEqZ6aOjVtO93+nJBpyTyRb95kf"
+    "EnnQ4J8/MFhrxjP768CHkO1JOOIVR4srvMvT/I1bK9zfwL6dpzc47McGh/A7h6u66UJx7a"
+    "aTnuBTm9Ps6wb1npD8CJNClm8HmDvSzGm5T9oLemt+bH2PeraKr6277tS0gOtKoFZOUhkd"
+    "nWiR/wDnLCB05X6Cspxe9borqGlgRWBRQNZCNqenoc0trTMgg1S9vS1W0N/KyqyrlXwrS/"
+    "telsCufS+79r3saPMTxI41acm2Pi1qDgs3PiUytTlJ6q2Y4RuuVGoD+yvEvvRQI3U8IKXS"
+    "wFjAVo6PYi9VCYRD8Qaiu5W9XOEeuDL8K6Wi0wtKcq0Sm4CqX8xe/g8o9bPd"
+)
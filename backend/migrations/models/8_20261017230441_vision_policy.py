@@ -0,0 +1,78 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        ALTER TABLE "test_cases" ADD "vision_policy" VARCHAR(20);
+        ALTER TABLE "test_steps" ADD "vision_policy" VARCHAR(20);
+        ALTER TABLE "step_timings" ADD "vision" BOOL;"""
+    return """
+        ALTER TABLE "test_cases" ADD "vision_policy" VARCHAR(20);
+        ALTER TABLE "test_steps" ADD "vision_policy" VARCHAR(20);
+        ALTER TABLE "step_timings" ADD "vision" INT;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "test_cases" DROP COLUMN "vision_policy";
+        ALTER TABLE "test_steps" DROP COLUMN "vision_policy";
+        ALTER TABLE "step_timings" DROP COLUMN "vision";"""
+
+
+MODELS_STATE = (
+    "eJztXW1z4jgS/isuPiVV2VSGvN7e1VVBwsxyS2CKkNut3dpyKUaAK8ZibHky3Gz++0nyuy"
+    "wZDAaMR19mgtQt249k6elWt/y9MUdjaLnnI+jie+DCxs/a94YN5vSPTN2Z1gCLRVxDCzB4"
+    "sZgwJlK6QcRYMXhxsQMMTGomwHIhKRpD13DMBTaRTUptz7JoITKIoGlP4yLPNr94UMdoCv"
+    "EMOqTiz79IsWmP4TfSePBz8apPTGiNUzdsjum1WbmOlwtW9vzcffjIJOnlXnQDWd7cjqUX"
+    "SzxDdiTueeb4nOrQuim0oQMwHCceg95l8MxhkX/HpAA7HoxudRwXjOEEeBYFo/GviWcbFA"
+    "ONXYn+c/Xv4NYSYrreH4z0p85I1xsFsDOQTXE3bUyB+v7utxsDwkob9AL3v7SGJ5c3pwwC"
+    "5OKpwyoZXI13pggw8FUZ6DHK7P8Mzvcz4IhxDuU5pMmNboJxWBCDHA+wEL4QoB1A2piDb7"
+    "oF7SmekZ/N6+scjP/bGjKYiRTDGZE3wn9Z+kFV06+jeMf4eo5VBN5AvI7oXlzdrQMvEZPj"
+    "yyrTANOLuBgu3CzMXRuLUU7pcFiTu18D62AuqAzUU3oTPzU/XN1e3V3eXN0REXafUcltDv"
+    "bd/kgAKkav0C6KaqykYBXD6kJykbEA148WAnnjNdbjoJ1QxeMDNwe5h8Fzu9fRPg87992n"
+    "7qBPrzJful+suJIWkQITMwiGnVZPgLVB1sLCQIdKCuU1UP5quuSG9AWyTGNZZKHLKG605F"
+    "UMbH7FW2u9y1nt+LXOcCDFQgeCUf1AarA5h2K405oc1uNA9Tz84xjJBnnA8cC2lsGoyIF+"
+    "1H3sPI1aj5/ZgHfDAd8adWhNM/0aBKUnN1w3RY1ov3VHv2j0p/bHoN/hKXgkN/qjQe8JeB"
+    "jpNnrTwThhU4SlIWrv1CqavCYYOy14AcbrG3DGeqomHh4SGtQO1D7+OoQWYMBmx0DCPHwi"
+    "zRzhCHgPx3xYGo+EGCLHE1GaoggNPbuuAFFDH24JUYvZxCPaUp1goq8gaiLZS5mtmjfn4v"
+    "fUIwuqAONHYC9HiP7LJvEuuQFgGyJzO/m20sZ24984AMhnwbPpArdV9KQOHYFkMYuWxdBR"
+    "NUEO64pXuGyEXiwfbN33D0WdlZCg2kE1njnIm87SurEfjHQAuRnok6H71tN964HN93oS+m"
+    "iozIENpqyIQvB+lp1jJe65cP5d4Z6LZnvlnquvew45Y+gUsMEj+Y3M76pNxWXb3yZt3TPC"
+    "1SuN6Qh+k4DKqdXCOZfHjzu/j1LUODRJTh5bv5+m6HFv0P8UiidMmPveoM1BD78toEEnbT"
+    "L26YMUgF+gWgdjcd89oEz1vZrqMatYd41MqJS5UFZ3mK9YFzM2cBpdgWMPOdCc2r/CIvw5"
+    "3Aw9TlhFBNoBbxFfSw4qIX19lzsWtrR3VnJgakVLKHBgYK9gwKExrwhwfQkweYWxJ7CV5c"
+    "tVrLE/otb43Ok/dPufdoVterW6Xme1upavVteZ1Yq+YUUwDuX3iDCZR3wb5hjZgIWmgjH8"
+    "n6dBX4xvKM876k0Da39rlunuzJpLzBkvnmlhYvuc0+sdYtqg+OTTYJ7xcvMLbYCnwb4Rob"
+    "vefA4cAQ+W2yFZzToQ4X2bIWoPSz4L1WsPK9nrZFF2Nuv1tGYJvX5E71+FOjnEJLeXJ6Zt"
+    "urONuplTVf1c5X5Wzo0SbB5uP5BaswUx5fW2APZ4XhblNNoa1u2dRsLRWwK2bIt3veiKao"
+    "7YldDy72xRp9whIzWOBPL0vtNXSMW3QokMyM5XeJQ7qGthRAi2OQFGCTC1gpbqihShnqSN"
+    "LXGi8R0j1lCdYNrlbkG0LAi2C5JLhny/IJp21YaB2jBQGwZbbxiQyxme40BbFEogjU7itP"
+    "YXo/RhVzCXHKCEEQaCfEEpoJH8/qC8OBIoF8B1oWDGlWIZKygweTAnwLQKgRkrKDB5MF2M"
+    "FotCaCY0FJw8nGpDSQ51fTeU1FbDj7HV4Btum/jF1WbDOk5xN0yqKcErvnEqUjWAXdN3u6"
+    "3fdp8piNWcmPbrPIpHpizfKhy2qxKuorQ95T+qr/9IHYi02wORkneWgVkefMepqcg7FXmn"
+    "DKVyT49IbZFssb21/h5+1YbB7lP/41T1FL4bZf5vGoRydIn/4YPyef+JcxSyif+JGBZR1n"
+    "/6XIAyEv/jV09KRZPhFgIyykVjyOkoYIJ6HAGykpA22g56c6Hzk+dCzVfXZqaLkbPU0EQD"
+    "musZpC134lkamQLONAcuLLCkF9TeTDICPawRvqr1eo/nDa6jy25bUeSKU+QJuSR0Fk7gfF"
+    "6XKXNqNSTMN1dr8OWbKyldplVpzha8R1mY5blDCZX9pw8dhi7vJFEomGQN5ImGuXSvhldT"
+    "GzZqw+ZHtUNUzsDOcgaKZwuoPAGVJ3DIPIFyMgRqt/fBYypJDSCX1/rPvd6hDuyIYuAFdm"
+    "syPl5utNIHi6PxV1usAxtqTN43Iom6dmKhKaGvNpH2gzY1YwaIUXGmQcdBzumZRi4PSf+O"
+    "NdPWXgA2ZtDN2qultiywVv8Mx7oLvzT+2sZ2bZtTKdEUzuUCehkMssp6hAJ6+Y9m8/Lytn"
+    "lxeXN3fXV7e313EfHMbFUe4Wx3P1HOmeI5IQnNCRsmXbU+yQ+k1SF7ohhWikYGSrlbIJSv"
+    "oT+g/INEFmBpISCYKeT+gISK8gds4Q9QZqt81NfXbD2QnVW1Ht6JobVvi6CioG5qEhz4CL"
+    "8o11O0k5XIA83Zxkrmna42CFoadWwTBj4xLVJN3mEy0lzy+2XJ9o/cGWhe31BOb2LC35GN"
+    "CcXPsv/Nm9liY2oG3FkRUhTKl0OKDsvvd7JFImfyQY/pRXkor1dDPvrhYh1CSqSk8LM6Lp"
+    "3F/J8AZ7npFIgr20ltjfzAHHOjEC0HTiDNnt322I+antSwY/9nHuHhEM33ghbkPcOw17WJ"
+    "g+aBwxIjDdha2NI/NXNM1i7TABajNS6pgSHPQUQ1S4NKa1WF61TAysojRK/k+YoQoVC+hg"
+    "RIfZJPrdhleIXCGVLoGpK/WZxaDV+w8iPglANOOeCq7oATTQ0lAFtDjs4jy82IVfJvJo5p"
+    "Ex07ljrELefgMSKnJ46NW033fyMkGjJPJF33qR8S2VBjnz/QaGvaG/3rxIWQxiScs4pz/w"
+    "qnWZq/dWu58Q30S4UqwOE4AhyCr0qu66YLxJWbTniCT2VOs68a1EdC8kNMcln+2HOYI02f"
+    "C/xtHy0EZLnKaT2ulydUsV49+zB4bvc62udh57771A1iL6KuZJVsufhi+ccwNIadVo//RI"
+    "411w1gWQKopZNUSkclWmQ/d7rwMFm5X6Eop1e+7nJqClgeWOThjZDN6CloeWj9j40KiCJC"
+    "FgS2GNdYiQP0hWitgWg1Q8WF3G8w6KWWz3aXP/nh+bHdGZ58OE3PuAISswCiwSsPJIwU1F"
+    "fJUl1QylfJlJdrBezKy3VoL9eBwsygYxqzhijIzK85yw0xi2Uqc2bXj+Lw2JITyF0ZX6Ej"
+    "Jgk53zCPVWq467KTg7roS1UA4UC8hujuJGouiDYswr8SKiqRoyDXKhBuVf5i9v5/EDkSPw"
+    "=="
+)
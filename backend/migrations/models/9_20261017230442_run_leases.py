@@ -0,0 +1,84 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        ALTER TABLE "test_runs" ADD "heartbeat_at" TIMESTAMPTZ;
+        ALTER TABLE "test_runs" ADD "lease_owner" VARCHAR(255);
+        ALTER TABLE "test_runs" ADD "attempts" INT NOT NULL DEFAULT 0;"""
+    return """
+        ALTER TABLE "test_runs" ADD "heartbeat_at" TIMESTAMP;
+        ALTER TABLE "test_runs" ADD "attempts" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "test_runs" ADD "lease_owner" VARCHAR(255);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        ALTER TABLE "test_runs" DROP COLUMN "heartbeat_at";
+        ALTER TABLE "test_runs" DROP COLUMN "lease_owner";
+        ALTER TABLE "test_runs" DROP COLUMN "attempts";"""
+    return """
+        ALTER TABLE "test_runs" DROP COLUMN "heartbeat_at";
+        ALTER TABLE "test_runs" DROP COLUMN "attempts";
+        ALTER TABLE "test_runs" DROP COLUMN "lease_owner";"""
+
+
+MODELS_STATE = (
+    "eJztXW1z4rYW/isePiUzaSZLXtt7pzMkYbe0BHYIue200/EoRoAnxmJtebN0m/9+Jfldlg"
+    "wGA8bRl90g6Uj2o5fznKMj+XtjhkbQck+H0MV3wIWNn7TvDRvM6B+ZvBOtAebzOIcmYPBs"
+    "scKYlNINUowlg2cXO8DAJGcMLBeSpBF0DcecYxPZJNX2LIsmIoMUNO1JnOTZ5hcP6hhNIJ"
+    "5Ch2T89TdJNu0R/EYqD37OX/SxCa1R6oHNEW2bpet4MWdpT0+d+4+sJG3uWTeQ5c3suPR8"
+    "gafIjop7njk6pTI0bwJt6AAMR4nXoE8ZvHOY5D8xScCOB6NHHcUJIzgGnkXBaPx37NkGxU"
+    "BjLdF/Ln4OHi1RTNd7/aH+2B7qeqMAdgayKe6mjSlQ39/8emNAWGqDNnD3S2twdH51zCBA"
+    "Lp44LJPB1XhjggADX5SBHqPM/s/gfDcFjhjnsDyHNHnQdTAOE2KQ4wEWwhcCtAVIGzPwTb"
+    "egPcFT8rN5eZmD8f9aAwYzKcVwRmRG+JOlF2Q1/TyKd4yv51hF4A2K1xHds4ubVeAlxeT4"
+    "ssw0wLQRF8O5m4W5Y2MxyikZDmvy9CtgHawFlYF6Qh/ih+aHi+uLm/OrixtShD1nlHKdg3"
+    "2nNxSAitELtIuiGgspWMWwupA0MhLg+tFCIG+8xnIctGMqeHjg5iB333+67ba1z4P2Xeex"
+    "0+/RVmYL94sVZ9IkkmBiBsGg3eoKsDaILiwMdCikUF4B5a+mSx5InyPLNBZFFF1GcC2VVz"
+    "GweY23kr7L0Xa8rjMcSLHQgWBU35McbM6gGO60JIf1KBA9Df84RLJBXnDUt61FMCpyoB92"
+    "HtqPw9bDZzbg3XDAt4ZtmtNMT4Mg9eiK66aoEu33zvAXjf7U/uz32jwFj8oN/2zQZwIeRr"
+    "qNXnUwStgUYWqI2hu1isYvCcZOE56B8fIKnJGeyomHh4QG3QZiH38bQAswYLNjIGEePpJq"
+    "DnAEvIVjPkyNR0IMkeOJKE1RhAaeXVeAqKEPN4SoxWziIa2pTjDRKYiaSDYps1mz5kw8Tz"
+    "2iUAUYPwB7MUT0X7aId8gDANsQmdvJ2Uor245/Yw8gnwTvpgvcVtGbOnQEEmUWqcXQUTVG"
+    "DuuKF7hohF4sH2zd9w9FnZUoQaWDbDx1kDeZpmVjPxjpAPIw0CdDd63Hu9Y9W+/1JPTRUJ"
+    "kBG0xYEoXg7SS7xkrcc+H6u8Q9F632yj1XX/ccckbQKWCDR+XXMr+rthSXbX+btHbPCLVX"
+    "GtMh/CYBlROrhXMujx+3/ximqHFokhw9tP44TtHjbr/3KSyeMGHuuv1bDnr4bQ4NumiTsU"
+    "9fpAD8AtE6GIu77gFlqu/UVI9Zxao6MiFSpqKs7jBfohczNnAaXYFjDznQnNi/wSL8OdwM"
+    "PUxYRQTaAa8RX0sOKiF9fZM7Fja0d5ZyYGpFSyhwYGAvYcChMa8IcH0JMJnC2BPYynJ1FU"
+    "vsjqg1Prd7953ep21hm9ZWl6toq0u5trrMaCs6w4pgHJbfIcJkHfFtmENkAxaaCMbwr4/9"
+    "nhjfsDzvqDcNrP2rWaa7NWsusWY8e6aFie1zStvbx7JB8cmnwTzj5dYXWgFPg30jQne92Q"
+    "w4Ah4st0OyknUgwrs2Q9QelnwVqtceVrLXiVJ21uv1tGQJvX5A869CnRxiktvLY9M23ela"
+    "3cyJqn6ucj9bkFqV6NUW+ablrJETq4P23EEE6RSSBfCZqL41ZhUvq6ZVlacVwBjO5rhIzG"
+    "VSZHdbPmfbmk0l7/coJ2wJvhkuboF63QpiysttAOzhrD7Kub0xrJs7t4WjtwRsWSjKalFg"
+    "1RyxS6Hl52zRzYN9RpQdCOTp/fGv0BZp/iIokQHZ/goPMtJjJYwIlzXHwCgBplZQU12RIl"
+    "ye1LEhTjQObcgqqhNM29zVjNSCYFszqTLk+5rRsqs2NtXGptrY3HhjkzRneI4DbVHIk9Sq"
+    "5qR2Z1h/2BbMJRvWGGEgONcsBTQqr3wUPJRz4LpQsOJKsYwFFJg8mGNgWoXAjAUUmDyYLk"
+    "bzeSE0ExIKzowzUm18v8ONb7Ul+j72bnzDbR2/uNpsWMUp7oaH/0rwiq99ZLIawK7ou93U"
+    "b7vLo9LVXJh26zyKR6bsXGg4bJcdDI2OFyv/UX39R+ritu2G3SSfLAOzPEiYE6tDjJOKEK"
+    "5MV9TMUFrvlpvUFskG21ur7+FXbRhs/4qS+EqNFL5r3VCybhDKwV1QEr4ofz9J4r6X7AUl"
+    "iRgW0e0k6ftLyrigJJ56UiqaDLcQkFEuGkNORwErqMcRIEsJaePWQa8udH7wXKj54trUdD"
+    "FyFhoaa0BzPYPU5Y49SyNLwInmwLkFFrRB7dUkI9DDGuGrWrf7cNrgOrrsuhVFrjhFHpMm"
+    "oTN3AufzqkyZE6shYb66WIEvX11I6TLN4oLU/XmUhVl+xjEhsvtjjvuhy1s50BgssgbyRM"
+    "NcHjnOiakNG7Vh817tEHVmYGtnBoqfFlDnBNQ5gX2eEyjnhEDt9j54TCVHA0jzWu+p293X"
+    "xUJRDLzAbk3Gx8uNVvpicTT+cou1b0ONlfeNSCKuHVloQuirTUr7QZuaMQXEqDjRoOMg5/"
+    "hEI81D0r8jzbS1Z4CNKXSz9mqpNQus1b/Cse7CL42/N7Fdb82JlGgK13IBvQwGWWU9QgG9"
+    "/LHZPD+/bp6dX91cXlxfX96cRTwzm5VHOG87nyjnTPGckITmhA2Trlqd5Ael1WWgohhWik"
+    "YGSrlbICxfQ39A+RcezcHCQkCwUsj9AQkR5Q/YwB+gzFb5qK+v2bonO6tqPbwVQ2vXFkFF"
+    "QV3XJNjzVaPRWU/RTlbiHGjONlby3Olyg6ClUcc2YeBj0yLZZA6TkeaS388Ltn/kTkHz8o"
+    "pyehMT/o5sTCh+lv2vX80GG1NT4E6LkKKwfDmkaL/8fitbJHImH/SYXpSH8nI15KMfzlYh"
+    "pKSUFH6Wxx1nMf8R4Cw3nYLiynZSWyPvmGOuFaLlwDGkp2c3vfajpjc1bNn/mUd4OETzva"
+    "AFec8g7HVt7KBZ4LDESAO2Ftb0H80cEd1lGsBitMYlOTDkOYiIZmlQabWqcJ0KWFl5hOiF"
+    "vF8RIhSWryEBUp8OVRq7DK9QuEIKXUPymcWJ1XCClR8BpxxwygFXdQecaGkoAdgacnQeWW"
+    "5FrJJ/M3FNm+jasdQlbjkXj5FyeuLauOV0/3dCoiHzRFK9T/2QyIYa+0yLRmvTXulfRy6E"
+    "NCbhlGWc+i0cZ2n+xrXlxjfQL6qqAIfDCHAIvn67qpsuKK7cdMIbfCrz1Y2qQX0gJD/EJJ"
+    "fljzyHOdL0mcDf9tFCQHZWOS3H9fKYCtarZ+/7T7fdtvZ50L7rPHaC2IuoK1kmUxdfLP8a"
+    "hsag3eryn/KyZroBLKvILf0pGXXQIvtZ5rmHieZ+gaIzvXK9y4kpYHlgkYfXQjYjp6Dlof"
+    "U/iiwgighZENhiXGMhDtBnIrUCotUMFRdyv36/m1Kftx3+5oenh9v24OjDcXrFFZCYORAN"
+    "XnkgYSSgvp6Y6oJSvp6ovFxLYFdern17ufYUZgYd05g2REFmfs5JbohZXKYyd3a9F4fHhp"
+    "xA7sr4Ch0xSZDvvCREarjrspWLuuikKoBwULyG6G4lai6INizCvxIi6iBHQa5VINyqfGX2"
+    "9n/ZhIzB"
+)
@@ -19,4 +19,16 @@ if __name__ == "__main__":
     # unless we carefully control it. For production/stability, reload=False is safer.
     # If reload=True is needed, we must ensure the subprocess also sets the policy.
     # Uvicorn's 'loop="asyncio"' uses the default policy set above.
-    uvicorn.run("backend.main:app", host=settings.server.host, port=settings.server.port, reload=False, loop="asyncio")
+    if settings.server.workers > 1 and settings.event_bus.backend == "memory":
+        print(
+            "WARNING: server.workers > 1 needs event_bus.backend 'sqlite', "
+            "otherwise WebSockets and stop requests only see their own worker."
+        )
+    uvicorn.run(
+        "backend.main:app",
+        host=settings.server.host,
+        port=settings.server.port,
+        reload=False,
+        loop="asyncio",
+        workers=settings.server.workers,
+    )
@@ -0,0 +1,93 @@
+import os
+import time
+from datetime import timedelta
+
+import pytest
+from tortoise import timezone
+
+from backend.app.core.artifacts import artifact_store, attach_artifact, collect_garbage
+from backend.app.models.artifact import Artifact
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+@pytest.fixture(autouse=True)
+def artifact_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifact_store, "root", tmp_path / "artifacts")
+
+async def make_run(**kwargs):
+    case = await TestCase.create(name="Artifacts", url="http://example.com")
+    return await TestRun.create(case=case, status="PASSED", **kwargs)
+
+@pytest.mark.asyncio
+async def test_identical_content_is_stored_once():
+    first = await artifact_store.put(PNG)
+    second = await artifact_store.put(PNG)
+
+    assert first == second
+    assert len(list(artifact_store.root.glob("*/*"))) == 1
+
+@pytest.mark.asyncio
+async def test_served_with_etag(client):
+    run = await make_run()
+    digest = await artifact_store.put(PNG)
+    await attach_artifact(run.id, digest, "screenshot")
+
+    response = await client.get(f"/api/artifacts/{digest}")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["etag"] == f'"{digest}"'
+    assert "immutable" in response.headers["cache-control"]
+    assert response.content == PNG
+
+    response = await client.get(f"/api/artifacts/{digest}", headers={"If-None-Match": f'"{digest}"'})
+    assert response.status_code == 304
+
+    response = await client.get(f"/api/artifacts/{digest}", headers={"If-None-Match": f'"other", "{digest}"'})
+    assert response.status_code == 304
+
+    # A header that merely contains the ETag is not a match
+    response = await client.get(f"/api/artifacts/{digest}", headers={"If-None-Match": f'"{digest}"-gzip'})
+    assert response.status_code == 200
+
+    response = await client.get("/api/artifacts/" + "0" * 64)
+    assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_run_artifacts_listing(client):
+    run = await make_run()
+    digest = await artifact_store.put(PNG)
+    await attach_artifact(run.id, digest, "screenshot")
+    await attach_artifact(run.id, digest, "screenshot")
+
+    response = await client.get(f"/api/runs/{run.id}/artifacts")
+    assert response.status_code == 200
+    items = response.json()
+    assert [item["hash"] for item in items] == [digest, digest]
+    assert items[0]["size"] == len(PNG)
+    # Referenced twice, stored once
+    assert await Artifact.all().count() == 1
+
+@pytest.mark.asyncio
+async def test_garbage_collection():
+    old_run = await make_run()
+    await TestRun.filter(id=old_run.id).update(created_at=timezone.now() - timedelta(days=60))
+    new_run = await make_run()
+
+    shared = await artifact_store.put(PNG)
+    expired = await artifact_store.put(PNG + b"old")
+    orphan = artifact_store.write(PNG + b"orphan")
+    await attach_artifact(old_run.id, shared, "screenshot")
+    await attach_artifact(new_run.id, shared, "screenshot")
+    await attach_artifact(old_run.id, expired, "screenshot")
+    past = time.time() - 3600
+    os.utime(artifact_store.path(orphan), (past, past))
+
+    result = await collect_garbage(retention_days=30, grace_seconds=0)
+
+    assert result == {"expired_references": 2, "deleted_artifacts": 1, "deleted_orphan_files": 1}
+    assert artifact_store.exists(shared)
+    assert not artifact_store.exists(expired)
+    assert not artifact_store.exists(orphan)
+    assert await Artifact.filter(hash=expired).count() == 0
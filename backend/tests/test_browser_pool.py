@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from backend.app.agent.browser_pool import BrowserPool, PooledBrowser
+
+
+class FakeBrowserPool(BrowserPool):
+    """Pool that hands out fake browsers instead of launching Chromium."""
+
+    def __init__(self, *args, memory_mb=100.0, fail_reset=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.launched = 0
+        self.terminated = 0
+        self.resets = 0
+        self.fake_memory_mb = memory_mb
+        self.fail_reset = fail_reset
+
+    async def _launch(self, headless):
+        self.launched += 1
+        browser = PooledBrowser(cdp_url=f"http://127.0.0.1:{9000 + self.launched}/", headless=headless)
+        browser.memory_mb = lambda: self.fake_memory_mb
+        return browser
+
+    async def _reset(self, browser):
+        self.resets += 1
+        if self.fail_reset:
+            raise RuntimeError("CDP gone")
+
+    async def _terminate(self, browser):
+        self.terminated += 1
+
+async def settle(pool):
+    if pool._refill_task:
+        await pool._refill_task
+    await asyncio.sleep(0)
+
+@pytest.mark.asyncio
+async def test_prewarmed_browser_is_a_hit():
+    pool = FakeBrowserPool(size=1)
+    await pool.start()
+    await settle(pool)
+
+    browser = await pool.acquire()
+    assert pool.hits == 1
+    assert pool.misses == 0
+    await pool.release(browser)
+    await settle(pool)
+
+    assert pool.resets == 1
+    assert pool.stats()["idle"] == 1
+    assert pool.stats()["hit_rate"] == 1.0
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_exhausted_pool_launches_overflow_browser():
+    pool = FakeBrowserPool(size=1)
+    await pool.start()
+    await settle(pool)
+
+    first = await pool.acquire()
+    second = await pool.acquire()
+    assert pool.misses == 1
+    assert pool.stats()["leased"] == 2
+
+    await pool.release(first)
+    await pool.release(second)
+    await settle(pool)
+    # Only `size` browsers are kept warm, the overflow one is shut down
+    assert pool.stats()["idle"] == 1
+    assert pool.terminated == 1
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_browser_recycled_after_max_uses():
+    pool = FakeBrowserPool(size=1, max_uses=2)
+    await pool.start()
+    await settle(pool)
+
+    for _ in range(2):
+        browser = await pool.acquire()
+        await pool.release(browser)
+    await settle(pool)
+
+    assert pool.recycled == 1
+    assert pool.launched == 2
+    assert pool.stats()["idle"] == 1
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_browser_recycled_over_memory_ceiling():
+    pool = FakeBrowserPool(size=1, max_memory_mb=500, memory_mb=800.0)
+    browser = await pool.acquire()
+    await pool.release(browser)
+    await settle(pool)
+
+    assert pool.recycled == 1
+    assert pool.resets == 0
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_failed_reset_recycles_browser():
+    pool = FakeBrowserPool(size=1, fail_reset=True)
+    browser = await pool.acquire()
+    await pool.release(browser)
+    await settle(pool)
+
+    assert pool.recycled == 1
+    assert pool.terminated == 1
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_stats_endpoint(client):
+    response = await client.get("/api/stats/browser-pool")
+    assert response.status_code == 200
+    assert "enabled" in response.json()
+
+@pytest.mark.asyncio
+async def test_discarded_browser_is_not_reused():
+    pool = FakeBrowserPool(size=1)
+    browser = await pool.acquire()
+    # e.g. the run was interrupted in the middle of a browser action
+    await pool.release(browser, discard=True)
+    await settle(pool)
+
+    assert pool.resets == 0
+    assert pool.terminated == 1
+    assert pool.recycled == 1
+    await pool.close()
@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.agent.budget import Budget, BudgetTracker, step_fingerprint
+from backend.app.core.config import settings
+from backend.app.models.test_case import TestCase
+
+
+def budget(**limits):
+    return Budget(**{"max_steps": 30, "max_tokens": 0, "max_seconds": 0, "max_cost": 0, **limits})
+
+def history_item(url, *actions):
+    return SimpleNamespace(state=SimpleNamespace(url=url), model_output=SimpleNamespace(action=list(actions)))
+
+@pytest.mark.asyncio
+async def test_case_overrides_global_budget(monkeypatch):
+    monkeypatch.setattr(settings.budget, "max_tokens", 50000)
+    case = await TestCase.create(name="Budgeted", url="http://example.com", max_steps=10, max_cost=0.5)
+
+    limits = Budget.for_case(case)
+    assert (limits.max_steps, limits.max_tokens, limits.max_cost) == (10, 50000, 0.5)
+    assert limits.max_seconds == settings.budget.max_seconds
+
+def test_token_and_cost_limits(monkeypatch):
+    monkeypatch.setattr(settings.budget, "input_cost_per_million", 1.0)
+    monkeypatch.setattr(settings.budget, "output_cost_per_million", 4.0)
+
+    tracker = BudgetTracker(budget(max_tokens=10000), loop_threshold=0, no_progress_steps=0)
+    tracker.record_step(input_tokens=6000, output_tokens=1000)
+    assert tracker.exceeded() is None
+    tracker.record_step(input_tokens=3000, output_tokens=500)
+    assert "token budget" in tracker.exceeded()
+    assert tracker.snapshot()["cost"] == pytest.approx(0.015)
+
+    tracker = BudgetTracker(budget(max_cost=0.01), loop_threshold=0, no_progress_steps=0)
+    tracker.record_step(input_tokens=6000, output_tokens=1000)
+    assert "cost budget" in tracker.exceeded()
+
+def test_step_limit():
+    tracker = BudgetTracker(budget(max_steps=2), loop_threshold=0, no_progress_steps=0)
+    tracker.record_step()
+    assert tracker.exceeded() is None
+    tracker.record_step()
+    assert "step budget" in tracker.exceeded()
+
+def test_repeated_actions_abort():
+    tracker = BudgetTracker(budget(), loop_threshold=3, no_progress_steps=0)
+    click = {"click": {"index": 4}}
+    for _ in range(2):
+        tracker.record_step(fingerprint=step_fingerprint(history_item("http://a", click)))
+    assert tracker.exceeded() is None
+    # Same action on another page is progress
+    tracker.record_step(fingerprint=step_fingerprint(history_item("http://b", click)))
+    assert tracker.repeats == 1
+    for _ in range(2):
+        tracker.record_step(fingerprint=step_fingerprint(history_item("http://b", click)))
+    assert "repeated" in tracker.exceeded()
+
+def test_unchanged_page_aborts():
+    tracker = BudgetTracker(budget(), loop_threshold=0, no_progress_steps=2)
+    tracker.record_step(url="http://a", page_changed=True)
+    tracker.record_step(url="http://a", page_changed=False)
+    assert tracker.exceeded() is None
+    tracker.record_step(url="http://a", page_changed=False)
+    assert "no page change" in tracker.exceeded()
+    tracker.record_step(url="http://b", page_changed=False)
+    assert tracker.idle_steps == 0
+
+@pytest.mark.asyncio
+async def test_case_api_accepts_budget(client):
+    payload = {"name": "Budget", "url": "http://example.com", "max_steps": 12, "max_tokens": 40000, "steps": []}
+    response = await client.post("/api/cases", json=payload)
+    assert response.status_code == 200
+    assert response.json()["max_steps"] == 12
+
+    case_id = response.json()["id"]
+    response = await client.put(f"/api/cases/{case_id}", json={**payload, "max_steps": None})
+    assert response.json()["max_steps"] is None
+    assert response.json()["max_tokens"] == 40000
+
+    response = await client.post("/api/cases", json={**payload, "max_steps": 0})
+    assert response.status_code == 422
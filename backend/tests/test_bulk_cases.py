@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+from backend.app.core import bulk_cases
+from backend.app.core.bulk_cases import BulkCaseError, parse_json_array
+from backend.app.models.test_case import TestCase, TestStep
+
+
+def case_payload(i, steps=2):
+    return {
+        "name": f"Imported {i}",
+        "url": f"http://import{i}.com",
+        "steps": [{"order": n + 1, "instruction": f"Step {n + 1}"} for n in range(steps)],
+    }
+
+
+async def byte_chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def parse(data: bytes, size: int = 3):
+    return [item async for item in parse_json_array(byte_chunks(data, size))]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_reports_invalid_items(client):
+    payload = [case_payload(0), {"name": "No URL"}, case_payload(2, steps=0), case_payload(3)]
+    payload[3]["max_steps"] = 0
+
+    response = await client.post("/api/cases/bulk", params={"chunk_size": 2}, json=payload)
+    assert response.status_code == 200
+    result = response.json()
+    assert result["created"] == 2
+    assert result["failed"] == 2
+    assert [error["index"] for error in result["errors"]] == [1, 3]
+    assert result["errors"][0]["errors"][0]["loc"] == ["url"]
+
+    assert await TestCase.all().count() == 2
+    assert await TestStep.all().count() == 2
+    case = await TestCase.get(id=result["ids"][0]).prefetch_related("steps")
+    assert sorted(step.order for step in case.steps) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_ndjson_stream(client):
+    lines = [json.dumps(case_payload(i)) for i in range(3)] + ["{not json"]
+    response = await client.post(
+        "/api/cases/bulk",
+        content="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    result = response.json()
+    assert result["created"] == 3
+    assert result["errors"][0]["index"] == 3
+    assert "Invalid JSON" in result["errors"][0]["errors"][0]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_rejects_non_array(client):
+    response = await client.post("/api/cases/bulk", json={"name": "Single"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_export_round_trips_through_bulk_import(client):
+    await client.post("/api/cases/bulk", json=[case_payload(i, steps=3) for i in range(5)])
+
+    response = await client.get("/api/cases/export", params={"chunk_size": 2})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert len(exported) == 5
+    assert [step["order"] for step in exported[0]["steps"]] == [1, 2, 3]
+
+    response = await client.get("/api/cases/export", params={"format": "json", "chunk_size": 2})
+    assert [case["id"] for case in response.json()] == [case["id"] for case in exported]
+
+    response = await client.post("/api/cases/bulk", json=exported)
+    assert response.json()["created"] == 5
+    assert await TestCase.all().count() == 10
+
+
+@pytest.mark.asyncio
+async def test_json_array_is_parsed_across_chunk_boundaries():
+    items = [case_payload(0), {"name": "Überprüfung ✓", "url": "http://example.com"}, 12345, [], "a,]"]
+    data = json.dumps(items, ensure_ascii=False).encode("utf-8")
+    for size in (1, 3, 7, len(data)):
+        assert await parse(data, size) == items
+    assert await parse(b" [ ] ") == []
+
+
+@pytest.mark.asyncio
+async def test_json_array_stops_at_malformed_item():
+    items = await parse(b'[{"name": "ok"}, {"name": oops}, {"name": "never"}]')
+    assert items[0] == {"name": "ok"}
+    assert isinstance(items[1], BulkCaseError) and items[1].index == 1
+    assert len(items) == 2
+
+    items = await parse(b'[{"name": "ok"} {"name": "missing comma"}]')
+    assert isinstance(items[1], BulkCaseError) and items[1].index == 1
+
+
+@pytest.mark.asyncio
+async def test_json_array_item_size_is_capped(monkeypatch):
+    monkeypatch.setattr(bulk_cases, "MAX_ITEM_CHARS", 100)
+    items = await parse(json.dumps([{"name": "small"}, {"name": "x" * 500}]).encode("utf-8"), size=16)
+    assert items[0] == {"name": "small"}
+    assert "use NDJSON" in items[1].errors[0]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_reports_malformed_array_after_valid_chunk(client):
+    body = "[" + ",".join(json.dumps(case_payload(i)) for i in range(3)) + ", {broken]"
+    response = await client.post(
+        "/api/cases/bulk",
+        params={"chunk_size": 2},
+        content=body,
+        headers={"Content-Type": "application/json"},
+    )
+    result = response.json()
+    assert result["created"] == 3
+    assert result["errors"][0]["index"] == 3
+    assert "Invalid JSON" in result["errors"][0]["errors"][0]
@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+import pytest
+
+from backend.app.agent.cancellation import STOPPED, TIMEOUT, Interrupted, run_interruptible
+
+
+async def hang(cancelled: list):
+    try:
+        await asyncio.sleep(60)
+    except asyncio.CancelledError:
+        cancelled.append(True)
+        raise
+
+@pytest.mark.asyncio
+async def test_returns_result():
+    async def work():
+        await asyncio.sleep(0.01)
+        return 42
+    assert await run_interruptible(work(), asyncio.Event(), timeout=1) == 42
+
+@pytest.mark.asyncio
+async def test_stop_cancels_mid_step():
+    stop_event = asyncio.Event()
+    cancelled = []
+    asyncio.get_running_loop().call_later(0.05, stop_event.set)
+
+    start = time.monotonic()
+    with pytest.raises(Interrupted) as e:
+        await run_interruptible(hang(cancelled), stop_event, timeout=30)
+    assert e.value.reason == STOPPED
+    assert cancelled == [True]
+    assert time.monotonic() - start < 1
+
+@pytest.mark.asyncio
+async def test_timeout():
+    cancelled = []
+    with pytest.raises(Interrupted) as e:
+        await run_interruptible(hang(cancelled), None, timeout=0.05)
+    assert e.value.reason == TIMEOUT
+    assert e.value.timeout == 0.05
+    assert cancelled == [True]
+
+@pytest.mark.asyncio
+async def test_cancellation_wait_is_bounded():
+    async def stubborn():
+        # Ignores the first cancellation, like a step stuck in cleanup
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            await asyncio.sleep(60)
+
+    start = time.monotonic()
+    with pytest.raises(Interrupted):
+        await run_interruptible(stubborn(), None, timeout=0.05, cancel_grace=0.05)
+    assert time.monotonic() - start < 1
+
+@pytest.mark.asyncio
+async def test_errors_propagate():
+    async def fail():
+        raise ValueError("boom")
+    with pytest.raises(ValueError):
+        await run_interruptible(fail(), asyncio.Event(), timeout=1)
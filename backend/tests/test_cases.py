@@ -75,3 +75,50 @@ async def test_delete_test_case(client):
     # Verify it's gone
     check = await TestCase.get_or_none(id=case.id)
     assert check is None
+
+@pytest.mark.asyncio
+async def test_list_cases_paginated_and_projected(client):
+    for i in range(3):
+        await TestCase.create(name=f"Case {i}", url=f"http://page{i}.com")
+
+    response = await client.get("/api/cases", params={"limit": 2, "fields": "id,name"})
+    assert response.status_code == 200
+    first = response.json()
+    assert [set(item) for item in first] == [{"id", "name"}, {"id", "name"}]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await client.get("/api/cases", params={"limit": 2, "fields": "id,name", "cursor": cursor})
+    second = response.json()
+    assert "X-Next-Cursor" not in response.headers
+    assert len({item["id"] for item in first + second}) == 3
+
+    response = await client.get("/api/cases", params={"fields": "id,bogus"})
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_search_cases_by_name_or_url(client):
+    await TestCase.create(name="Login flow", url="http://a.com")
+    await TestCase.create(name="Checkout", url="http://shop.com/LOGIN")
+    await TestCase.create(name="Search", url="http://b.com")
+
+    response = await client.get("/api/cases", params={"q": "login"})
+    assert sorted(item["name"] for item in response.json()) == ["Checkout", "Login flow"]
+
+@pytest.mark.asyncio
+async def test_list_cases_etag_changes_on_write(client):
+    response = await client.post("/api/cases", json={"name": "Cached", "url": "http://cache.com", "steps": []})
+    case_id = response.json()["id"]
+
+    response = await client.get("/api/cases")
+    etag = response.headers["ETag"]
+    response = await client.get("/api/cases", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Another query is another representation
+    response = await client.get("/api/cases", params={"fields": "id"}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+    await client.delete(f"/api/cases/{case_id}")
+    response = await client.get("/api/cases", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json() == []
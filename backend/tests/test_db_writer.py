@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from tortoise import timezone
+
+from backend.app.core.database import sqlite_pragmas
+from backend.app.core.db_writer import DBWriter
+from backend.app.models.run_event import RunEvent
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+
+
+def events(run_id, seqs):
+    return [
+        RunEvent(run_id=run_id, seq=seq, type="log", payload={"data": seq}, created_at=timezone.now())
+        for seq in seqs
+    ]
+
+
+def test_sqlite_pragmas_from_config():
+    pragmas = sqlite_pragmas()
+    assert pragmas["journal_mode"] == "WAL"
+    assert pragmas["busy_timeout"] == 5000
+    assert pragmas["cache_size"] < 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batches_share_transactions():
+    case = await TestCase.create(name="Writer", url="http://writer.com")
+    runs = [await TestRun.create(case=case) for _ in range(4)]
+    writer = DBWriter(max_rows=1000)
+
+    await asyncio.gather(*(writer.bulk_create(RunEvent, events(run.id, range(1, 11))) for run in runs))
+    await writer.close()
+
+    assert await RunEvent.all().count() == 40
+    assert writer.transactions < len(runs)
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_only_fails_its_caller():
+    case = await TestCase.create(name="Writer", url="http://writer.com")
+    run = await TestRun.create(case=case)
+    other = await TestRun.create(case=case)
+    writer = DBWriter()
+    await writer.bulk_create(RunEvent, events(run.id, [1]))
+
+    duplicate = writer.bulk_create(RunEvent, events(run.id, [1]))
+    fine = writer.bulk_create(RunEvent, events(other.id, [1, 2]))
+    results = await asyncio.gather(duplicate, fine, return_exceptions=True)
+    await writer.close()
+
+    assert isinstance(results[0], Exception)
+    assert results[1] is None
+    assert await RunEvent.filter(run_id=other.id).count() == 2
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from backend.app.api.endpoints.runs import active_runs
+from backend.app.core.event_bus import CONTROL_CHANNEL, SQLiteEventBus, dispatch
+from backend.app.core.socket_manager import ConnectionManager
+
+
+async def start_bus(path, handler):
+    bus = SQLiteEventBus(path, poll_interval=0.01)
+    await bus.start(handler)
+    return bus
+
+async def wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+@pytest.mark.asyncio
+async def test_messages_reach_other_processes_only(tmp_path):
+    received_a, received_b = [], []
+
+    async def handler_a(channel, message):
+        received_a.append((channel, message))
+
+    async def handler_b(channel, message):
+        received_b.append((channel, message))
+
+    path = tmp_path / "bus.db"
+    bus_a = await start_bus(path, handler_a)
+    bus_b = await start_bus(path, handler_b)
+    try:
+        await bus_a.publish("run-1", {"type": "log", "data": "hello", "seq": 1})
+        await wait_for(lambda: received_b)
+
+        assert received_b == [("run-1", {"type": "log", "data": "hello", "seq": 1})]
+        await asyncio.sleep(0.05)
+        assert received_a == []
+    finally:
+        await bus_a.close()
+        await bus_b.close()
+
+@pytest.mark.asyncio
+async def test_new_subscriber_skips_history(tmp_path):
+    received = []
+
+    async def handler(channel, message):
+        received.append(message)
+
+    async def ignore(channel, message):
+        pass
+
+    path = tmp_path / "bus.db"
+    publisher = await start_bus(path, ignore)
+    await publisher.publish("run-1", {"type": "log", "data": "old"})
+    await wait_for(lambda: publisher.published == 1)
+
+    subscriber = await start_bus(path, handler)
+    try:
+        await publisher.publish("run-1", {"type": "log", "data": "new"})
+        await wait_for(lambda: received)
+        assert [m["data"] for m in received] == ["new"]
+    finally:
+        await publisher.close()
+        await subscriber.close()
+
+@pytest.mark.asyncio
+async def test_remote_events_keep_origin_seq():
+    manager = ConnectionManager()
+    manager.deliver("run-1", {"type": "log", "data": "a", "seq": 7})
+    manager.deliver("run-1", {"type": "log", "data": "b", "seq": 8})
+    # Stamped by a lagging producer: dropped instead of renumbered
+    manager.deliver("run-1", {"type": "log", "data": "c", "seq": 8})
+
+    assert manager.last_seq("run-1") == 8
+    assert [m["data"] for m in manager._channels["run-1"].buffer] == ["a", "b"]
+
+@pytest.mark.asyncio
+async def test_stop_request_from_other_process():
+    stop_event = asyncio.Event()
+    active_runs["run-remote"] = {"stop_event": stop_event}
+    try:
+        await dispatch(CONTROL_CHANNEL, {"type": "stop", "run_id": "run-remote"})
+    finally:
+        active_runs.pop("run-remote", None)
+
+    assert stop_event.is_set()
+
+@pytest.mark.asyncio
+async def test_event_bus_stats_endpoint(client):
+    response = await client.get("/api/stats/event-bus")
+    assert response.status_code == 200
+    assert response.json()["backend"] == "memory"
@@ -0,0 +1,102 @@
+import pytest
+from browser_use.llm.messages import SystemMessage, UserMessage
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+from pydantic import BaseModel
+
+from backend.app.agent.llm_cache import CachedChatModel, LLMCache
+
+
+class Output(BaseModel):
+    action: str
+
+class FakeLLM:
+    provider = "fake"
+    name = "fake"
+
+    def __init__(self, temperature=0.0):
+        self.model = "fake-model"
+        self.temperature = temperature
+        self.calls = 0
+
+    async def ainvoke(self, messages, output_format=None, **kwargs):
+        self.calls += 1
+        usage = ChatInvokeUsage(prompt_tokens=10, prompt_cached_tokens=None, prompt_cache_creation_tokens=None,
+                                prompt_image_tokens=None, completion_tokens=5, total_tokens=15)
+        return ChatInvokeCompletion(completion=output_format(action=f"click {self.calls}"), usage=usage)
+
+def prompt(day="2026-01-01", page="<button>Login</button>"):
+    return [
+        SystemMessage(content="You are a browser agent"),
+        UserMessage(content=f"<agent_state>Today:{day}</agent_state>\n<browser_state>\n{page}\n</browser_state>"),
+    ]
+
+@pytest.mark.asyncio
+async def test_repeated_prompt_is_served_from_cache(tmp_path):
+    cache = LLMCache(tmp_path / "cache.db")
+    llm = FakeLLM()
+
+    first = await CachedChatModel(llm, cache).ainvoke(prompt(), Output)
+    # Another run, another day: the date is not part of the key
+    second = await CachedChatModel(llm, cache).ainvoke(prompt(day="2026-01-02"), Output)
+
+    assert llm.calls == 1
+    assert second.completion == first.completion
+    assert second.usage is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    cache.close()
+
+@pytest.mark.asyncio
+async def test_page_state_change_misses(tmp_path):
+    cache = LLMCache(tmp_path / "cache.db")
+    llm = FakeLLM()
+    model = CachedChatModel(llm, cache)
+
+    await model.ainvoke(prompt(), Output)
+    await model.ainvoke(prompt(page="<button>Logout</button>"), Output)
+
+    assert llm.calls == 2
+    cache.close()
+
+@pytest.mark.asyncio
+async def test_high_temperature_bypasses_cache(tmp_path):
+    cache = LLMCache(tmp_path / "cache.db")
+    llm = FakeLLM(temperature=0.7)
+    model = CachedChatModel(llm, cache)
+
+    await model.ainvoke(prompt(), Output)
+    await model.ainvoke(prompt(), Output)
+
+    assert llm.calls == 2
+    assert cache.stats()["entries"] == 0
+    cache.close()
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = LLMCache(tmp_path / "cache.db", max_entries=2)
+    keys = [LLMCache.make_key("m", 0.0, f"prompt {i}") for i in range(3)]
+
+    await cache.put(keys[0], "a")
+    await cache.put(keys[1], "b")
+    await cache.get(keys[0])
+    await cache.put(keys[2], "c")
+
+    assert await cache.get(keys[1]) is None
+    assert await cache.get(keys[0]) == "a"
+    assert cache.stats()["evictions"] == 1
+    cache.close()
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_dropped(tmp_path):
+    cache = LLMCache(tmp_path / "cache.db", ttl_seconds=0)
+    key = LLMCache.make_key("m", 0.0, "prompt")
+    cache._put(key, "a")
+
+    assert await cache.get(key) is None
+    cache.close()
+
+@pytest.mark.asyncio
+async def test_llm_cache_stats_endpoint(client):
+    response = await client.get("/api/stats/llm-cache")
+    assert response.status_code == 200
+    assert "enabled" in response.json()
@@ -0,0 +1,53 @@
+import pytest
+
+from backend.app.agent.llm_registry import LLMClientRegistry
+
+CONFIG = dict(base_url="http://localhost:8000/v1", api_key="sk-test", model="test-model", temperature=0.0)
+
+@pytest.mark.asyncio
+async def test_same_config_reuses_client():
+    registry = LLMClientRegistry()
+    first = registry.browser_use_llm(**CONFIG)
+    second = registry.browser_use_llm(**CONFIG)
+
+    assert first is second
+    assert registry.builds == 1
+    assert registry.reuses == 1
+    await registry.close()
+
+@pytest.mark.asyncio
+async def test_clients_for_one_config_share_connection_pool():
+    registry = LLMClientRegistry()
+    agent_llm = registry.browser_use_llm(**CONFIG)
+    steps_llm = registry.langchain_llm(**CONFIG)
+
+    assert agent_llm.http_client is steps_llm.http_async_client
+    await registry.close()
+
+@pytest.mark.asyncio
+async def test_invalidate_rebuilds_clients():
+    registry = LLMClientRegistry()
+    before = registry.browser_use_llm(**CONFIG)
+    registry.invalidate()
+    after = registry.browser_use_llm(**CONFIG)
+
+    assert before is not after
+    assert registry.stats()["retired_pools"] == 1
+    await registry.close()
+
+@pytest.mark.asyncio
+async def test_stats_hide_api_key():
+    registry = LLMClientRegistry()
+    registry.browser_use_llm(**CONFIG)
+    registry.browser_use_llm(**{**CONFIG, "temperature": 0.7})
+
+    stats = registry.stats()
+    assert len(stats["models"]) == 2
+    assert "sk-test" not in str(stats)
+    await registry.close()
+
+@pytest.mark.asyncio
+async def test_llm_stats_endpoint(client):
+    response = await client.get("/api/stats/llm")
+    assert response.status_code == 200
+    assert "limits" in response.json()
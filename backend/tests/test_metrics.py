@@ -0,0 +1,50 @@
+import pytest
+
+from backend.app.core.metrics import DB_WRITE_DURATION, DB_WRITE_ERRORS, RUNS_FINISHED, MetricsRegistry, timed_write
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+
+
+@pytest.mark.asyncio
+async def test_text_format():
+    registry = MetricsRegistry(prefix="test")
+    requests = registry.counter("requests_total", "Requests.", ["outcome"])
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    requests.inc(outcome="ok")
+    requests.inc(2, outcome='say "hi"')
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    text = await registry.render()
+    assert "# TYPE test_requests_total counter" in text
+    assert 'test_requests_total{outcome="ok"} 1.0' in text
+    assert 'test_requests_total{outcome="say \\"hi\\""} 2.0' in text
+    assert 'test_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'test_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "test_latency_seconds_count 3" in text
+
+    with pytest.raises(ValueError):
+        requests.inc(status="ok")
+
+def test_timed_write_counts_errors():
+    before = DB_WRITE_DURATION.count(table="test")
+    with pytest.raises(RuntimeError):
+        with timed_write("test"):
+            raise RuntimeError("locked")
+    assert DB_WRITE_DURATION.count(table="test") == before + 1
+    assert DB_WRITE_ERRORS.value(table="test") >= 1
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client):
+    case = await TestCase.create(name="Queued", url="http://example.com")
+    await TestRun.create(case=case, status="PENDING")
+    RUNS_FINISHED.inc(status="PASSED")
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "webuitester_queue_length 1.0" in response.text
+    assert "webuitester_active_runs 0.0" in response.text
+    assert 'webuitester_runs_finished_total{status="PASSED"}' in response.text
@@ -0,0 +1,179 @@
+from datetime import timedelta
+
+import pytest
+from tortoise import timezone
+
+from backend.app.api.endpoints import runs
+from backend.app.core.recovery import recover_orphaned_runs, renew_leases
+from backend.app.core.run_events import load_run_logs
+from backend.app.core.scheduler import RunScheduler
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+from backend.app.models.test_suite import SuiteRun, TestSuite
+
+
+async def running_run(case, heartbeat_age: float, attempts: int = 1, lease_owner: str = "gone:1", **fields) -> TestRun:
+    beat = timezone.now() - timedelta(seconds=heartbeat_age)
+    return await TestRun.create(case=case, status="RUNNING", started_at=beat, heartbeat_at=beat,
+                                lease_owner=lease_owner, attempts=attempts, **fields)
+
+
+@pytest.mark.asyncio
+async def test_claim_takes_a_lease():
+    case = await TestCase.create(name="Lease", url="http://lease.com")
+    run = await TestRun.create(case=case)
+
+    sched = RunScheduler()
+    claimed = await sched.claim_next()
+    await run.refresh_from_db()
+    assert claimed.attempts == run.attempts == 1
+    assert run.lease_owner == sched.owner
+    assert run.heartbeat_at is not None
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_requeued_then_failed():
+    case = await TestCase.create(name="Orphan", url="http://orphan.com")
+    alive = await running_run(case, heartbeat_age=5)
+    orphan = await running_run(case, heartbeat_age=120)
+
+    recovered = await recover_orphaned_runs(lease_seconds=60, max_attempts=2)
+    assert recovered == {"requeued": 1, "failed": 0}
+    await alive.refresh_from_db()
+    await orphan.refresh_from_db()
+    assert alive.status == "RUNNING"
+    assert orphan.status == "PENDING"
+    assert orphan.started_at is None and orphan.lease_owner is None
+    logs = await load_run_logs(orphan.id)
+    assert logs[-1]["data"].startswith("Worker lost, run requeued")
+
+    # Second attempt dies too
+    sched = RunScheduler()
+    assert (await sched.claim_next()).id == orphan.id
+    await TestRun.filter(id=orphan.id).update(heartbeat_at=timezone.now() - timedelta(seconds=120))
+
+    assert await recover_orphaned_runs(lease_seconds=60, max_attempts=2) == {"requeued": 0, "failed": 1}
+    await orphan.refresh_from_db()
+    assert orphan.status == "FAILED"
+    assert orphan.finished_at is not None
+    assert "Worker lost after 2 attempts" in orphan.result_summary
+
+
+@pytest.mark.asyncio
+async def test_startup_recovery_of_sole_executor_takes_every_running_run():
+    case = await TestCase.create(name="Restart", url="http://restart.com")
+    run = await running_run(case, heartbeat_age=1)
+    legacy = await TestRun.create(case=case, status="RUNNING")
+
+    assert await recover_orphaned_runs(lease_seconds=60) == {"requeued": 1, "failed": 0}
+    await legacy.refresh_from_db()
+    assert legacy.status == "PENDING"
+
+    assert await recover_orphaned_runs(lease_seconds=60, all_running=True) == {"requeued": 1, "failed": 0}
+    await run.refresh_from_db()
+    assert run.status == "PENDING"
+
+
+@pytest.mark.asyncio
+async def test_recovery_refreshes_suite_run():
+    case = await TestCase.create(name="Member", url="http://member.com")
+    suite = await TestSuite.create(name="Suite")
+    suite_run = await SuiteRun.create(suite=suite, total=1, status="RUNNING")
+    await running_run(case, heartbeat_age=120, attempts=2, suite_run=suite_run)
+
+    await recover_orphaned_runs(lease_seconds=60, max_attempts=2)
+    await suite_run.refresh_from_db()
+    assert suite_run.status == "FAILED"
+    assert suite_run.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_renews_own_leases_only():
+    case = await TestCase.create(name="Beat", url="http://beat.com")
+    sched = RunScheduler()
+    mine = await running_run(case, heartbeat_age=30, lease_owner=sched.owner)
+    stolen = await running_run(case, heartbeat_age=30)
+
+    lost = await renew_leases(sched.owner, {mine.id, stolen.id})
+    assert lost == {stolen.id}
+    await mine.refresh_from_db()
+    assert timezone.now() - mine.heartbeat_at < timedelta(seconds=5)
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_stops_runs_whose_lease_was_lost():
+    case = await TestCase.create(name="Stalled", url="http://stalled.com")
+    sched = RunScheduler()
+    run = await running_run(case, heartbeat_age=120, lease_owner="other:2")
+    abandoned = []
+    sched._on_lease_lost = abandoned.append
+    sched._claimed.add(run.id)
+
+    await sched.heartbeat()
+    assert abandoned == [run.id]
+    assert run.id not in sched._claimed
+
+
+class RequeuedMidRunAgent:
+    """Finishes only after its run was requeued and claimed again elsewhere."""
+
+    recorded_history = None
+    termination_reason = None
+    timings = []
+
+    async def execute_case(self, case, log_callback, stop_event=None, replay_trace=None):
+        run = await TestRun.get(case_id=case.id)
+        await TestRun.filter(id=run.id).update(lease_owner="other:2", attempts=run.attempts + 1)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_stalled_worker_does_not_overwrite_requeued_run(monkeypatch):
+    case = await TestCase.create(name="Overtaken", url="http://overtaken.com")
+    await TestRun.create(case=case)
+    run = await RunScheduler().claim_next()
+    monkeypatch.setattr(runs, "Agent", RequeuedMidRunAgent)
+
+    await runs.run_agent_task(run.id, case.id)
+    await run.refresh_from_db()
+    assert run.status == "RUNNING"
+    assert run.lease_owner == "other:2"
+    assert run.attempts == 2
+    assert run.finished_at is None
+
+
+@pytest.mark.asyncio
+async def test_stop_running_run_without_executor_finishes_suite(client):
+    case = await TestCase.create(name="Orphan", url="http://orphan.com")
+    suite = await TestSuite.create(name="Suite")
+    suite_run = await SuiteRun.create(suite=suite, total=1, status="RUNNING")
+    run = await running_run(case, heartbeat_age=0, suite_run=suite_run)
+
+    response = await client.post(f"/api/runs/{run.id}/stop")
+    assert response.json() == {"message": "Run marked as stopped"}
+    await run.refresh_from_db()
+    assert run.status == "STOPPED"
+    assert run.finished_at is not None
+    await suite_run.refresh_from_db()
+    assert suite_run.status == "STOPPED"
+
+
+@pytest.mark.asyncio
+async def test_stop_does_not_overwrite_result_written_meanwhile(client, monkeypatch):
+    case = await TestCase.create(name="Raced", url="http://raced.com")
+    run = await running_run(case, heartbeat_age=0)
+    stale = await TestRun.get(id=run.id)
+    # The executor finishes between stop_run reading the run and acting on it
+    await TestRun.filter(id=run.id).update(status="PASSED", result_summary="done", finished_at=timezone.now())
+
+    async def read_stale(**kwargs):
+        return stale
+
+    monkeypatch.setattr(runs.TestRun, "get_or_none", read_stale)
+    response = await client.post(f"/api/runs/{run.id}/stop")
+    assert response.json() == {"message": "Run is not running"}
+    monkeypatch.undo()
+
+    await run.refresh_from_db()
+    assert (run.status, run.result_summary) == ("PASSED", "done")
+    assert (run.lease_owner, run.attempts) == ("gone:1", 1)
@@ -0,0 +1,61 @@
+import pytest
+
+from backend.app.agent.replay import case_fingerprint, count_actions, latest_trace, save_trace
+from backend.app.core.config import settings
+from backend.app.models.action_trace import ActionTrace
+from backend.app.models.test_case import TestCase, TestStep
+from backend.app.models.test_run import TestRun
+
+HISTORY = {
+    "history": [
+        {"model_output": {"action": [{"navigate": {"url": "http://example.com"}}, {"click": {"index": 3}}]}},
+        {"model_output": {"action": [{"done": {"text": "ok", "success": True}}]}},
+        {"model_output": None},
+    ]
+}
+
+async def create_case():
+    case = await TestCase.create(name="Login", url="http://example.com")
+    await TestStep.create(case=case, order=1, instruction="Click login", expected_result="Form shown")
+    await case.fetch_related("steps")
+    return case
+
+@pytest.mark.asyncio
+async def test_fingerprint_tracks_steps():
+    case = await create_case()
+    before = case_fingerprint(case)
+
+    await TestStep.create(case=case, order=2, instruction="Submit")
+    await case.fetch_related("steps")
+    assert case_fingerprint(case) != before
+
+def test_count_actions():
+    assert count_actions(HISTORY) == 3
+
+@pytest.mark.asyncio
+async def test_latest_trace_ignores_outdated_recordings():
+    case = await create_case()
+    await save_trace(case, None, HISTORY)
+    assert (await latest_trace(case)).action_count == 3
+
+    await TestStep.create(case=case, order=2, instruction="Submit")
+    assert await latest_trace(case) is None
+
+@pytest.mark.asyncio
+async def test_old_traces_are_pruned():
+    case = await create_case()
+    for _ in range(settings.replay.max_traces_per_case + 2):
+        await save_trace(case, None, HISTORY)
+
+    assert await ActionTrace.filter(case_id=case.id).count() == settings.replay.max_traces_per_case
+
+@pytest.mark.asyncio
+async def test_create_run_in_replay_mode(client):
+    case = await create_case()
+    response = await client.post("/api/runs/", json={"case_id": str(case.id), "mode": "replay"})
+    assert response.status_code == 200
+    assert response.json()["mode"] == "replay"
+    assert (await TestRun.get(id=response.json()["id"])).mode == "replay"
+
+    response = await client.post("/api/runs/", json={"case_id": str(case.id), "mode": "bogus"})
+    assert response.status_code == 422
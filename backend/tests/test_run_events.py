@@ -0,0 +1,137 @@
+import asyncio
+import json
+
+import pytest
+
+from backend.app.core.run_events import RunEventWriter, load_run_logs, migrate_legacy_logs
+from backend.app.models.run_event import RunEvent
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+
+
+async def create_run(**kwargs):
+    case = await TestCase.create(name="Case", url="http://example.com")
+    return await TestRun.create(case=case, **kwargs)
+
+@pytest.mark.asyncio
+async def test_events_are_written_in_batches():
+    run = await create_run()
+    writer = RunEventWriter(run.id, flush_size=3, flush_interval=60)
+
+    for i in range(2):
+        await writer.append({"type": "log", "data": f"line {i}"})
+    assert await RunEvent.filter(run_id=run.id).count() == 0
+
+    await writer.append({"type": "log", "data": "line 2"})
+    assert await RunEvent.filter(run_id=run.id).count() == 3
+    await writer.close()
+
+@pytest.mark.asyncio
+async def test_pending_events_flushed_after_interval():
+    run = await create_run()
+    writer = RunEventWriter(run.id, flush_size=100, flush_interval=0.01)
+
+    await writer.append({"type": "log", "data": "hello"})
+    await asyncio.sleep(0.05)
+
+    assert await RunEvent.filter(run_id=run.id).count() == 1
+    await writer.close()
+
+@pytest.mark.asyncio
+async def test_close_flushes_and_screenshots_are_skipped():
+    run = await create_run()
+    writer = RunEventWriter(run.id, flush_size=100, flush_interval=60)
+
+    assert await writer.append({"type": "status", "data": "RUNNING"}) == {"type": "status", "data": "RUNNING", "seq": 1}
+    # Broadcast as they are: live-only events have no seq
+    assert await writer.append({"type": "screenshot", "data": "aGVsbG8="}) == {"type": "screenshot", "data": "aGVsbG8="}
+    assert (await writer.append({"type": "log", "data": "hello"}))["seq"] == 2
+    await writer.close()
+
+    events = await RunEvent.filter(run_id=run.id).order_by("seq").values_list("seq", "type")
+    assert events == [(1, "status"), (2, "log")]
+    assert await load_run_logs(run.id) == [{"type": "log", "data": "hello"}]
+
+@pytest.mark.asyncio
+async def test_requeued_run_continues_sequence():
+    run = await create_run()
+    first = RunEventWriter(run.id)
+    await first.append({"type": "log", "data": "attempt 1"})
+    await first.close()
+
+    second = RunEventWriter(run.id)
+    await second.append({"type": "log", "data": "attempt 2"})
+    await second.close()
+
+    assert await RunEvent.filter(run_id=run.id).order_by("seq").values_list("seq", flat=True) == [1, 2]
+
+@pytest.mark.asyncio
+async def test_migrate_legacy_logs(client):
+    run = await create_run(logs=[{"type": "log", "data": "old line 1"}, {"type": "log", "data": "old line 2"}])
+
+    assert await migrate_legacy_logs() == 1
+    assert await migrate_legacy_logs() == 0
+    assert (await TestRun.get(id=run.id)).logs == []
+
+    response = await client.get(f"/api/runs/{run.id}", params={"include_logs": True})
+    assert [log["data"] for log in response.json()["logs"]] == ["old line 1", "old line 2"]
+
+@pytest.mark.asyncio
+async def test_concurrent_legacy_migrations_convert_each_run_once():
+    runs = [await create_run(logs=[{"type": "log", "data": f"run {i}"}]) for i in range(5)]
+    await create_run()
+
+    # Several API processes starting together
+    results = await asyncio.gather(*(migrate_legacy_logs(batch_size=2) for _ in range(3)))
+    assert sum(results) == 5
+    for run in runs:
+        assert await RunEvent.filter(run_id=run.id).count() == 1
+
+async def create_run_with_events(n):
+    run = await create_run()
+    writer = RunEventWriter(run.id, flush_size=100, flush_interval=60)
+    for i in range(n):
+        await writer.append({"type": "log", "data": f"line {i}"})
+    await writer.close()
+    return run
+
+@pytest.mark.asyncio
+async def test_run_summary_excludes_logs(client):
+    run = await create_run_with_events(3)
+
+    response = await client.get(f"/api/runs/{run.id}")
+    assert response.status_code == 200
+    assert "logs" not in response.json()
+
+    response = await client.get(f"/api/runs/{run.id}", params={"include_logs": True})
+    assert len(response.json()["logs"]) == 3
+
+@pytest.mark.asyncio
+async def test_events_cursor_pagination(client):
+    run = await create_run_with_events(5)
+
+    page = (await client.get(f"/api/runs/{run.id}/events", params={"limit": 2})).json()
+    assert [event["seq"] for event in page["items"]] == [1, 2]
+    assert page["next_after"] == 2
+
+    seen = page["items"]
+    while page["next_after"]:
+        page = (await client.get(f"/api/runs/{run.id}/events", params={"after": page["next_after"], "limit": 2})).json()
+        seen += page["items"]
+
+    assert [event["data"] for event in seen] == [f"line {i}" for i in range(5)]
+
+@pytest.mark.asyncio
+async def test_events_ndjson_export(client):
+    run = await create_run_with_events(3)
+
+    response = await client.get(f"/api/runs/{run.id}/events/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["seq"] for line in lines] == [1, 2, 3]
+
+@pytest.mark.asyncio
+async def test_events_of_unknown_run(client):
+    response = await client.get("/api/runs/00000000-0000-0000-0000-000000000000/events")
+    assert response.status_code == 404
@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+import pytest
+from tortoise import timezone
+
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+
+
+async def make_runs(case, count, **fields):
+    runs = [await TestRun.create(case=case, **fields) for _ in range(count)]
+    # Same timestamp for all of them: pages must still neither skip nor repeat rows
+    await TestRun.filter(id__in=[run.id for run in runs]).update(created_at=timezone.now())
+    return runs
+
+
+@pytest.mark.asyncio
+async def test_case_runs_are_keyset_paginated(client):
+    case = await TestCase.create(name="History", url="http://history.com")
+    other = await TestCase.create(name="Other", url="http://other.com")
+    runs = await make_runs(case, 5)
+    await make_runs(other, 2)
+
+    seen = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(f"/api/cases/{case.id}/runs", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        seen += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert cursor is None
+    assert sorted(seen) == sorted(str(run.id) for run in runs)
+    assert len(seen) == len(set(seen))
+    assert "logs" not in page["items"][0]
+
+
+@pytest.mark.asyncio
+async def test_case_runs_unknown_case(client):
+    response = await client.get("/api/cases/00000000-0000-0000-0000-000000000000/runs")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_runs_filters_status_and_since(client):
+    case = await TestCase.create(name="Filters", url="http://filters.com")
+    old = await TestRun.create(case=case, status="FAILED")
+    await TestRun.filter(id=old.id).update(created_at=timezone.now() - timedelta(days=2))
+    recent = await TestRun.create(case=case, status="FAILED")
+    await TestRun.create(case=case, status="PASSED")
+
+    response = await client.get("/api/runs/", params={"status": "failed"})
+    assert [item["id"] for item in response.json()["items"]] == [str(recent.id), str(old.id)]
+
+    since = (timezone.now() - timedelta(days=1)).isoformat()
+    response = await client.get("/api/runs/", params={"status": "FAILED", "since": since})
+    assert [item["id"] for item in response.json()["items"]] == [str(recent.id)]
+
+
+@pytest.mark.asyncio
+async def test_list_runs_rejects_bad_cursor(client):
+    response = await client.get("/api/runs/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
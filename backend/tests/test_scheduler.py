@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from backend.app.core.scheduler import RunScheduler, scheduler
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+
+
+@pytest.mark.asyncio
+async def test_create_run_is_queued(client):
+    case = await TestCase.create(name="Queued", url="http://queue.com")
+
+    response = await client.post("/api/runs/", json={"case_id": str(case.id)})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "PENDING"
+    assert data["queue_position"] == 1
+    assert data["eta_seconds"] == 0.0
+
+    response = await client.post("/api/runs/", json={"case_id": str(case.id)})
+    assert response.json()["queue_position"] == 2
+
+@pytest.mark.asyncio
+async def test_admission_control_rejects_when_full(client, monkeypatch):
+    monkeypatch.setattr(scheduler, "max_queue_size", 1)
+    case = await TestCase.create(name="Burst", url="http://burst.com")
+
+    first = await client.post("/api/runs/", json={"case_id": str(case.id)})
+    assert first.status_code == 200
+
+    second = await client.post("/api/runs/", json={"case_id": str(case.id)})
+    assert second.status_code == 429
+    assert "Retry-After" in second.headers
+
+@pytest.mark.asyncio
+async def test_stop_pending_run_dequeues_it(client):
+    case = await TestCase.create(name="Stop Me", url="http://stop.com")
+    run = await TestRun.create(case=case)
+
+    response = await client.post(f"/api/runs/{run.id}/stop")
+    assert response.status_code == 200
+
+    await run.refresh_from_db()
+    assert run.status == "STOPPED"
+    assert await RunScheduler().claim_next() is None
+
+@pytest.mark.asyncio
+async def test_claim_next_is_fifo_and_exclusive():
+    case = await TestCase.create(name="FIFO", url="http://fifo.com")
+    first = await TestRun.create(case=case)
+    second = await TestRun.create(case=case)
+
+    sched = RunScheduler(max_workers=2)
+    claimed = await sched.claim_next()
+    assert claimed.id == first.id
+    assert claimed.status == "RUNNING"
+    assert (await sched.claim_next()).id == second.id
+    assert await sched.claim_next() is None
+
+@pytest.mark.asyncio
+async def test_workers_bound_concurrency():
+    case = await TestCase.create(name="Bounded", url="http://bounded.com")
+    for _ in range(5):
+        await TestRun.create(case=case)
+
+    in_flight = 0
+    peak = 0
+    done = []
+
+    async def fake_executor(run_id, case_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        await TestRun.filter(id=run_id).update(status="PASSED")
+        done.append(run_id)
+
+    sched = RunScheduler(max_workers=2, poll_interval=0.01)
+    await sched.start(fake_executor)
+    try:
+        for _ in range(200):
+            if len(done) == 5:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await sched.stop()
+
+    assert len(done) == 5
+    assert peak == 2
+
+@pytest.mark.asyncio
+async def test_queue_position_breaks_ties_and_eta_counts_running_runs():
+    case = await TestCase.create(name="Ties", url="http://ties.com")
+    first = await TestRun.create(case=case)
+    second = await TestRun.create(case=case)
+    # Same creation instant, as with runs queued together by a suite
+    await TestRun.filter(id__in=[first.id, second.id]).update(created_at=first.created_at)
+    first, second = sorted(await TestRun.filter(case=case), key=lambda run: str(run.id))
+
+    sched = RunScheduler(max_workers=1, default_run_seconds=60)
+    assert await sched.queue_position(first) == 1
+    assert await sched.queue_position(second) == 2
+
+    assert sched.estimate_wait(0, await sched.running_remaining()) == 0.0
+    await sched.claim_next()
+    remaining = await sched.running_remaining()
+    assert 0 < remaining[0] <= 60
+    # The only slot is busy, so the next run waits for it to free up
+    assert sched.estimate_wait(0, remaining) == round(remaining[0], 1)
+    assert sched.estimate_wait(1, [30.0]) == 90.0
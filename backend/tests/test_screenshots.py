@@ -0,0 +1,67 @@
+import base64
+import io
+import json
+import struct
+
+import pytest
+from PIL import Image, ImageDraw
+
+from backend.app.agent.screenshots import ScreenshotPipeline
+from backend.app.core.artifacts import artifact_store
+from backend.app.core.socket_manager import encode_frame
+
+
+@pytest.fixture(autouse=True)
+def artifact_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifact_store, "root", tmp_path / "artifacts")
+
+def png(box=(100, 100, 400, 300), noise=None):
+    image = Image.new("RGB", (1280, 800), "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle(box, fill="navy")
+    if noise:
+        draw.point(noise, fill="red")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode()
+
+@pytest.mark.asyncio
+async def test_unchanged_frames_are_dropped():
+    pipeline = ScreenshotPipeline()
+
+    assert await pipeline.process(png()) is not None
+    # A few changed pixels (cursor, spinner) are not a new page state
+    assert await pipeline.process(png(noise=[(5, 5), (6, 6)])) is None
+    assert await pipeline.process(png(box=(600, 400, 1200, 780))) is not None
+    assert pipeline.duplicates == 1
+
+@pytest.mark.asyncio
+async def test_thumbnail_is_downscaled_jpeg():
+    frame = await ScreenshotPipeline(thumbnail_width=320).process(png())
+
+    thumbnail = Image.open(io.BytesIO(base64.b64decode(frame["thumbnail"])))
+    assert thumbnail.format == "JPEG"
+    assert thumbnail.size == (320, 200)
+    assert (frame["width"], frame["height"]) == (1280, 800)
+
+@pytest.mark.asyncio
+async def test_full_resolution_goes_to_artifact_store():
+    frame = await ScreenshotPipeline().process(png())
+
+    assert frame["content_type"] == "image/png"
+    assert artifact_store.exists(frame["id"])
+    assert Image.open(artifact_store.path(frame["id"])).size == (1280, 800)
+
+@pytest.mark.asyncio
+async def test_binary_frame_layout():
+    frame = await ScreenshotPipeline().process(png())
+    data = encode_frame({"type": "screenshot", "data": frame, "seq": 3})
+
+    (header_length,) = struct.unpack(">I", data[:4])
+    header = json.loads(data[4:4 + header_length])
+    assert header == {
+        "type": "screenshot",
+        "seq": 3,
+        "data": {"id": frame["id"], "width": 1280, "height": 800, "content_type": "image/png", "size": frame["size"]},
+    }
+    assert data[4 + header_length:] == base64.b64decode(frame["thumbnail"])
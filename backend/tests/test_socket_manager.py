@@ -0,0 +1,210 @@
+import asyncio
+
+import pytest
+
+from backend.app.core.socket_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self, fail=False):
+        self.sent = []
+        self.fail = fail
+        self.closed = False
+        # Cleared to simulate a client that stops reading
+        self.reading = asyncio.Event()
+        self.reading.set()
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, message):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        await self.reading.wait()
+        self.sent.append(message)
+
+    async def close(self):
+        self.closed = True
+
+async def settle():
+    await asyncio.sleep(0.01)
+
+async def broadcast_logs(manager, n, channel="run-1"):
+    # Stamped like RunEventWriter does, one seq after the last one
+    for _ in range(n):
+        seq = manager.last_seq(channel) + 1
+        await manager.broadcast(channel, {"type": "log", "data": f"line {seq - 1}", "seq": seq})
+
+@pytest.mark.asyncio
+async def test_events_keep_their_producer_seq():
+    manager = ConnectionManager()
+    ws = FakeWebSocket()
+    await manager.connect("run-1", ws)
+
+    await broadcast_logs(manager, 3)
+    # Already delivered, e.g. echoed by another process: dropped, never renumbered
+    await manager.broadcast("run-1", {"type": "log", "data": "line 1", "seq": 2})
+    await manager.broadcast("run-2", {"type": "log", "data": "other run", "seq": 1})
+    await settle()
+
+    assert [m["seq"] for m in ws.sent] == [1, 2, 3]
+    assert manager.last_seq("run-2") == 1
+
+@pytest.mark.asyncio
+async def test_gap_in_seq_requests_resync():
+    manager = ConnectionManager()
+    ws = FakeWebSocket()
+    await manager.connect("run-1", ws)
+
+    await broadcast_logs(manager, 1)
+    await manager.broadcast("run-1", {"type": "log", "data": "line 4", "seq": 5})
+    await settle()
+
+    assert ws.sent[1] == {"type": "resync", "data": {"seq": 4}}
+    assert ws.sent[2]["seq"] == 5
+
+    # Events before the gap never reached this process, so they cannot be replayed
+    late = FakeWebSocket()
+    await manager.connect("run-1", late, since=0)
+    await settle()
+    assert late.sent[0]["type"] == "resync"
+    assert [m["seq"] for m in late.sent[1:]] == [5]
+
+@pytest.mark.asyncio
+async def test_unsequenced_state_is_not_counted():
+    manager = ConnectionManager()
+    await broadcast_logs(manager, 1)
+    await manager.broadcast("run-1", {"type": "budget", "data": {"steps": 1}})
+    await broadcast_logs(manager, 1)
+
+    assert manager.last_seq("run-1") == 2
+
+@pytest.mark.asyncio
+async def test_reconnect_replays_only_the_gap():
+    manager = ConnectionManager()
+    await broadcast_logs(manager, 5)
+
+    ws = FakeWebSocket()
+    await manager.connect("run-1", ws, since=3)
+    await broadcast_logs(manager, 1)
+    await settle()
+
+    assert [m["seq"] for m in ws.sent] == [4, 5, 6]
+
+@pytest.mark.asyncio
+async def test_only_latest_screenshot_is_replayed():
+    manager = ConnectionManager()
+    await manager.broadcast("run-1", {"type": "screenshot", "data": "old"})
+    await broadcast_logs(manager, 1)
+    await manager.broadcast("run-1", {"type": "screenshot", "data": "new"})
+
+    ws = FakeWebSocket()
+    await manager.connect("run-1", ws, since=0)
+    await settle()
+
+    assert [m["data"] for m in ws.sent] == ["line 0", "new"]
+
+@pytest.mark.asyncio
+async def test_gap_beyond_buffer_requests_resync():
+    manager = ConnectionManager(buffer_size=3)
+    await broadcast_logs(manager, 10)
+
+    ws = FakeWebSocket()
+    await manager.connect("run-1", ws, since=2)
+    await settle()
+
+    assert ws.sent[0]["type"] == "resync"
+    assert [m["seq"] for m in ws.sent[1:]] == [8, 9, 10]
+
+@pytest.mark.asyncio
+async def test_unknown_seq_after_restart_requests_resync():
+    manager = ConnectionManager()
+    await broadcast_logs(manager, 2)
+
+    ws = FakeWebSocket()
+    await manager.connect("run-1", ws, since=50)
+    await settle()
+
+    assert ws.sent[0] == {"type": "resync", "data": {"seq": 2}}
+    assert [m["seq"] for m in ws.sent[1:]] == [1, 2]
+
+@pytest.mark.asyncio
+async def test_least_recently_used_channels_are_dropped():
+    manager = ConnectionManager(max_channels=2)
+    for channel in ["a", "b", "c"]:
+        await broadcast_logs(manager, 1, channel=channel)
+
+    assert manager.last_seq("a") == 0
+    assert manager.last_seq("c") == 1
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_block_broadcast():
+    manager = ConnectionManager(send_queue_size=3)
+    slow, fast = FakeWebSocket(), FakeWebSocket()
+    slow.reading.clear()
+    await manager.connect("run-1", slow)
+    await manager.connect("run-1", fast)
+
+    for _ in range(10):
+        await asyncio.wait_for(broadcast_logs(manager, 1), timeout=1)
+        await settle()
+
+    assert len(fast.sent) == 10
+    assert manager.stats()["channels"]["run-1"]["max_depth"] <= 3
+    assert manager.dropped > 0
+
+    slow.reading.set()
+    await settle()
+    # The slow client is told it missed events before getting the newest ones
+    assert slow.sent[1]["type"] == "resync"
+    assert slow.sent[-1]["seq"] == 10
+
+@pytest.mark.asyncio
+async def test_queued_screenshots_are_coalesced():
+    manager = ConnectionManager()
+    ws = FakeWebSocket()
+    ws.reading.clear()
+    await manager.connect("run-1", ws)
+
+    await manager.broadcast("run-1", {"type": "log", "data": "first", "seq": 1})
+    await settle()
+    for name in ["a", "b", "c"]:
+        await manager.broadcast("run-1", {"type": "screenshot", "data": name})
+    await manager.broadcast("run-1", {"type": "log", "data": "last", "seq": 2})
+
+    ws.reading.set()
+    await settle()
+    assert [m["data"] for m in ws.sent] == ["first", "c", "last"]
+    assert manager.coalesced == 2
+
+@pytest.mark.asyncio
+async def test_failed_connection_is_evicted():
+    manager = ConnectionManager()
+    ws = FakeWebSocket(fail=True)
+    await manager.connect("run-1", ws)
+
+    await broadcast_logs(manager, 1)
+    await settle()
+
+    assert "run-1" not in manager.active_connections
+    assert manager.evicted == 1
+    assert ws.closed
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_evicts_slow_client():
+    manager = ConnectionManager(send_queue_size=2, slow_consumer_policy="disconnect")
+    ws = FakeWebSocket()
+    ws.reading.clear()
+    await manager.connect("run-1", ws)
+
+    await broadcast_logs(manager, 5)
+    await settle()
+
+    assert manager.evicted == 1
+    assert manager.stats()["connections"] == 0
+
+@pytest.mark.asyncio
+async def test_websocket_stats_endpoint(client):
+    response = await client.get("/api/stats/websockets")
+    assert response.status_code == 200
+    assert "max_queue_depth" in response.json()
@@ -0,0 +1,119 @@
+import uuid
+
+import pytest
+
+from backend.app.core.scheduler import RunScheduler
+from backend.app.core.suite_runs import refresh_suite_run
+from backend.app.models.run_event import RunEvent
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+
+
+async def create_suite(client, n_cases=3):
+    cases = [await TestCase.create(name=f"Case {i}", url=f"http://case{i}.com") for i in range(n_cases)]
+    response = await client.post(
+        "/api/suites",
+        json={"name": "Regression", "case_ids": [str(case.id) for case in cases]},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+@pytest.mark.asyncio
+async def test_create_and_get_suite(client):
+    suite = await create_suite(client)
+    assert len(suite["case_ids"]) == 3
+
+    response = await client.get(f"/api/suites/{suite['id']}")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Regression"
+
+@pytest.mark.asyncio
+async def test_create_suite_with_unknown_case(client):
+    response = await client.post("/api/suites", json={"name": "Bad", "case_ids": [str(uuid.uuid4())]})
+    assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_suite_run_fans_out_member_runs(client):
+    suite = await create_suite(client)
+
+    response = await client.post(f"/api/suites/{suite['id']}/runs", json={"concurrency": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "PENDING"
+    assert data["total"] == 3
+    assert data["concurrency"] == 2
+    assert len(data["runs"]) == 3
+    assert all(run["status"] == "PENDING" for run in data["runs"])
+
+@pytest.mark.asyncio
+async def test_suite_concurrency_limits_claims(client):
+    suite = await create_suite(client, n_cases=3)
+    response = await client.post(f"/api/suites/{suite['id']}/runs", json={"concurrency": 1})
+    suite_run_id = response.json()["id"]
+
+    sched = RunScheduler(max_workers=4)
+    assert await sched.claim_next() is not None
+    # The suite already runs one member, so nothing else is eligible
+    assert await sched.claim_next() is None
+
+    # Unrelated runs are not blocked by a saturated suite
+    other = await TestCase.create(name="Other", url="http://other.com")
+    standalone = await TestRun.create(case=other)
+    assert (await sched.claim_next()).id == standalone.id
+
+    running = await TestRun.get(suite_run_id=suite_run_id, status="RUNNING")
+    running.status = "PASSED"
+    await running.save()
+    assert await sched.claim_next() is not None
+
+@pytest.mark.asyncio
+async def test_suite_run_aggregates_results(client):
+    suite = await create_suite(client, n_cases=2)
+    response = await client.post(f"/api/suites/{suite['id']}/runs")
+    suite_run_id = response.json()["id"]
+
+    statuses = iter(["PASSED", "FAILED"])
+    for run in await TestRun.filter(suite_run_id=suite_run_id):
+        run.status = next(statuses)
+        await run.save()
+    await refresh_suite_run(suite_run_id)
+
+    response = await client.get(f"/api/suite-runs/{suite_run_id}")
+    data = response.json()
+    assert data["status"] == "FAILED"
+    assert data["passed"] == 1
+    assert data["failed"] == 1
+    assert data["finished_at"] is not None
+
+@pytest.mark.asyncio
+async def test_stop_suite_run_dequeues_members(client):
+    suite = await create_suite(client, n_cases=2)
+    response = await client.post(f"/api/suites/{suite['id']}/runs")
+    suite_run_id = response.json()["id"]
+
+    response = await client.post(f"/api/suite-runs/{suite_run_id}/stop")
+    assert response.json()["dequeued"] == 2
+
+    response = await client.get(f"/api/suite-runs/{suite_run_id}")
+    assert response.json()["status"] == "STOPPED"
+
+@pytest.mark.asyncio
+async def test_stop_suite_run_marks_running_members(client):
+    suite = await create_suite(client, n_cases=2)
+    response = await client.post(f"/api/suites/{suite['id']}/runs")
+    suite_run_id = response.json()["id"]
+    # Claimed by a worker in another process: no stop event here and no shared event bus to reach it
+    running = await RunScheduler(max_workers=4).claim_next()
+
+    response = await client.post(f"/api/suite-runs/{suite_run_id}/stop")
+    assert response.json() == {"message": "Stop signal sent", "dequeued": 1, "signalled": 0}
+
+    running = await TestRun.get(id=running.id)
+    assert running.status == "STOPPED"
+    assert running.finished_at is not None
+    events = await RunEvent.filter(run_id=running.id).values_list("payload", flat=True)
+    assert events == [{"type": "status", "data": "STOPPED"}]
+
+    response = await client.get(f"/api/suite-runs/{suite_run_id}")
+    assert response.json()["status"] == "STOPPED"
+    assert response.json()["stopped"] == 2
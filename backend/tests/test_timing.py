@@ -0,0 +1,105 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from browser_use.llm.messages import UserMessage
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+
+from backend.app.agent.llm_cache import CachedChatModel
+from backend.app.agent.timing import instrument_agent, save_timings, span, step_timer
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+
+
+class FakeLLM:
+    provider = "fake"
+    name = "fake"
+    model = "fake-model"
+    temperature = 0.0
+
+    async def ainvoke(self, messages, output_format=None, **kwargs):
+        await asyncio.sleep(0.01)
+        usage = ChatInvokeUsage(prompt_tokens=120, prompt_cached_tokens=None, prompt_cache_creation_tokens=None,
+                                prompt_image_tokens=None, completion_tokens=30, total_tokens=150)
+        return ChatInvokeCompletion(completion="ok", usage=usage)
+
+class FakeAgent:
+    async def _prepare_context(self):
+        await asyncio.sleep(0.01)
+
+    async def multi_act(self, actions):
+        await asyncio.sleep(0.02)
+        return actions
+
+    async def step(self, llm):
+        await self._prepare_context()
+        await llm.ainvoke([UserMessage(content="next?")])
+        return await self.multi_act(["click"])
+
+@pytest.mark.asyncio
+async def test_step_spans_and_tokens():
+    agent = instrument_agent(FakeAgent())
+    llm = CachedChatModel(FakeLLM())
+
+    with step_timer(1) as timer:
+        assert await agent.step(llm) == ["click"]
+        with span("broadcast"):
+            pass
+
+    assert [s["name"] for s in timer.spans] == ["browser_state", "llm", "actions", "broadcast"]
+    assert timer.spans[2]["duration_ms"] >= 15
+    assert timer.spans[2]["start_ms"] >= timer.spans[1]["start_ms"] + timer.spans[1]["duration_ms"]
+    assert (timer.llm_calls, timer.input_tokens, timer.output_tokens) == (1, 120, 30)
+    assert timer.duration_ms >= sum(s["duration_ms"] for s in timer.spans)
+
+@pytest.mark.asyncio
+async def test_spans_outside_steps_are_ignored():
+    agent = instrument_agent(FakeAgent())
+    # Replay drives multi_act without a step timer
+    assert await agent.multi_act(["click"]) == ["click"]
+
+@pytest.mark.asyncio
+async def test_timings_endpoint(client):
+    case = await TestCase.create(name="Timed", url="http://example.com")
+    run = await TestRun.create(case=case, status="PASSED")
+    timers = []
+    for step in (1, 2):
+        with step_timer(step) as timer:
+            with span("llm"):
+                await asyncio.sleep(0.01 * step)
+        timers.append(timer)
+    timers[1].started_at = timers[0].started_at + timedelta(seconds=1)
+    await save_timings(run.id, timers)
+
+    response = await client.get(f"/api/runs/{run.id}/timings")
+    assert response.status_code == 200
+    data = response.json()
+    assert [s["step"] for s in data["steps"]] == [1, 2]
+    assert data["steps"][1]["offset_ms"] == 1000
+    summary = data["summary"]
+    assert summary["steps"] == 2
+    assert summary["slowest_step"] == 2
+    assert summary["totals"]["llm"] >= 25
+    assert abs(sum(summary["shares"].values()) - 1) < 0.01
+
+    response = await client.get("/api/runs/00000000-0000-0000-0000-000000000000/timings")
+    assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_vision_savings_reported(client):
+    case = await TestCase.create(name="Vision", url="http://example.com")
+    run = await TestRun.create(case=case, status="PASSED")
+    timers = []
+    for step, vision, tokens in ((1, True, 3000), (2, False, 1800), (3, False, 1900)):
+        with step_timer(step) as timer:
+            timer.vision = vision
+            timer.llm_calls = 1
+            timer.input_tokens = tokens
+        timers.append(timer)
+    await save_timings(run.id, timers)
+
+    vision = (await client.get(f"/api/runs/{run.id}/timings")).json()["summary"]["vision"]
+    assert (vision["steps_with_screenshot"], vision["steps_without_screenshot"]) == (1, 2)
+    assert vision["measured"] is True
+    assert vision["image_tokens_per_call"] == 1150
+    assert vision["estimated_tokens_saved"] == 2300
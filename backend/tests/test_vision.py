@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.agent.vision import VisionPolicy
+
+
+def step(order, vision_policy=None):
+    return SimpleNamespace(order=order, vision_policy=vision_policy, expected_result=None)
+
+def history_item(next_goal="", memory="", error=None):
+    return SimpleNamespace(
+        model_output=SimpleNamespace(next_goal=next_goal, memory=memory),
+        result=[SimpleNamespace(error=error)],
+    )
+
+def test_fixed_policies():
+    assert VisionPolicy("always").decide([]) is True
+    assert VisionPolicy("never").decide([history_item("Verify the title")]) is False
+    assert VisionPolicy("auto").decide([]) == "auto"
+    assert VisionPolicy("auto").initial_setting() == "auto"
+    assert VisionPolicy("verification").initial_setting() is False
+
+def test_on_failure():
+    policy = VisionPolicy("on_failure")
+    assert policy.decide([history_item()]) is False
+    assert policy.decide([history_item(error="Element not found")]) is True
+    assert (policy.vision_steps, policy.text_steps) == (1, 1)
+
+def test_verification_follows_goal():
+    policy = VisionPolicy("verification")
+    assert policy.decide([]) is False
+    assert policy.decide([history_item("Click the login button")]) is False
+    assert policy.decide([history_item("Verify that the dashboard is shown")]) is True
+    assert policy.decide([history_item("检查页面标题")]) is True
+
+def test_step_override():
+    policy = VisionPolicy("never", [step(1), step(2, "always")])
+    assert policy.decide([history_item("Step 1: type the user name")]) is False
+    # Step 2 has its own policy
+    assert policy.decide([history_item("Now doing step 2", memory="Step 1 done")]) is True
+    assert policy.current_step == 2
+    # No step referenced: keep following the last one
+    assert policy.decide([history_item("Scroll down")]) is True
+
+@pytest.mark.asyncio
+async def test_policies_saved_with_case(client):
+    payload = {
+        "name": "Vision", "url": "http://example.com", "vision_policy": "on_failure", "max_steps": 8,
+        "steps": [{"order": 1, "instruction": "Open", "vision_policy": "always"}],
+    }
+    response = await client.post("/api/cases", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["vision_policy"] == "on_failure"
+    assert data["steps"][0]["vision_policy"] == "always"
+
+    # Older clients that do not send the newer fields keep them unchanged
+    response = await client.put(
+        f"/api/cases/{data['id']}", json={"name": "Vision 2", "url": "http://example.com", "steps": []}
+    )
+    assert response.json()["vision_policy"] == "on_failure"
+    assert response.json()["max_steps"] == 8
+
+    response = await client.post("/api/cases", json={**payload, "vision_policy": "sometimes"})
+    assert response.status_code == 422
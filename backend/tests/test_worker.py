@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from backend.app.api.endpoints.runs import active_runs
+from backend.app.core.config import settings
+from backend.app.core.socket_manager import manager
+from backend.app.models.test_case import TestCase
+from backend.app.models.test_run import TestRun
+from backend.main import app
+from backend.worker import EventForwarder, watch_stop_requests
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, message):
+        self.sent.append(message)
+
+@pytest.mark.asyncio
+async def test_publish_endpoint_broadcasts_to_local_sockets(client):
+    ws = FakeWebSocket()
+    await manager.connect("run-1", ws)
+    try:
+        response = await client.post(
+            "/api/runs/events/publish",
+            json=[{"channel": "run-1", "message": {"type": "log", "data": "hello"}}],
+        )
+        await asyncio.sleep(0.01)
+    finally:
+        manager.disconnect("run-1", ws)
+
+    assert response.status_code == 200
+    assert [(m["type"], m["data"]) for m in ws.sent] == [("log", "hello")]
+
+@pytest.mark.asyncio
+async def test_publish_endpoint_requires_worker_token(client, monkeypatch):
+    event = [{"channel": "run-1", "message": {"type": "log", "data": "injected"}}]
+    # Without a token only loopback clients may publish
+    remote = httpx.AsyncClient(transport=httpx.ASGITransport(app=app, client=("10.0.0.5", 1234)), base_url="http://test")
+    async with remote:
+        assert (await remote.post("/api/runs/events/publish", json=event)).status_code == 403
+
+    monkeypatch.setattr(settings.scheduler, "worker_token", "s3cret")
+    response = await client.post("/api/runs/events/publish", json=event)
+    assert response.status_code == 403
+    response = await client.post("/api/runs/events/publish", json=event, headers={"X-Worker-Token": "s3cret"})
+    assert response.status_code == 200
+
+@pytest.mark.asyncio
+async def test_forwarder_batches_events():
+    batches = []
+
+    def handler(request: httpx.Request):
+        assert request.headers["X-Worker-Token"] == "s3cret"
+        batches.append(json.loads(request.content))
+        return httpx.Response(200, json={})
+
+    forwarder = EventForwarder("http://api", batch_size=10, token="s3cret", transport=httpx.MockTransport(handler))
+    for i in range(25):
+        await forwarder.publish("run-1", {"type": "log", "data": i})
+    await forwarder.close()
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert batches[0][0] == {"channel": "run-1", "message": {"type": "log", "data": 0}}
+
+@pytest.mark.asyncio
+async def test_stop_watcher_relays_database_stop():
+    case = await TestCase.create(name="Remote", url="http://remote.com")
+    run = await TestRun.create(case=case, status="RUNNING")
+    stop_event = asyncio.Event()
+    active_runs[str(run.id)] = {"stop_event": stop_event}
+
+    watcher = asyncio.create_task(watch_stop_requests(0.01))
+    try:
+        await TestRun.filter(id=run.id).update(status="STOPPED")
+        await asyncio.wait_for(stop_event.wait(), timeout=1)
+    finally:
+        watcher.cancel()
+        active_runs.pop(str(run.id), None)
+
+    assert stop_event.is_set()
@@ -0,0 +1,254 @@
+"""
+Standalone run workers.
+
+Usage (from the project root):
+    python -m backend.worker --processes 4 --concurrency 2
+
+Each process claims PENDING runs from the shared database with its own
+RunScheduler and executes them with the regular agent, so DOM processing and
+screenshot encoding are spread over CPU cores instead of sharing the API's
+event loop. Events reach the API processes through the shared event bus when
+`event_bus.backend` is "sqlite", otherwise they are POSTed to the API, which
+broadcasts them to WebSocket clients. Set `scheduler.mode: external` in
+config.yaml so the API process stops executing runs itself.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import sys
+from pathlib import Path
+from typing import Optional
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import httpx
+from tortoise import Tortoise
+
+from backend.app.core.config import settings
+from backend.app.core.database import TORTOISE_ORM, prepare_schema
+from backend.app.core.event_bus import WORKER_TOKEN_HEADER
+
+
+class EventForwarder:
+    """Ships broadcasts from a worker process to the API process in batches."""
+
+    def __init__(self, api_url: str, batch_size: int = 50, max_pending: int = 10000, token: str = "",
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        # One keep-alive client for the lifetime of the worker
+        headers = {WORKER_TOKEN_HEADER: token} if token else None
+        self._client = httpx.AsyncClient(base_url=api_url, timeout=10.0, headers=headers, transport=transport)
+        self._task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    async def publish(self, channel: str, message: dict):
+        # Never block the agent loop on the API being slow or down
+        try:
+            self._queue.put_nowait({"channel": channel, "message": message})
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def start(self):
+        self._task = asyncio.create_task(self._drain())
+
+    async def _send(self, batch: list):
+        try:
+            await self._client.post("/api/runs/events/publish", json=batch)
+        except Exception as e:
+            print(f"Event forward failed ({len(batch)} events dropped): {e}")
+
+    def _take_batch(self, first: dict) -> list:
+        batch = [first]
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _drain(self):
+        while True:
+            first = await self._queue.get()
+            await self._send(self._take_batch(first))
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        while not self._queue.empty():
+            await self._send(self._take_batch(self._queue.get_nowait()))
+        await self._client.aclose()
+
+
+async def watch_stop_requests(poll_interval: float):
+    """
+    Relay stop requests made through the API.
+
+    `POST /api/runs/{id}/stop` cannot reach this process's stop events, it
+    marks the run STOPPED in the database instead; we poll for that.
+    """
+    from backend.app.api.endpoints.runs import active_runs
+    from backend.app.models.test_run import TestRun
+
+    while True:
+        await asyncio.sleep(poll_interval)
+        run_ids = list(active_runs)
+        if not run_ids:
+            continue
+        try:
+            stopped = await TestRun.filter(id__in=run_ids, status="STOPPED").values_list("id", flat=True)
+        except Exception as e:
+            print(f"Stop watcher error: {e}")
+            continue
+        for run_id in stopped:
+            control = active_runs.get(str(run_id))
+            if control:
+                control["stop_event"].set()
+
+
+async def serve_metrics(port: int):
+    """
+    Minimal HTTP endpoint answering every request with this worker's metrics,
+    so Prometheus can scrape the processes that actually execute runs.
+    """
+    from backend.app.api.endpoints.metrics import CONTENT_TYPE
+    from backend.app.core.metrics import registry
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            # Request line and headers are ignored
+            await reader.readuntil(b"\r\n\r\n")
+            body = (await registry.render()).encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 200 OK\r\nContent-Type: {CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("ascii") + body
+            )
+            await writer.drain()
+        except Exception:
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, settings.server.host, port)
+
+
+async def worker_main(index: int, concurrency: int, api_url: str, metrics_port: int = 0):
+    from backend.app.agent.browser_pool import browser_pool
+    from backend.app.agent.llm_cache import llm_cache
+    from backend.app.agent.llm_registry import llm_registry
+    from backend.app.api.endpoints.runs import abandon_run, run_agent_task
+    from backend.app.core.db_writer import db_writer
+    from backend.app.core.event_bus import event_bus, start_event_bus
+    from backend.app.core.patches import apply_browser_use_patches
+    from backend.app.core.recovery import recover_orphaned_runs
+    from backend.app.core.scheduler import build_scheduler
+    from backend.app.core.socket_manager import manager
+
+    apply_browser_use_patches()
+    await Tortoise.init(config=TORTOISE_ORM)
+    await prepare_schema()
+
+    # Stop requests arrive over the bus too; the DB watcher below remains as a fallback
+    await start_event_bus()
+    forwarder = None
+    if not event_bus.shared:
+        forwarder = EventForwarder(api_url, token=settings.scheduler.worker_token)
+        forwarder.start()
+        manager.relay = forwarder.publish
+
+    if browser_pool:
+        await browser_pool.start()
+    # Other workers may still be executing runs, so only expired leases are taken over
+    recovered = await recover_orphaned_runs()
+    if any(recovered.values()):
+        print(f"Worker {index} recovered orphaned runs: {recovered['requeued']} requeued, {recovered['failed']} failed")
+    scheduler = build_scheduler(concurrency)
+    await scheduler.start(run_agent_task, abandon_run)
+    watcher = asyncio.create_task(watch_stop_requests(settings.scheduler.poll_interval))
+    metrics_server = await serve_metrics(metrics_port + index) if metrics_port else None
+    target = "the event bus" if event_bus.shared else api_url
+    print(f"Worker {index} (pid {os.getpid()}) ready with {concurrency} slots, publishing to {target}")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        watcher.cancel()
+        if metrics_server:
+            metrics_server.close()
+        await scheduler.stop()
+        if browser_pool:
+            await browser_pool.close()
+        await llm_registry.close()
+        if llm_cache:
+            llm_cache.close()
+        if forwarder:
+            await forwarder.close()
+        await db_writer.close()
+        await event_bus.close()
+        await Tortoise.close_connections()
+
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def run_process(index: int, concurrency: int, api_url: str, metrics_port: int = 0):
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    # Treat terminate() from the parent like Ctrl+C so runs get their cleanup
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+    try:
+        asyncio.run(worker_main(index, concurrency, api_url, metrics_port))
+    except KeyboardInterrupt:
+        pass
+
+
+def default_api_url() -> str:
+    host = settings.server.host
+    if host in ("0.0.0.0", "::"):
+        host = "127.0.0.1"
+    return f"http://{host}:{settings.server.port}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="WebuiTester run workers")
+    parser.add_argument("--processes", type=int, default=settings.scheduler.worker_processes,
+                        help="number of worker processes")
+    parser.add_argument("--concurrency", type=int, default=settings.scheduler.max_workers,
+                        help="runs executed concurrently by each process")
+    parser.add_argument("--api-url", default=default_api_url(),
+                        help="API base URL that receives run events")
+    parser.add_argument("--metrics-port", type=int, default=0,
+                        help="serve Prometheus metrics, worker N on port + N (0 disables)")
+    args = parser.parse_args(argv)
+
+    if settings.scheduler.mode != "external":
+        print("WARNING: scheduler.mode is not 'external'; the API process will also execute runs.")
+
+    # spawn: a clean interpreter per worker, same behaviour on Windows and POSIX
+    ctx = multiprocessing.get_context("spawn")
+    processes = [
+        ctx.Process(
+            target=run_process,
+            args=(i, args.concurrency, args.api_url, args.metrics_port),
+            name=f"webuitester-worker-{i}",
+        )
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        print("Stopping workers...")
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ export interface TestStep {
   id?: string
   instruction: string
   expected_result: string | null
+  // Screenshot policy while the agent works on this step; null follows the case
+  vision_policy?: string | null
   order: number
 }
 
@@ -14,12 +16,17 @@ export interface TestCase {
   name: string
   url: string
   created_at?: string
+  vision_policy?: string | null
   steps: TestStep[]
 }
 
+// Row of the case list, which is fetched without steps
+export type TestCaseSummary = Pick<TestCase, 'id' | 'name' | 'url' | 'created_at'>
+
 export interface TestCaseCreate {
   name: string
   url: string
+  vision_policy?: string | null
   steps: Omit<TestStep, 'id'>[]
 }
 
@@ -34,7 +41,7 @@ export interface GenerateStepsResponse {
 }
 
 export const useTestCaseStore = defineStore('testCase', () => {
-  const cases: Ref<TestCase[]> = ref([])
+  const cases: Ref<TestCaseSummary[]> = ref([])
   const currentCase: Ref<TestCase | null> = ref(null)
   const loading = ref(false)
   const error: Ref<string | null> = ref(null)
@@ -43,7 +50,8 @@ export const useTestCaseStore = defineStore('testCase', () => {
     loading.value = true
     error.value = null
     try {
-      const response = await fetch('/api/cases')
+      // The server sends an ETag with no-cache, so the browser revalidates and an unchanged list costs a 304
+      const response = await fetch('/api/cases?fields=id,name,url,created_at')
       if (!response.ok) throw new Error('Failed to fetch test cases')
       cases.value = await response.json()
     } catch (e: any) {
@@ -80,7 +88,7 @@ export const useTestCaseStore = defineStore('testCase', () => {
       })
       if (!response.ok) throw new Error('Failed to create test case')
       const newCase = await response.json()
-      cases.value.push(newCase)
+      cases.value.unshift(newCase)
       return newCase
     } catch (e: any) {
       error.value = e.message
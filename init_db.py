@@ -1,16 +1,17 @@
 import asyncio
 from tortoise import Tortoise
-from backend.app.core.database import TORTOISE_ORM
+from backend.app.core.database import init as init_schema
+from backend.app.core.run_events import migrate_legacy_logs
 
 async def init():
     print("Initializing Tortoise ORM...")
     try:
-        await Tortoise.init(config=TORTOISE_ORM)
-        print("Tortoise initialized.")
-        
-        print("Generating schemas...")
-        await Tortoise.generate_schemas()
-        print("Schema generated successfully.")
+        # Applies pending migrations from backend/migrations when database.migrate is on
+        await init_schema()
+        print("Schema is up to date.")
+
+        migrated = await migrate_legacy_logs()
+        print(f"Moved logs of {migrated} runs to run_events.")
     except Exception as e:
         print(f"An error occurred: {e}")
     finally: